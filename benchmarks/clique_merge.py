@@ -0,0 +1,129 @@
+"""
+Benchmark for building and breaking cliques of ``same_as`` links, as done by ``clique_merge``.
+
+Builds a synthetic graph of cliques of equivalent nodes, linked by ``same_as`` edges,
+where a fraction of the nodes have a category that is incompatible with the rest of their clique.
+Cliques are built and broken with
+    - ``legacy``: a networkx.Graph of links and its connected components, checking the categories
+      of each link with Biolink Model toolkit lookups (on a sample of the links)
+    - ``bitset``: a union-find of links, checking the categories of all links at once with
+      bitsets of precomputed category compatibilities
+and the links found to be invalid are checked to agree.
+
+usage: python benchmarks/clique_merge.py --nodes 1000000 --clique-size 5
+"""
+import time
+import random
+
+import click
+import networkx as nx
+
+from kgx.mapper import DisjointSet, get_invalid_links
+from kgx.utils.kgx_utils import get_toolkit
+
+PREFIXES = ['HGNC', 'NCBIGene', 'ENSEMBL', 'OMIM', 'UniProtKB']
+CATEGORIES = [['gene'], ['gene', 'gene or gene product'], ['gene or gene product', 'molecular entity'], ['Node'], []]
+CONFLICTING = [['disease'], ['chemical_substance'], ['phenotypic_feature', 'named_thing']]
+
+
+def build_graph(nodes: int, clique_size: int, conflicts: float, seed: int = 0) -> nx.MultiDiGraph:
+    """
+    Build a synthetic graph of cliques of ``clique_size`` nodes, where each node is
+    linked to the first node of its clique, and some nodes have conflicting categories.
+    """
+    random.seed(seed)
+    graph = nx.MultiDiGraph()
+    for i in range(nodes):
+        clique = i // clique_size
+        n = '{}:{}'.format(PREFIXES[i % clique_size % len(PREFIXES)], i)
+        categories = random.choice(CONFLICTING if random.random() < conflicts else CATEGORIES)
+        graph.add_node(n, id=n, category=categories)
+        if i % clique_size:
+            graph.add_edge(n, '{}:{}'.format(PREFIXES[0], clique * clique_size), edge_label='same_as')
+    return graph
+
+
+def legacy_invalid_links(graph: nx.Graph, links: list) -> list:
+    """
+    The check for invalid links of ``clique_merge``, with a toolkit lookup for each pair of categories.
+    """
+    edges = []
+    for u, v in links:
+        u_categories = graph.nodes[u].get('category', [])
+        v_categories = graph.nodes[v].get('category', [])
+        l = len(edges)
+        for a in u_categories:
+            if len(edges) > l:
+                break
+            if get_toolkit().get_element(a) is None:
+                continue
+            for b in v_categories:
+                if get_toolkit().get_element(b) is None:
+                    continue
+                a_ancestors = get_toolkit().ancestors(a)
+                b_ancestors = get_toolkit().ancestors(b)
+                if a_ancestors == b_ancestors == []:
+                    continue
+                elif a not in b_ancestors and b not in a_ancestors:
+                    edges.append((u, v))
+                    break
+    return edges
+
+
+@click.command()
+@click.option('--nodes', type=int, default=1_000_000, help='Number of nodes in the synthetic graph')
+@click.option('--clique-size', type=int, default=5, help='Number of nodes in each clique')
+@click.option('--conflicts', type=float, default=0.01, help='Fraction of nodes with a conflicting category')
+@click.option('--sample', type=int, default=20_000, help='Number of links to check with toolkit lookups')
+def main(nodes: int, clique_size: int, conflicts: float, sample: int):
+    graph = build_graph(nodes, clique_size, conflicts)
+    links = [(u, v) for u, v, data in graph.edges(data=True) if data.get('edge_label') == 'same_as']
+    click.echo('nodes: {:,}; same_as links: {:,}'.format(graph.number_of_nodes(), len(links)))
+    get_toolkit()
+
+    start = time.perf_counter()
+    clique_graph = nx.Graph()
+    clique_graph.add_edges_from(links)
+    components = list(nx.connected_components(clique_graph))
+    elapsed = time.perf_counter() - start
+    click.echo('{:>6}: {:,} cliques in {:.2f}s'.format('legacy', len(components), elapsed))
+    del clique_graph, components
+
+    start = time.perf_counter()
+    cliques = DisjointSet()
+    for u, v in links:
+        cliques.union(u, v)
+    count = sum(1 for x in cliques.sets())
+    elapsed = time.perf_counter() - start
+    click.echo('{:>6}: {:,} cliques in {:.2f}s'.format('bitset', count, elapsed))
+
+    sample_links = links[:sample]
+    start = time.perf_counter()
+    legacy = legacy_invalid_links(graph, sample_links)
+    elapsed = time.perf_counter() - start
+    click.echo('{:>6}: {:,} invalid of {:,} links in {:.2f}s ({:,.0f} links/s)'.format(
+        'legacy', len(legacy), len(sample_links), elapsed, len(sample_links) / elapsed
+    ))
+
+    start = time.perf_counter()
+    invalid = get_invalid_links(graph, cliques)
+    elapsed = time.perf_counter() - start
+    click.echo('{:>6}: {:,} invalid of {:,} links in {:.2f}s ({:,.0f} links/s)'.format(
+        'bitset', len(invalid), len(links), elapsed, len(links) / elapsed
+    ))
+
+    # links in the sample are compared irrespective of direction
+    sampled = {frozenset(x) for x in sample_links}
+    found = {frozenset(x) for x in invalid if frozenset(x) in sampled}
+    mismatches = len(found.symmetric_difference(frozenset(x) for x in legacy))
+    click.echo('mismatches: {:,}'.format(mismatches))
+
+    start = time.perf_counter()
+    cliques.remove_links(invalid)
+    count = sum(1 for x in cliques.sets())
+    elapsed = time.perf_counter() - start
+    click.echo('{:>6}: {:,} cliques after breaking {:,} links in {:.2f}s'.format('bitset', count, len(invalid), elapsed))
+
+
+if __name__ == '__main__':
+    main()
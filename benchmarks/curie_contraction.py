@@ -0,0 +1,109 @@
+"""
+Benchmark for contracting URIs to CURIEs with ``make_curie``.
+
+Parses a turtle file (by default, a synthetic turtle file with a million triples)
+and contracts the subject, predicate and object of every triple, as ``RdfTransformer`` does.
+Contraction with the prefix trie is compared against contraction with
+``prefixcommons.contract_uri`` over a sample of the URIs, and both are checked to agree.
+
+usage: python benchmarks/curie_contraction.py --triples 1000000
+"""
+import os
+import time
+import tempfile
+
+import click
+import rdflib
+from prefixcommons import contract_uri
+
+from kgx.utils.kgx_utils import cmaps, make_curie, PrefixTrie
+
+NAMESPACES = [
+    'http://purl.obolibrary.org/obo/GO_',
+    'http://purl.obolibrary.org/obo/MONDO_',
+    'http://identifiers.org/hgnc/',
+    'https://omim.org/entry/',
+    'http://www.ncbi.nlm.nih.gov/gene/',
+    'https://example.org/unknown/',
+]
+PREDICATES = [
+    'http://purl.obolibrary.org/obo/RO_0002558',
+    'http://purl.obolibrary.org/obo/RO_0002200',
+    'http://w3id.org/biolink/vocab/related_to',
+    'http://www.w3.org/2000/01/rdf-schema#subClassOf',
+]
+
+
+def write_turtle(filename: str, triples: int) -> None:
+    """
+    Write a synthetic turtle file with the given number of triples.
+    """
+    nodes = max(triples // 10, 1)
+    with open(filename, 'w') as f:
+        for i in range(triples):
+            s = i % nodes
+            o = (i // nodes * 7919 + i) % nodes
+            f.write('<{}{}> <{}> <{}{}> .\n'.format(
+                NAMESPACES[s % len(NAMESPACES)], s,
+                PREDICATES[i % len(PREDICATES)],
+                NAMESPACES[o % len(NAMESPACES)], o
+            ))
+
+
+def legacy_make_curie(uri: str) -> str:
+    """
+    ``make_curie``, as implemented with ``prefixcommons.contract_uri``.
+    """
+    curies = contract_uri(uri, cmaps=cmaps)
+    if len(curies) == 0:
+        if uri.startswith('https'):
+            uri = 'http' + uri[len('https'):]
+        elif uri.startswith('http'):
+            uri = 'https' + uri[len('http'):]
+        curies = contract_uri(uri, cmaps=cmaps)
+    if len(curies) > 0:
+        curies.sort()
+        return curies[0]
+    return uri
+
+
+@click.command()
+@click.option('--triples', type=int, default=1_000_000, help='Number of triples in the synthetic turtle file')
+@click.option('--input', 'input_file', type=click.Path(exists=True), help='Turtle file to use instead of a synthetic one')
+@click.option('--sample', type=int, default=100_000, help='Number of URIs to contract with prefixcommons.contract_uri')
+def main(triples: int, input_file: str, sample: int):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        if input_file is None:
+            input_file = os.path.join(tmpdir, 'triples.ttl')
+            write_turtle(input_file, triples)
+        start = time.perf_counter()
+        g = rdflib.Graph()
+        g.parse(input_file, format='turtle')
+        uris = [str(x) for triple in g for x in triple if isinstance(x, rdflib.URIRef)]
+        del g
+        click.echo('parsed {:,} triples from {} in {:.2f}s'.format(len(uris) // 3, input_file, time.perf_counter() - start))
+
+    distinct = len(set(uris))
+    click.echo('URIs: {:,} ({:,} distinct)'.format(len(uris), distinct))
+
+    start = time.perf_counter()
+    PrefixTrie(cmaps)
+    click.echo('{:>8}: built in {:.4f}s'.format('trie', time.perf_counter() - start))
+
+    start = time.perf_counter()
+    curies = [make_curie(x) for x in uris]
+    elapsed = time.perf_counter() - start
+    click.echo('{:>8}: {:,} URIs in {:.2f}s ({:,.0f} URIs/s)'.format('trie', len(uris), elapsed, len(uris) / elapsed))
+
+    sample = uris[:sample]
+    start = time.perf_counter()
+    legacy_curies = [legacy_make_curie(x) for x in sample]
+    elapsed = time.perf_counter() - start
+    click.echo('{:>8}: {:,} URIs in {:.2f}s ({:,.0f} URIs/s)'.format('legacy', len(sample), elapsed, len(sample) / elapsed))
+
+    mismatches = sum(1 for x, y in zip(curies, legacy_curies) if x != y)
+    click.echo('mismatches: {:,}'.format(mismatches))
+
+
+if __name__ == '__main__':
+    main()
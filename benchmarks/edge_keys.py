@@ -0,0 +1,73 @@
+"""
+Benchmark for the edge key strategies supported by ``generate_edge_key``.
+
+Builds a synthetic graph with each edge key strategy, and reports the time
+taken to add all edges, the time taken to look up every edge by its key,
+and the growth in peak memory (RSS) of the process building the graph.
+Each strategy is run in a separate process.
+
+usage: python benchmarks/edge_keys.py --edges 10000000 --graph-backend networkx
+"""
+import time
+import resource
+import multiprocessing
+
+import click
+
+from kgx import Transformer
+from kgx.utils.kgx_utils import generate_edge_key, EDGE_KEY_STRATEGIES
+
+LABELS = ['related_to', 'interacts_with', 'part_of', 'subclass_of', 'causes']
+
+
+def make_edge(i: int, nodes: int):
+    """
+    Generate a synthetic edge, as a (subject, edge_label, object) tuple.
+    Edges are unique for as long as ``i`` is less than 7919 * ``nodes``.
+    """
+    return 'X:{}'.format(i % nodes), LABELS[i % len(LABELS)], 'X:{}'.format((i // nodes * 7919 + i) % nodes)
+
+
+def run(strategy: str, edges: int, graph_backend: str, queue: multiprocessing.Queue) -> None:
+    """
+    Build a graph with the given edge key strategy and report timings and memory usage.
+    """
+    nodes = max(edges // 10, 1)
+    g = Transformer.create_graph(graph_backend)
+    start_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    for i in range(edges):
+        s, edge_label, o = make_edge(i, nodes)
+        key = generate_edge_key(s, edge_label, o, strategy)
+        g.add_edge(s, o, key, subject=s, object=o, edge_label=edge_label)
+    build = time.perf_counter() - start
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - start_rss
+
+    start = time.perf_counter()
+    for i in range(edges):
+        s, edge_label, o = make_edge(i, nodes)
+        assert g.has_edge(s, o, key=generate_edge_key(s, edge_label, o, strategy))
+    lookup = time.perf_counter() - start
+    queue.put((g.number_of_edges(), build, lookup, rss))
+
+
+@click.command()
+@click.option('--edges', type=int, default=10_000_000, help='Number of edges to add')
+@click.option('--strategy', type=click.Choice(EDGE_KEY_STRATEGIES), multiple=True, help='Edge key strategies to compare (all, by default)')
+@click.option('--graph-backend', type=click.Choice(['networkx', 'compact']), default='networkx', help='The graph backend to use')
+def main(edges: int, strategy: tuple, graph_backend: str):
+    click.echo('edges: {:,} ({} graph backend)'.format(edges, graph_backend))
+    for s in strategy or EDGE_KEY_STRATEGIES:
+        queue = multiprocessing.Queue()
+        p = multiprocessing.Process(target=run, args=(s, edges, graph_backend, queue))
+        p.start()
+        number_of_edges, build, lookup, rss = queue.get()
+        p.join()
+        # ru_maxrss is in kilobytes on Linux
+        click.echo('{:>6}: {:,} edges; build {:.2f}s ({:,.0f} edges/s); lookup {:.2f}s ({:,.0f} lookups/s); peak RSS +{:,.0f} MiB'.format(
+            s, number_of_edges, build, edges / build, lookup, edges / lookup, rss / 1024
+        ))
+
+
+if __name__ == '__main__':
+    main()
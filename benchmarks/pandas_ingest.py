@@ -0,0 +1,60 @@
+"""
+Benchmark for loading edges from a pandas.DataFrame into PandasTransformer.
+
+Compares sanitizing records one at a time, via ``PandasTransformer.load_edge``,
+with sanitizing whole columns at a time, via ``PandasTransformer.load_edges``.
+
+usage: python benchmarks/pandas_ingest.py --rows 100000
+"""
+import time
+import random
+
+import click
+import numpy as np
+import pandas as pd
+
+from kgx import PandasTransformer
+
+
+def make_edges(rows: int) -> pd.DataFrame:
+    """
+    Generate a synthetic DataFrame of edges, in the same form as read from a CSV with ``dtype=str``.
+    """
+    records = []
+    for i in range(rows):
+        records.append({
+            'subject': 'X:{}'.format(random.randint(0, rows // 10)),
+            'edge_label': 'related_to',
+            'object': 'X:{}'.format(random.randint(0, rows // 10)),
+            'relation': 'RO:0002410',
+            'publications': 'PMID:{}|PMID:{}'.format(i, i + 1),
+            'provided_by': 'benchmark',
+            'negated': 'True' if i % 10 == 0 else np.nan,
+        })
+    return pd.DataFrame.from_records(records)
+
+
+@click.command()
+@click.option('--rows', type=int, default=100_000, help='Number of edges to load')
+def main(rows: int):
+    df = make_edges(rows)
+
+    t = PandasTransformer()
+    start = time.perf_counter()
+    for obj in df.to_dict('records'):
+        t.load_edge(obj)
+    row_wise = time.perf_counter() - start
+
+    t = PandasTransformer()
+    start = time.perf_counter()
+    t.load_edges(df)
+    column_wise = time.perf_counter() - start
+
+    click.echo('rows: {:,}'.format(rows))
+    click.echo('row-wise sanitation:    {:.2f}s'.format(row_wise))
+    click.echo('column-wise sanitation: {:.2f}s'.format(column_wise))
+    click.echo('speedup: {:.2f}x'.format(row_wise / column_wise))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark for filtering triples by predicate, as done by RdfTransformer.
+
+Writes a synthetic N-Triples file with a fixed number of distinct predicates,
+and selects the triples whose predicate is one of an increasing number of
+allowed predicates, with
+    - ``legacy``: a scan over all triples of a rdflib.Graph, comparing each predicate
+      against every allowed predicate, case-insensitively
+    - ``rdflib``: a lookup of ``triples((None, p, None))`` for each allowed predicate
+    - ``stream``: streaming the file, skipping lines with other predicates before they are parsed
+
+Only the cost of selecting triples is measured; loading the selected triples is the same in all cases.
+
+usage: python benchmarks/predicate_filter.py --triples 1000000 --predicates 100
+"""
+import os
+import time
+import tempfile
+
+import click
+import rdflib
+from rdflib import URIRef
+
+from kgx.utils.rdf_utils import read_ntriples
+
+PREDICATE = 'http://purl.obolibrary.org/obo/RO_{:07d}'
+NODE = 'http://purl.obolibrary.org/obo/GO_{:07d}'
+
+
+def write_ntriples(filename: str, triples: int, predicates: int) -> None:
+    """
+    Write a synthetic N-Triples file, where predicates are used in a round-robin fashion.
+    """
+    nodes = max(triples // 10, 1)
+    with open(filename, 'w') as f:
+        for i in range(triples):
+            f.write('<{}> <{}> <{}> .\n'.format(NODE.format(i % nodes), PREDICATE.format(i % predicates), NODE.format((i // nodes * 7919 + i) % nodes)))
+
+
+def legacy(rdfgraph: rdflib.Graph, allowed: set) -> int:
+    return sum(1 for s, p, o in rdfgraph.triples((None, None, None)) if any(p.lower() == x.lower() for x in allowed))
+
+
+def pushdown(rdfgraph: rdflib.Graph, allowed: set) -> int:
+    return sum(1 for x in sorted(allowed) for t in rdfgraph.triples((None, x, None)))
+
+
+def stream(filename: str, allowed: set) -> int:
+    return sum(1 for t in read_ntriples(filename, 'nt', predicates=allowed))
+
+
+@click.command()
+@click.option('--triples', type=int, default=1_000_000, help='Number of triples in the synthetic N-Triples file')
+@click.option('--predicates', type=int, default=100, help='Number of distinct predicates in the synthetic N-Triples file')
+@click.option('--allowed', type=int, multiple=True, help='Numbers of allowed predicates to compare (1, 10, 100 and 1000, by default)')
+def main(triples: int, predicates: int, allowed: tuple):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'triples.nt')
+        write_ntriples(filename, triples, predicates)
+        rdfgraph = rdflib.Graph()
+        rdfgraph.parse(filename, format='nt')
+        click.echo('triples: {:,}; predicates: {:,}'.format(len(rdfgraph), predicates))
+        for n in allowed or [1, 10, 100, 1000]:
+            # half of the allowed predicates do not occur in the file
+            allowed_predicates = {URIRef(PREDICATE.format(i * 2)) for i in range(n)}
+            results = []
+            for name, f, source in [('legacy', legacy, rdfgraph), ('rdflib', pushdown, rdfgraph), ('stream', stream, filename)]:
+                start = time.perf_counter()
+                count = f(source, allowed_predicates)
+                elapsed = time.perf_counter() - start
+                results.append('{} {:.2f}s'.format(name, elapsed))
+            click.echo('allowed: {:>5,}; selected: {:>10,}; {}'.format(n, count, '; '.join(results)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark for parsing N-Triples with RdfTransformer.
+
+Writes a synthetic N-Triples file (optionally gzip'd) and parses it, both by
+streaming one triple at a time and by loading it into a rdflib.Graph first,
+and reports the throughput, in triples per second, and the growth in peak
+memory (RSS) of the process parsing the file. Each path is run in a separate process.
+
+usage: python benchmarks/rdf_ingest.py --triples 1000000 --gzip
+"""
+import os
+import gzip
+import time
+import resource
+import tempfile
+import multiprocessing
+
+import click
+
+from kgx import RdfTransformer
+
+GO = 'http://purl.obolibrary.org/obo/GO_'
+SUBCLASS_OF = 'http://www.w3.org/2000/01/rdf-schema#subClassOf'
+LABEL = 'http://www.w3.org/2000/01/rdf-schema#label'
+HAS_PHENOTYPE = 'http://purl.obolibrary.org/obo/RO_0002200'
+
+
+def write_ntriples(filename: str, triples: int) -> None:
+    """
+    Write a synthetic N-Triples file, with a tree of subClassOf triples rooted at
+    biological_process (GO:0008150), a label for each class, and a triple with
+    a predicate that is not loaded, for each class.
+    """
+    nodes = max(triples // 3, 1)
+    open_file = gzip.open if filename.endswith('.gz') else open
+    with open_file(filename, 'wt') as f:
+        for i in range(nodes):
+            iri = '{}{:07d}'.format(GO, 8150 + i)
+            if i > 0:
+                f.write('<{}> <{}> <{}{:07d}> .\n'.format(iri, SUBCLASS_OF, GO, 8150 + (i - 1) // 2))
+            f.write('<{}> <{}> "process {}" .\n'.format(iri, LABEL, i))
+            f.write('<{}> <{}> <{}{:07d}> .\n'.format(iri, HAS_PHENOTYPE, GO, 8150 + (i * 7919) % nodes))
+
+
+def run(filename: str, stream: bool, queue: multiprocessing.Queue) -> None:
+    """
+    Parse a file with RdfTransformer and report timings and memory usage.
+    """
+    t = RdfTransformer()
+    start_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    t.parse(filename, stream=stream)
+    elapsed = time.perf_counter() - start
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - start_rss
+    queue.put((t.graph.number_of_nodes(), t.graph.number_of_edges(), elapsed, rss))
+
+
+@click.command()
+@click.option('--triples', type=int, default=1_000_000, help='Number of triples in the synthetic N-Triples file')
+@click.option('--gzip', 'use_gzip', is_flag=True, help="Whether to gzip the synthetic N-Triples file")
+def main(triples: int, use_gzip: bool):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'triples.nt.gz' if use_gzip else 'triples.nt')
+        write_ntriples(filename, triples)
+        click.echo('triples: {:,} ({})'.format(triples, os.path.basename(filename)))
+        for name, stream in [('rdflib', False), ('stream', True)]:
+            queue = multiprocessing.Queue()
+            p = multiprocessing.Process(target=run, args=(filename, stream, queue))
+            p.start()
+            nodes, edges, elapsed, rss = queue.get()
+            p.join()
+            # ru_maxrss is in kilobytes on Linux
+            click.echo('{:>6}: {:,} nodes and {:,} edges in {:.2f}s ({:,.0f} triples/s); peak RSS +{:,.0f} MiB'.format(
+                name, nodes, edges, elapsed, triples / elapsed, rss / 1024
+            ))
+
+
+if __name__ == '__main__':
+    main()
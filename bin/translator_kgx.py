@@ -4,7 +4,6 @@ import pandas as pd
 from typing import List
 
 import networkx as nx
-from neo4jrestclient.client import GraphDatabase as http_gdb, Node, Relationship
 from collections import Counter, defaultdict, OrderedDict
 from terminaltables import AsciiTable
 from datetime import datetime
@@ -218,7 +217,7 @@ def neo4j_node_summary(config: dict, address: str, username: str, password: str,
     config: dict
         A dictionary containing the configuration for kgx.cli
     address: str
-        The full HTTP address for Neo4j database
+        The full address for Neo4j database; ``http://`` for the REST API or ``bolt://`` for the Bolt protocol
     username: str
         Username for authentication
     password: str
@@ -230,13 +229,13 @@ def neo4j_node_summary(config: dict, address: str, username: str, password: str,
     if output is not None and not is_writable(output):
         error(f'Cannot write to {output}')
 
-    http_driver = http_gdb(address, username=username, password=password)
+    neo_transformer = make_neo4j_transformer(address, username, password)
 
     query = """
     MATCH (x) RETURN DISTINCT x.category AS category
     """
 
-    records = http_driver.query(query)
+    records = neo_transformer.query(query)
     categories = set()
     for record in records:
         category = record[0]
@@ -260,7 +259,7 @@ def neo4j_node_summary(config: dict, address: str, username: str, password: str,
                 COUNT(*) AS frequency
             ORDER BY category, frequency DESC;
             """
-            records = http_driver.query(query)
+            records = neo_transformer.query(query)
             for record in records:
                 rows.append({
                     'category': record[0],
@@ -294,7 +293,7 @@ def neo4j_edge_summary(config: dict, address: str, username: str, password: str,
     config: dict
         A dictionary containing the configuration for kgx.cli
     address: str
-        The full HTTP address for Neo4j database
+        The full address for Neo4j database; ``http://`` for the REST API or ``bolt://`` for the Bolt protocol
     username: str
         Username for authentication
     password: str
@@ -306,13 +305,13 @@ def neo4j_edge_summary(config: dict, address: str, username: str, password: str,
     if output is not None and not is_writable(output):
         error(f'Cannot write to {output}')
 
-    http_driver = http_gdb(address, username=username, password=password)
+    neo_transformer = make_neo4j_transformer(address, username, password)
 
     query = """
     MATCH (x) RETURN DISTINCT x.category AS category
     """
 
-    records = http_driver.query(query)
+    records = neo_transformer.query(query)
     categories = set()
 
     for record in records:
@@ -331,11 +330,11 @@ def neo4j_edge_summary(config: dict, address: str, username: str, password: str,
     query = """
     MATCH (n)-[r]-(m)
     WHERE
-        (n.category = {category1} OR {category1} IN n.category) AND
-        (m.category = {category2} OR {category2} IN m.category)
+        (n.category = $category1 OR $category1 IN n.category) AND
+        (m.category = $category2 OR $category2 IN m.category)
     RETURN DISTINCT
-        {category1} AS subject_category,
-        {category2} AS object_category,
+        $category1 AS subject_category,
+        $category2 AS object_category,
         type(r) AS edge_type,
         split(n.id, ':')[0] AS subject_prefix,
         split(m.id, ':')[0] AS object_prefix,
@@ -348,7 +347,7 @@ def neo4j_edge_summary(config: dict, address: str, username: str, password: str,
     rows = []
     with click.progressbar(combinations, length=len(combinations)) as bar:
         for category1, category2 in bar:
-            records = http_driver.query(query, params={'category1': category2, 'category2': category2})
+            records = neo_transformer.query(query, params={'category1': category2, 'category2': category2})
             for r in records:
                 rows.append({
                     'subject_category': r[0],
@@ -369,36 +368,34 @@ def neo4j_edge_summary(config: dict, address: str, username: str, password: str,
         click.echo('Saved report to {}'.format(output))
 
 @cli.command()
-@click.argument('path', type=click.Path(exists=True))
+@click.argument('inputs', nargs=-1, type=click.Path(exists=True), required=True)
 @click.option('--output', '-o', type=click.Path(exists=False), required=True, help='The path to a text file to append the output to.')
 @click.option('--output-dir', '-d', type=click.Path(exists=False), help='The path to a directory to save a series of text files to.')
 @click.option('--format', '-f', required=False, help='The input format type')
+@click.option('--workers', type=int, default=1, help='The number of processes to parse input files with')
 @pass_config
-def validate(config: dict, path: str, output: str, output_dir: str, format: str):
+def validate(config: dict, inputs: List[str], output: str, output_dir: str, format: str, workers: int):
     """
-    Run KGX validation on an input file to check for BioLink Model compliance.
+    Run KGX validation on one or more input files to check for BioLink Model compliance.
     \f
 
     Parameters
     ----------
     config: dict
         A dictionary containing the configuration for kgx.cli
-    path: str
-        Path to input file
+    inputs: List[str]
+        A list of files that contains nodes/edges
     output: str
         Path to output file
     output_dir:
         Path to a directory
     format:
         The input format
+    workers: int
+        The number of processes to parse input files with
 
     """
-    t = None
-    if format:
-        t = get_transformer(format)()
-    else:
-        t = get_transformer(get_type(path))()
-    t.parse(path)
+    t = load_transformer(inputs, format, workers)
     validator = Validator()
     errors = validator.validate(t.graph)
     validator.write_report(errors, open(output, 'w'))
@@ -416,8 +413,9 @@ def validate(config: dict, path: str, output: str, output_dir: str, format: str)
 @click.option('--directed', type=bool, default=False, help='Whether the edges are directed')
 @click.option('--stop-after', type=int, help='Once this many edges are downloaded the application will finish')
 @click.option('--page-size', type=int, default=10_000, help='The size of pages to download for each batch')
+@click.option('--workers', type=int, default=1, help='The number of concurrent sessions to download pages with')
 @pass_config
-def neo4j_download(config: dict, address: str, username: str, password: str, output: str, output_type: str, subject_label: str, object_label: str, edge_label: str, directed: bool, page_size: int, stop_after: int):
+def neo4j_download(config: dict, address: str, username: str, password: str, output: str, output_type: str, subject_label: str, object_label: str, edge_label: str, directed: bool, page_size: int, stop_after: int, workers: int):
     """
     Download nodes and edges from Neo4j database.
     \f
@@ -427,7 +425,7 @@ def neo4j_download(config: dict, address: str, username: str, password: str, out
     config: dict
         A dictionary containing the configuration for kgx.cli
     address: str
-        The full HTTP address for Neo4j database
+        The full address for Neo4j database; ``http://`` for the REST API or ``bolt://`` for the Bolt protocol
     username: str
         Username for authentication
     password: str
@@ -448,6 +446,8 @@ def neo4j_download(config: dict, address: str, username: str, password: str, out
         The max number of edges to fetch
     page_size: int
         The page size to use while fetching associations from Neo4j (``10000``, by default)
+    workers: int
+        The number of concurrent sessions to download pages with (``1``, by default)
 
     """
     if not is_writable(output):
@@ -457,70 +457,21 @@ def neo4j_download(config: dict, address: str, username: str, password: str, out
         except:
             error(f'Cannot write to {output}')
 
-    output_transformer = get_transformer(output_type)()
-    G = output_transformer.graph
-
-    driver = http_gdb(address, username=username, password=password)
-
-    subject_label = ':`{}`'.format(subject_label) if isinstance(subject_label, str) else ''
-    object_label = ':`{}`'.format(object_label) if isinstance(object_label, str) else ''
-    edge_label = ':`{}`'.format(edge_label) if isinstance(edge_label, str) else ''
-
-    if directed:
-        query = 'match (n{})-[e{}]->(m{})'.format(subject_label, edge_label, object_label)
-    else:
-        query = 'match (n{})-[e{}]-(m{})'.format(subject_label, edge_label, object_label)
-
-    results = driver.query('{} return count(*)'.format(query))
-    size = [x[0] for x in results][0]
-    print("SIZE: {}".format(size))
-
-    if size == 0:
+    neo_transformer = make_neo4j_transformer(address, username, password)
+    if subject_label is not None:
+        neo_transformer.set_filter('subject_category', subject_label)
+    if object_label is not None:
+        neo_transformer.set_filter('object_category', object_label)
+    if edge_label is not None:
+        neo_transformer.set_filter('edge_label', edge_label)
+
+    neo_transformer.load(end=stop_after, is_directed=directed, page_size=page_size, workers=workers)
+    neo_transformer.close()
+    if neo_transformer.is_empty():
         click.echo('No records found.')
         return
 
-    click.echo('Using cypher query: {} return n, e, m'.format(query))
-
-    page_size = 1_000
-    skip_flag = False
-
-    with click.progressbar(list(range(0, size, page_size)), label='Downloading {} many edges'.format(size)) as bar:
-        for i in bar:
-            q = '{} return n, e, m skip {} limit {}'.format(query, i, page_size)
-            results = driver.query(q)
-            for n, e, m in results:
-                subject_attr = n['data']
-                object_attr = m['data']
-                edge_attr = e['data']
-
-                if 'id' not in subject_attr or 'id' not in object_attr:
-                    if not skip_flag:
-                        click.echo('Skipping records that have no id attribute')
-                        skip_flag = True
-                    continue
-
-                s = subject_attr['id']
-                o = object_attr['id']
-
-                if 'edge_label' not in edge_attr:
-                    edge_attr['edge_label'] = e['metadata']['type']
-
-                if 'category' not in subject_attr:
-                    subject_attr['category'] = n['metadata']['labels']
-
-                if 'category' not in object_attr:
-                    object_attr['category'] = m['metadata']['labels']
-
-                if s not in G:
-                    G.add_node(s, **subject_attr)
-                if o not in G:
-                    G.add_node(o, **object_attr)
-
-                G.add_edge(s, o, key=edge_attr['edge_label'], **edge_attr)
-
-            if stop_after is not None and G.number_of_edges() > stop_after:
-                break
-
+    output_transformer = get_transformer(output_type)(neo_transformer.graph)
     output_transformer.save(output, extension=output_type)
 
 
@@ -530,9 +481,12 @@ def neo4j_download(config: dict, address: str, username: str, password: str, out
 @click.option('-a', '--address', type=str, required=True)
 @click.option('-u', '--username', type=str)
 @click.option('-p', '--password', type=str)
+@click.option('--workers', type=int, default=1, help='The number of processes to parse input files with')
+@click.option('--batch-size', type=int, default=1000, help='The number of nodes, or edges, to commit in each transaction, with --use-unwind')
+@click.option('--sessions', type=int, default=1, help='The number of transactions to commit concurrently, with --use-unwind')
 @click.argument('inputs', nargs=-1, type=click.Path(exists=False), required=True)
 @pass_config
-def neo4j_upload(config: dict, address: str, username: str, password: str, inputs: List[str], input_type: str, use_unwind: bool):
+def neo4j_upload(config: dict, address: str, username: str, password: str, inputs: List[str], input_type: str, use_unwind: bool, workers: int, batch_size: int, sessions: int):
     """
     Upload a set of nodes/edges to a Neo4j database.
     \f
@@ -542,7 +496,7 @@ def neo4j_upload(config: dict, address: str, username: str, password: str, input
     config: dict
         A dictionary containing the configuration for kgx.cli
     address: str
-        The full HTTP address for Neo4j database
+        The full address for Neo4j database; ``http://`` for the REST API or ``bolt://`` for the Bolt protocol
     username: str
         Username for authentication
     password: str
@@ -554,16 +508,60 @@ def neo4j_upload(config: dict, address: str, username: str, password: str, input
     use_unwind: bool
         Whether or not to use the UNWIND cypher clause. While this is quicker,
         it requires the Neo4j database to support APOC procedures.
+    workers: int
+        The number of processes to parse input files with
+    batch_size: int
+        The number of nodes, or edges, to commit in each transaction (``1000``, by default)
+    sessions: int
+        The number of transactions to commit concurrently (``1``, by default)
 
     """
-    t = load_transformer(inputs, input_type)
+    t = load_transformer(inputs, input_type, workers)
     neo_transformer = make_neo4j_transformer(address, username, password)
     neo_transformer.graph = t.graph
 
     if use_unwind:
-        neo_transformer.save_with_unwind()
+        neo_transformer.save_with_unwind(batch_size=batch_size, workers=sessions)
     else:
         neo_transformer.save()
+    neo_transformer.close()
+
+@cli.command(name='neo4j-bulk-export')
+@click.option('--input-type', type=click.Choice(get_file_types()))
+@click.option('-o', '--output-dir', type=click.Path(exists=False), required=True, help='The directory to write the CSVs, and the import command, to')
+@click.option('--array-delimiter', type=str, default=';', help='The delimiter for values of multi-valued properties')
+@click.option('--database', type=str, default='graph.db', help='The name of the database to import into')
+@click.option('--workers', type=int, default=1, help='The number of processes to parse input files with')
+@click.argument('inputs', nargs=-1, type=click.Path(exists=False), required=True)
+@pass_config
+def neo4j_bulk_export(config: dict, inputs: List[str], input_type: str, output_dir: str, array_delimiter: str, database: str, workers: int):
+    """
+    Write a set of nodes/edges as CSVs for bulk import into a new Neo4j database, with neo4j-admin import.
+    \f
+
+    Parameters
+    ----------
+    config: dict
+        A dictionary containing the configuration for kgx.cli
+    inputs: List[str]
+        A list of files that contains nodes/edges
+    input_type: str
+        The input type
+    output_dir: str
+        The directory to write the CSVs, and the ``neo4j-admin import`` command (as ``import.sh``), to
+    array_delimiter: str
+        The delimiter for values of multi-valued properties (``;``, by default)
+    database: str
+        The name of the database to import into (``graph.db``, by default)
+    workers: int
+        The number of processes to parse input files with
+
+    """
+    t = load_transformer(inputs, input_type, workers)
+    output_transformer = kgx.PandasTransformer(t.graph)
+    output_transformer.save_neo4j_import(output_dir, array_delimiter=array_delimiter, database=database)
+    click.echo('Wrote CSVs to {}; run import.sh from within it to import them with neo4j-admin'.format(output_dir))
+
 
 @cli.command()
 @click.option('--input-type', type=click.Choice(get_file_types()))
@@ -571,9 +569,10 @@ def neo4j_upload(config: dict, address: str, username: str, password: str, input
 @click.option('--output-type', type=click.Choice(get_file_types()), required=True)
 @click.option('--mapping', type=str)
 @click.option('--preserve', is_flag=True)
+@click.option('--workers', type=int, default=1, help='The number of processes to parse input files with')
 @click.argument('inputs', nargs=-1, type=click.Path(exists=False), required=True)
 @pass_config
-def transform(config: dict, inputs: List[str], input_type: str, output: str, output_type: str, mapping: str, preserve: bool):
+def transform(config: dict, inputs: List[str], input_type: str, output: str, output_type: str, mapping: str, preserve: bool, workers: int):
     """
     Transform a Knowledge Graph from one serialization form to another.
     \f
@@ -594,10 +593,12 @@ def transform(config: dict, inputs: List[str], input_type: str, output: str, out
         A mapping file (TSV) for remapping node identifiers
     preserve: bool
         Whether to preserve old identifiers before remapping
+    workers: int
+        The number of processes to parse input files with
 
     """
     # load
-    input_transformer = load_transformer(inputs, input_type)
+    input_transformer = load_transformer(inputs, input_type, workers)
 
     if mapping is not None:
         # remap
@@ -675,9 +676,10 @@ def load_and_merge(config: dict, load_config):
             transformer.parse(target['filename'])
             transformers.append(transformer)
         elif target['type'] == 'neo4j':
-            transformer = kgx.NeoTransformer(None, target['uri'], target['username'],  target['password'])
+            transformer = kgx.NeoTransformer(None, target['uri'], target['username'],  target['password'], pool_size=target.get('pool_size'))
             # TODO: support filters
-            transformer.load()
+            transformer.load(page_size=target.get('page_size', 10_000), workers=target.get('workers', 1))
+            transformer.close()
             transformers.append(transformer)
         else:
             logging.error("type {} not yet supported for KGX load-and-merge operation.".format(target['type']))
@@ -690,7 +692,8 @@ def load_and_merge(config: dict, load_config):
         destination_transformer = get_transformer(destination['type'])()
         destination_transformer.save(destination['filename'])
     elif destination['type'] == 'neo4j':
-        destination_transformer = kgx.NeoTransformer(merged_transformer.graph, uri=destination['uri'], username=destination['username'], password=destination['password'])
-        destination_transformer.save_with_unwind()
+        destination_transformer = kgx.NeoTransformer(merged_transformer.graph, uri=destination['uri'], username=destination['username'], password=destination['password'], pool_size=destination.get('pool_size'))
+        destination_transformer.save_with_unwind(batch_size=destination.get('batch_size', 1000), workers=destination.get('workers', 1))
+        destination_transformer.close()
     else:
         logging.error("type {} not yet supported for KGX load-and-merge operation.".format(destination['type']))
@@ -6,6 +6,7 @@ from os import path
 __version__ = '0.0.1'
 
 from kgx.transformers.pandas_transformer import PandasTransformer
+from kgx.transformers.parquet_transformer import ParquetTransformer
 from kgx.transformers.nx_transformer import GraphMLTransformer
 from kgx.transformers.rdf_transformer import RdfTransformer, ObanRdfTransformer, RdfOwlTransformer
 from kgx.transformers.sparql_transformer import SparqlTransformer, RedSparqlTransformer
@@ -18,6 +19,7 @@ from .filter import Filter, FilterLocation, FilterType
 
 from .validator import Validator
 from .prefix_manager import PrefixManager
+from .compact_graph import CompactGraph
 from .mapper import map_graph, clique_merge
 from .utils.model_utils import make_valid_types
 
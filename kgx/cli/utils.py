@@ -1,5 +1,6 @@
 import logging
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Dict
 
 import kgx
 import os
@@ -16,9 +17,11 @@ _transformers = {
     'graphml': kgx.GraphMLTransformer,
     'ttl': kgx.ObanRdfTransformer,
     'json': kgx.JsonTransformer,
+    'jsonl': kgx.JsonTransformer,
     'rq': kgx.SparqlTransformer,
     'owl': kgx.RdfOwlTransformer,
-    'rsa': kgx.RsaTransformer
+    'rsa': kgx.RsaTransformer,
+    'parquet': kgx.ParquetTransformer
 }
 
 def is_writable(filepath):
@@ -52,17 +55,23 @@ class Config(object):
     def __init__(self):
         self.debug = False
 
-def load_transformer(input_paths: List[str], input_type: str = None) -> Transformer:
+def load_transformer(input_paths: List[str], input_type: str = None, workers: int = 1) -> Transformer:
     """
     Creates a transformer for the appropriate file type and parses the file to load its content.
     .. note:: All files in ``input_paths`` should be of the same type.
 
+    When ``workers`` is greater than 1, each file is parsed in a separate process and
+    the resulting nodes, edges and graph metadata are merged in the order of ``input_paths``,
+    such that the graph is the same regardless of the number of workers.
+
     Parameters
     ----------
     input_paths: List[str]
         A list of input file paths
     input_type: str
         Input file type
+    workers: int
+        The number of processes to parse files with (``1``, by default)
 
     Returns
     -------
@@ -88,12 +97,55 @@ def load_transformer(input_paths: List[str], input_type: str = None) -> Transfor
         logging.error('Inputs do not have a recognized type: ' + str(get_file_types()))
 
     t = transformer_constructor()
-    for i in input_paths:
-        t.parse(i, input_type)
+    if workers > 1 and len(input_paths) > 1 and not issubclass(transformer_constructor, kgx.PandasTransformer):
+        # RDF-based transformers resolve node attributes against the whole graph
+        # loaded thus far, which cannot be done for each file in isolation; only
+        # PandasTransformer and its subclasses parse each file on its own
+        logging.warning("{} does not support parsing files in parallel; parsing sequentially".format(transformer_constructor.__name__))
+        workers = 1
+
+    if workers > 1 and len(input_paths) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            n = len(input_paths)
+            # executor.map yields results in the order of input_paths
+            results = executor.map(_parse_file, [transformer_constructor] * n, input_paths, [input_type] * n)
+            for nodes, edges, graph_metadata in results:
+                t.graph.add_nodes_from(nodes)
+                t.graph.add_edges_from(edges)
+                t.graph_metadata.update(graph_metadata)
+    else:
+        for i in input_paths:
+            t.parse(i, input_type)
 
     t.report()
     return t
 
+def _parse_file(transformer_constructor, path: str, input_type: str) -> Tuple[List, List, Dict]:
+    """
+    Parse a single file in a worker process.
+
+    Parameters
+    ----------
+    transformer_constructor: type
+        The transformer class to parse the file with
+    path: str
+        The path to a file
+    input_type: str
+        Input file type
+
+    Returns
+    -------
+    Tuple[List, List, Dict]
+        A list of nodes, as (node, data) tuples, a list of edges, as (u, v, key, data) tuples,
+        and the graph metadata of the transformer
+
+    """
+    t = transformer_constructor()
+    t.parse(path, input_type)
+    nodes = list(t.graph.nodes(data=True))
+    edges = list(t.graph.edges(keys=True, data=True))
+    return nodes, edges, t.graph_metadata
+
 def build_transformer(path: str, input_type: str = None) -> Transformer:
     """
     Creates a transformer for the appropriate input file type.
@@ -119,7 +171,7 @@ def build_transformer(path: str, input_type: str = None) -> Transformer:
     return constructor()
 
 
-def make_neo4j_transformer(address, username, password):
+def make_neo4j_transformer(address, username, password, pool_size=None):
     o = urlparse(address)
 
     if o.password is None and password is None:
@@ -132,11 +184,13 @@ def make_neo4j_transformer(address, username, password):
     elif username is None:
         username = o.username
 
+    # credentials in the address are passed separately
+    netloc = o.hostname if o.port is None else '{}:{}'.format(o.hostname, o.port)
     return kgx.NeoTransformer(
-        host=o.hostname,
-        port=o.port,
+        uri=o._replace(netloc=netloc).geturl(),
         username=username,
-        password=password
+        password=password,
+        pool_size=pool_size
     )
 
 
@@ -0,0 +1,789 @@
+import sys
+import weakref
+from array import array
+from collections.abc import MutableMapping
+from typing import Any, Dict, Hashable, Iterator, List, Tuple
+
+import networkx as nx
+
+# flags for each edge
+_HAS_SUBJECT = 1
+_HAS_OBJECT = 2
+_REMOVED = 4
+_TUPLE_KEY = 8
+
+# edge attributes that are stored as columns of indices, rather than as values
+_VIRTUAL_EDGE_ATTRIBUTES = {'subject', 'object', 'edge_label'}
+
+# maximum number of bits used for the label index of an edge key
+_LABEL_BITS = 24
+# maximum number of bits used for a node index in an edge key
+_NODE_BITS = 40
+
+
+class _Removed(object):
+    """
+    Placeholder for a node that has been removed from a CompactGraph.
+    """
+    pass
+
+
+_REMOVED_NODE = _Removed()
+
+
+class CompactGraph(object):
+    """
+    A compact, in-memory, directed multigraph that can be used in place of
+    networkx.MultiDiGraph as the graph backend of a Transformer.
+
+    - Nodes are interned: each node identifier is mapped to an integer index
+    - Edges are stored in array-backed columns of subject index, object index
+      and ``edge_label`` index, such that the ``subject``, ``object`` and
+      ``edge_label`` properties of an edge are not stored as strings for every edge
+    - Edge keys created via ``generate_edge_key``, with either the ``string`` or
+      the ``tuple`` strategy, are not stored, but are rendered on demand
+    - All other node and edge properties are stored in sparse property columns,
+      where repeated string values share the same string object
+
+    CompactGraph exposes the subset of the networkx.MultiDiGraph API
+    used by transformers, the validator and the mapper. Node and edge attributes
+    are returned as mutable views over the property columns.
+
+    """
+
+    def __init__(self, incoming_graph_data=None, **attr):
+        self.graph = {}
+        self.graph.update(attr)
+
+        # node intern table
+        self._node_index: Dict[Hashable, int] = {}
+        self._node_names: List = []
+        self._node_props: Dict[str, Dict[int, Any]] = {}
+
+        # edge label intern table
+        self._label_index: Dict[str, int] = {}
+        self._label_names: List[str] = []
+
+        # edge columns
+        self._subjects = array('q')
+        self._objects = array('q')
+        self._edge_labels = array('q')
+        self._key_labels = array('q')
+        self._flags = array('B')
+        self._edge_props: Dict[str, Dict[int, Any]] = {}
+        self._edge_keys: Dict[int, Hashable] = {}
+
+        # edge lookup
+        self._edge_index: Dict[int, int] = {}
+        self._explicit_edge_index: Dict[Tuple[int, int, Hashable], int] = {}
+        self._out: Dict[int, array] = {}
+        self._in: Dict[int, array] = {}
+        self._number_of_edges = 0
+
+        self._node_views = weakref.WeakValueDictionary()
+        self._edge_views = weakref.WeakValueDictionary()
+
+        if incoming_graph_data is not None:
+            self.add_nodes_from(incoming_graph_data.nodes(data=True))
+            self.add_edges_from(incoming_graph_data.edges(keys=True, data=True))
+            self.graph.update(incoming_graph_data.graph)
+
+    @property
+    def name(self) -> str:
+        return self.graph.get('name', '')
+
+    @name.setter
+    def name(self, s: str) -> None:
+        self.graph['name'] = s
+
+    @property
+    def nodes(self) -> '_NodeView':
+        """
+        A view of all the nodes in the graph, that can also be called as ``nodes(data=False, default=None)``.
+        """
+        return _NodeView(self)
+
+    # networkx < 2.4 compatibility, and networkx.relabel_nodes
+    node = nodes
+    _node = nodes
+
+    @property
+    def edges(self) -> '_EdgeView':
+        """
+        A view of all the edges in the graph, that can also be called as ``edges(nbunch=None, data=False, keys=False, default=None)``.
+        """
+        return _EdgeView(self, self._out)
+
+    @property
+    def out_edges(self) -> '_EdgeView':
+        return _EdgeView(self, self._out)
+
+    @property
+    def in_edges(self) -> '_EdgeView':
+        return _EdgeView(self, self._in)
+
+    def is_multigraph(self) -> bool:
+        return True
+
+    def is_directed(self) -> bool:
+        return True
+
+    def __len__(self) -> int:
+        return len(self._node_index)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._node_index)
+
+    def __contains__(self, n) -> bool:
+        try:
+            return n in self._node_index
+        except TypeError:
+            return False
+
+    def __getitem__(self, n) -> Dict:
+        return self._adjacency(self._node_index[n])
+
+    def __str__(self) -> str:
+        return self.name
+
+    def has_node(self, n) -> bool:
+        return n in self
+
+    def number_of_nodes(self) -> int:
+        return len(self._node_index)
+
+    def order(self) -> int:
+        return len(self._node_index)
+
+    def number_of_edges(self, u=None, v=None) -> int:
+        if u is None:
+            return self._number_of_edges
+        if u not in self._node_index or v not in self._node_index:
+            return 0
+        return len(self._find_edges(self._node_index[u], self._node_index[v]))
+
+    def add_node(self, n, **attr) -> None:
+        """
+        Add a node ``n`` and update its attributes.
+        """
+        if n is None:
+            raise ValueError("None cannot be a node")
+        idx = self._node_index.get(n)
+        if idx is None:
+            idx = len(self._node_names)
+            self._node_index[n] = idx
+            self._node_names.append(n)
+        for key, value in attr.items():
+            self._set_prop(self._node_props, key, idx, value)
+
+    def add_nodes_from(self, nodes, **attr) -> None:
+        """
+        Add nodes, where each node is either a node identifier or a (node, attribute dict) tuple.
+        """
+        for n in nodes:
+            if isinstance(n, tuple) and len(n) == 2 and isinstance(n[1], (dict, MutableMapping)):
+                n, data = n
+                self.add_node(n, **attr)
+                self.add_node(n, **data)
+            else:
+                self.add_node(n, **attr)
+
+    def remove_node(self, n) -> None:
+        """
+        Remove node ``n`` and all its edges.
+        """
+        if n not in self._node_index:
+            raise nx.NetworkXError("The node {} is not in the graph.".format(n))
+        idx = self._node_index[n]
+        for e in set(self._out.get(idx, ())) | set(self._in.get(idx, ())):
+            self._remove_edge_index(e)
+        self._out.pop(idx, None)
+        self._in.pop(idx, None)
+        view = self._node_views.pop(idx, None)
+        if view is not None:
+            view._detach()
+        for column in self._node_props.values():
+            column.pop(idx, None)
+        del self._node_index[n]
+        self._node_names[idx] = _REMOVED_NODE
+
+    def remove_nodes_from(self, nodes) -> None:
+        for n in nodes:
+            if n in self._node_index:
+                self.remove_node(n)
+
+    def add_edge(self, u, v, key=None, **attr) -> Hashable:
+        """
+        Add an edge between ``u`` and ``v``, or update the attributes of an existing edge.
+
+        Returns
+        -------
+        Hashable
+            The key of the edge
+
+        """
+        s = self._node_index.get(u)
+        if s is None:
+            self.add_node(u)
+            s = self._node_index[u]
+        o = self._node_index.get(v)
+        if o is None:
+            self.add_node(v)
+            o = self._node_index[v]
+        if key is None:
+            keys = {self._render_key(e) for e in self._find_edges(s, o)}
+            key = len(keys)
+            while key in keys:
+                key += 1
+        e = self._lookup_edge(u, v, s, o, key)
+        if e is None:
+            e = self._create_edge(u, v, s, o, key)
+        for k, value in attr.items():
+            self._set_edge_attr(e, k, value)
+        return key
+
+    def add_edges_from(self, ebunch, **attr) -> List:
+        """
+        Add edges, where each edge is a (u, v), (u, v, key), (u, v, data) or (u, v, key, data) tuple.
+        """
+        keys = []
+        for edge in ebunch:
+            key = None
+            data = {}
+            if len(edge) == 4:
+                u, v, key, data = edge
+            elif len(edge) == 3:
+                u, v, d = edge
+                if isinstance(d, (dict, MutableMapping)):
+                    data = d
+                else:
+                    key = d
+            elif len(edge) == 2:
+                u, v = edge
+            else:
+                raise nx.NetworkXError("Edge tuple {} must be a 2-tuple, 3-tuple or 4-tuple.".format(edge))
+            data = dict(data)
+            data.update(attr)
+            keys.append(self.add_edge(u, v, key, **data))
+        return keys
+
+    def has_edge(self, u, v, key=None) -> bool:
+        if u not in self._node_index or v not in self._node_index:
+            return False
+        s = self._node_index[u]
+        o = self._node_index[v]
+        if key is None:
+            return len(self._find_edges(s, o)) > 0
+        return self._lookup_edge(u, v, s, o, key) is not None
+
+    def get_edge_data(self, u, v, key=None, default=None):
+        """
+        Get the attributes of the edge between ``u`` and ``v`` with the given ``key``,
+        or a dictionary of key to attributes for all edges between ``u`` and ``v`` if ``key`` is ``None``.
+        """
+        if u not in self._node_index or v not in self._node_index:
+            return default
+        s = self._node_index[u]
+        o = self._node_index[v]
+        if key is None:
+            edges = self._find_edges(s, o)
+            if not edges:
+                return default
+            return {self._render_key(e): self._edge_view(e) for e in edges}
+        e = self._lookup_edge(u, v, s, o, key)
+        if e is None:
+            return default
+        return self._edge_view(e)
+
+    def remove_edge(self, u, v, key=None) -> None:
+        """
+        Remove the edge between ``u`` and ``v`` with the given ``key``.
+        If ``key`` is ``None`` then the most recently added edge between ``u`` and ``v`` is removed.
+        """
+        e = None
+        if u in self._node_index and v in self._node_index:
+            s = self._node_index[u]
+            o = self._node_index[v]
+            if key is None:
+                edges = self._find_edges(s, o)
+                e = edges[-1] if edges else None
+            else:
+                e = self._lookup_edge(u, v, s, o, key)
+        if e is None:
+            raise nx.NetworkXError("The edge {}-{} with key {} is not in the graph.".format(u, v, key))
+        self._remove_edge_index(e)
+
+    def remove_edges_from(self, ebunch) -> None:
+        for edge in ebunch:
+            try:
+                self.remove_edge(*edge[:3])
+            except nx.NetworkXError:
+                pass
+
+    def adjacency(self) -> Iterator[Tuple[Hashable, Dict]]:
+        """
+        Iterate over (node, adjacency dict) tuples for all nodes in the graph.
+        """
+        names = self._node_names
+        for idx in range(len(names)):
+            if names[idx] is not _REMOVED_NODE:
+                yield names[idx], self._adjacency(idx)
+
+    def successors(self, n) -> Iterator:
+        return iter(self[n])
+
+    neighbors = successors
+
+    def predecessors(self, n) -> Iterator:
+        idx = self._node_index[n]
+        return iter(dict.fromkeys(self._node_names[self._subjects[e]] for e in self._in.get(idx, ())))
+
+    def copy(self) -> 'CompactGraph':
+        return CompactGraph(self)
+
+    def to_networkx(self) -> nx.MultiDiGraph:
+        """
+        Convert this graph to a networkx.MultiDiGraph.
+
+        Returns
+        -------
+        networkx.MultiDiGraph
+            A networkx.MultiDiGraph with the same nodes, edges and attributes
+
+        """
+        g = nx.MultiDiGraph()
+        g.graph.update(self.graph)
+        g.add_nodes_from((n, dict(data)) for n, data in self.nodes(data=True))
+        g.add_edges_from((u, v, k, dict(data)) for u, v, k, data in self.edges(keys=True, data=True))
+        return g
+
+    def _adjacency(self, idx: int) -> Dict:
+        adj = {}
+        for e in self._out.get(idx, ()):
+            v = self._node_names[self._objects[e]]
+            adj.setdefault(v, {})[self._render_key(e)] = self._edge_view(e)
+        return adj
+
+    def _label(self, label: str) -> int:
+        idx = self._label_index.get(label)
+        if idx is None:
+            idx = len(self._label_names)
+            label = sys.intern(label)
+            self._label_index[label] = idx
+            self._label_names.append(label)
+        return idx
+
+    def _key_label(self, u, v, key) -> Tuple[str, int]:
+        """
+        Get the label of a key generated by ``generate_edge_key``, either of the
+        form ``{u}-{label}-{v}`` (``string`` strategy) or ``(u, label, v)`` (``tuple`` strategy),
+        along with the form of the key. Returns ``(None, 0)`` if the key is of neither form.
+        """
+        if isinstance(key, tuple):
+            if len(key) == 3 and isinstance(key[1], str) and key[0] == u and key[2] == v:
+                return key[1], _TUPLE_KEY
+            return None, 0
+        if not isinstance(key, str) or not isinstance(u, str) or not isinstance(v, str):
+            return None, 0
+        if len(key) < len(u) + len(v) + 2:
+            return None, 0
+        if key.startswith(u + '-') and key.endswith('-' + v):
+            return key[len(u) + 1:len(key) - len(v) - 1], 0
+        return None, 0
+
+    @staticmethod
+    def _pack(s: int, o: int, label: int, form: int) -> int:
+        return (((((s << _NODE_BITS) | o) << _LABEL_BITS) | label) << 1) | bool(form)
+
+    def _lookup_edge(self, u, v, s: int, o: int, key) -> int:
+        label, form = self._key_label(u, v, key)
+        if label is not None:
+            label_idx = self._label_index.get(label)
+            if label_idx is None or label_idx >= 1 << _LABEL_BITS:
+                return self._explicit_edge_index.get((s, o, key))
+            return self._edge_index.get(self._pack(s, o, label_idx, form))
+        return self._explicit_edge_index.get((s, o, key))
+
+    def _find_edges(self, s: int, o: int) -> List[int]:
+        return [e for e in self._out.get(s, ()) if self._objects[e] == o]
+
+    def _create_edge(self, u, v, s: int, o: int, key) -> int:
+        e = len(self._subjects)
+        self._subjects.append(s)
+        self._objects.append(o)
+        self._edge_labels.append(-1)
+        label, form = self._key_label(u, v, key)
+        label_idx = self._label(label) if label is not None else -1
+        if 0 <= label_idx < 1 << _LABEL_BITS:
+            self._flags.append(form)
+            self._key_labels.append(label_idx)
+            self._edge_index[self._pack(s, o, label_idx, form)] = e
+        else:
+            self._flags.append(0)
+            self._key_labels.append(-1)
+            self._edge_keys[e] = key
+            self._explicit_edge_index[(s, o, key)] = e
+        self._out.setdefault(s, array('q')).append(e)
+        self._in.setdefault(o, array('q')).append(e)
+        self._number_of_edges += 1
+        return e
+
+    def _remove_edge_index(self, e: int) -> None:
+        s = self._subjects[e]
+        o = self._objects[e]
+        view = self._edge_views.pop(e, None)
+        if view is not None:
+            view._detach()
+        label_idx = self._key_labels[e]
+        if label_idx >= 0:
+            del self._edge_index[self._pack(s, o, label_idx, self._flags[e] & _TUPLE_KEY)]
+        else:
+            del self._explicit_edge_index[(s, o, self._edge_keys.pop(e))]
+        self._out[s].remove(e)
+        self._in[o].remove(e)
+        for column in self._edge_props.values():
+            column.pop(e, None)
+        self._edge_labels[e] = -1
+        self._flags[e] = _REMOVED
+        self._number_of_edges -= 1
+
+    def _render_key(self, e: int) -> Hashable:
+        label_idx = self._key_labels[e]
+        if label_idx >= 0 and self._flags[e] & _TUPLE_KEY:
+            return self._node_names[self._subjects[e]], self._label_names[label_idx], self._node_names[self._objects[e]]
+        elif label_idx >= 0:
+            return '{}-{}-{}'.format(self._node_names[self._subjects[e]], self._label_names[label_idx], self._node_names[self._objects[e]])
+        return self._edge_keys[e]
+
+    def _node_view(self, idx: int) -> '_NodeAttributes':
+        view = self._node_views.get(idx)
+        if view is None:
+            view = _NodeAttributes(self, idx)
+            self._node_views[idx] = view
+        return view
+
+    def _edge_view(self, e: int) -> '_EdgeAttributes':
+        view = self._edge_views.get(e)
+        if view is None:
+            view = _EdgeAttributes(self, e)
+            self._edge_views[e] = view
+        return view
+
+    @staticmethod
+    def _set_prop(columns: Dict[str, Dict[int, Any]], key: str, idx: int, value: Any) -> None:
+        if type(value) is str:
+            value = sys.intern(value)
+        elif type(value) is list:
+            for i, x in enumerate(value):
+                if type(x) is str:
+                    value[i] = sys.intern(x)
+        column = columns.get(key)
+        if column is None:
+            column = columns[key] = {}
+        column[idx] = value
+
+    def _get_edge_attr(self, e: int, key: str) -> Any:
+        if key == 'subject':
+            if not self._flags[e] & _HAS_SUBJECT:
+                raise KeyError(key)
+            return self._edge_props.get(key, {}).get(e, self._node_names[self._subjects[e]])
+        elif key == 'object':
+            if not self._flags[e] & _HAS_OBJECT:
+                raise KeyError(key)
+            return self._edge_props.get(key, {}).get(e, self._node_names[self._objects[e]])
+        elif key == 'edge_label' and self._edge_labels[e] >= 0:
+            return self._label_names[self._edge_labels[e]]
+        return self._edge_props[key][e]
+
+    def _set_edge_attr(self, e: int, key: str, value: Any) -> None:
+        if key not in _VIRTUAL_EDGE_ATTRIBUTES:
+            self._set_prop(self._edge_props, key, e, value)
+        elif key in ('subject', 'object'):
+            flag, endpoint = (_HAS_SUBJECT, self._subjects[e]) if key == 'subject' else (_HAS_OBJECT, self._objects[e])
+            self._flags[e] |= flag
+            # the column is created even if empty, to keep the order of attributes
+            column = self._edge_props.setdefault(key, {})
+            if value == self._node_names[endpoint]:
+                column.pop(e, None)
+            else:
+                self._set_prop(self._edge_props, key, e, value)
+        elif key == 'edge_label' and isinstance(value, str):
+            self._edge_labels[e] = self._label(value)
+            self._edge_props.setdefault(key, {}).pop(e, None)
+        else:
+            if key == 'edge_label':
+                self._edge_labels[e] = -1
+            self._set_prop(self._edge_props, key, e, value)
+
+    def _del_edge_attr(self, e: int, key: str) -> None:
+        self._get_edge_attr(e, key)
+        if key == 'subject':
+            self._flags[e] &= ~_HAS_SUBJECT
+        elif key == 'object':
+            self._flags[e] &= ~_HAS_OBJECT
+        elif key == 'edge_label' and self._edge_labels[e] >= 0:
+            self._edge_labels[e] = -1
+            return
+        self._edge_props.get(key, {}).pop(e, None)
+
+    def _edge_attr_keys(self, e: int) -> List[str]:
+        keys = []
+        flags = self._flags[e]
+        for k, column in self._edge_props.items():
+            if k == 'subject':
+                if flags & _HAS_SUBJECT:
+                    keys.append(k)
+            elif k == 'object':
+                if flags & _HAS_OBJECT:
+                    keys.append(k)
+            elif e in column or k == 'edge_label' and self._edge_labels[e] >= 0:
+                keys.append(k)
+        return keys
+
+
+class _Attributes(MutableMapping):
+    """
+    A mutable view over the attributes of a node or an edge in a CompactGraph.
+
+    Once the node or edge is removed from the graph, the view is detached
+    and holds a copy of the attributes, just like the attribute dict of
+    a node or an edge removed from a networkx.MultiDiGraph.
+    """
+
+    __slots__ = ('_graph', '_idx', '_data', '__weakref__')
+
+    def __init__(self, graph: CompactGraph, idx: int):
+        self._graph = graph
+        self._idx = idx
+        self._data = None
+
+    def _detach(self) -> None:
+        self._data = dict(self.items())
+        self._graph = None
+
+    def copy(self) -> Dict:
+        return dict(self.items())
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+class _NodeAttributes(_Attributes):
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if self._data is not None:
+            return self._data[key]
+        return self._graph._node_props[key][self._idx]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if self._data is not None:
+            self._data[key] = value
+        else:
+            self._graph._set_prop(self._graph._node_props, key, self._idx, value)
+
+    def __delitem__(self, key: str) -> None:
+        if self._data is not None:
+            del self._data[key]
+        else:
+            del self._graph._node_props[key][self._idx]
+
+    def __iter__(self) -> Iterator[str]:
+        if self._data is not None:
+            return iter(self._data)
+        idx = self._idx
+        return iter([k for k, column in self._graph._node_props.items() if idx in column])
+
+
+class _EdgeAttributes(_Attributes):
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if self._data is not None:
+            return self._data[key]
+        try:
+            return self._graph._get_edge_attr(self._idx, key)
+        except KeyError:
+            raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if self._data is not None:
+            self._data[key] = value
+        else:
+            self._graph._set_edge_attr(self._idx, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if self._data is not None:
+            del self._data[key]
+        else:
+            self._graph._del_edge_attr(self._idx, key)
+
+    def __iter__(self) -> Iterator[str]:
+        if self._data is not None:
+            return iter(self._data)
+        return iter(self._graph._edge_attr_keys(self._idx))
+
+
+class _NodeView(MutableMapping):
+    """
+    A view of the nodes in a CompactGraph, similar to networkx.classes.reportviews.NodeView
+    """
+
+    __slots__ = ('_graph',)
+
+    def __init__(self, graph: CompactGraph):
+        self._graph = graph
+
+    def __call__(self, data=False, default=None):
+        if data is False:
+            return self
+        return _NodeDataView(self._graph, data, default)
+
+    def data(self, data=True, default=None):
+        return _NodeDataView(self._graph, data, default)
+
+    def __getitem__(self, n) -> _NodeAttributes:
+        return self._graph._node_view(self._graph._node_index[n])
+
+    def __setitem__(self, n, data: Dict) -> None:
+        if n in self._graph._node_index:
+            attributes = self[n]
+            for key in list(attributes.keys()):
+                del attributes[key]
+        self._graph.add_node(n, **data)
+
+    def __delitem__(self, n) -> None:
+        self._graph.remove_node(n)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._graph._node_index)
+
+    def __len__(self) -> int:
+        return len(self._graph._node_index)
+
+    def __contains__(self, n) -> bool:
+        return n in self._graph
+
+    def __repr__(self) -> str:
+        return 'NodeView({})'.format(tuple(self))
+
+
+class _NodeDataView(object):
+    """
+    A view of the nodes in a CompactGraph along with their attributes
+    """
+
+    __slots__ = ('_graph', '_data', '_default')
+
+    def __init__(self, graph: CompactGraph, data, default):
+        self._graph = graph
+        self._data = data
+        self._default = default
+
+    def __len__(self) -> int:
+        return len(self._graph._node_index)
+
+    def __iter__(self) -> Iterator[Tuple]:
+        graph = self._graph
+        names = graph._node_names
+        for idx in range(len(names)):
+            n = names[idx]
+            if n is _REMOVED_NODE:
+                continue
+            attributes = graph._node_view(idx)
+            if self._data is True:
+                yield n, attributes
+            else:
+                yield n, attributes.get(self._data, self._default)
+
+
+class _EdgeView(object):
+    """
+    A view of the edges in a CompactGraph, similar to networkx.classes.reportviews.OutMultiEdgeView
+    """
+
+    __slots__ = ('_graph', '_adjacency')
+
+    def __init__(self, graph: CompactGraph, adjacency: Dict[int, array]):
+        self._graph = graph
+        self._adjacency = adjacency
+
+    def __call__(self, nbunch=None, data=False, keys=False, default=None) -> '_EdgeDataView':
+        return _EdgeDataView(self._graph, self._adjacency, nbunch, data, keys, default)
+
+    def data(self, data=True, keys=False, default=None, nbunch=None) -> '_EdgeDataView':
+        return _EdgeDataView(self._graph, self._adjacency, nbunch, data, keys, default)
+
+    def __getitem__(self, edge: Tuple) -> _EdgeAttributes:
+        u, v, key = edge
+        data = self._graph.get_edge_data(u, v, key)
+        if data is None:
+            raise KeyError(edge)
+        return data
+
+    def __iter__(self) -> Iterator[Tuple]:
+        return iter(_EdgeDataView(self._graph, self._adjacency, None, False, True, None))
+
+    def __len__(self) -> int:
+        return self._graph._number_of_edges
+
+    def __contains__(self, edge: Tuple) -> bool:
+        return self._graph.has_edge(*edge)
+
+
+class _EdgeDataView(object):
+    """
+    A view of the edges in a CompactGraph, optionally with their keys and attributes
+    """
+
+    __slots__ = ('_graph', '_adjacency', '_nbunch', '_data', '_keys', '_default')
+
+    def __init__(self, graph: CompactGraph, adjacency: Dict[int, array], nbunch, data, keys, default):
+        self._graph = graph
+        self._adjacency = adjacency
+        if nbunch is not None:
+            if nbunch in graph:
+                nbunch = [nbunch]
+            nbunch = [graph._node_index[n] for n in nbunch if n in graph]
+        self._nbunch = nbunch
+        self._data = data
+        self._keys = keys
+        self._default = default
+
+    def _edges(self) -> List[int]:
+        if self._nbunch is None:
+            flags = self._graph._flags
+            return (e for e in range(len(flags)) if not flags[e] & _REMOVED)
+        edges = []
+        for idx in self._nbunch:
+            edges.extend(self._adjacency.get(idx, ()))
+        return edges
+
+    def __len__(self) -> int:
+        if self._nbunch is None:
+            return self._graph._number_of_edges
+        return sum(len(self._adjacency.get(idx, ())) for idx in self._nbunch)
+
+    def __iter__(self) -> Iterator[Tuple]:
+        graph = self._graph
+        names = graph._node_names
+        for e in self._edges():
+            if graph._flags[e] & _REMOVED:
+                continue
+            edge = (names[graph._subjects[e]], names[graph._objects[e]])
+            if self._keys:
+                edge += (graph._render_key(e),)
+            if self._data is True:
+                edge += (graph._edge_view(e),)
+            elif self._data is not False:
+                edge += (graph._edge_view(e).get(self._data, self._default),)
+            yield edge
+
+    def __contains__(self, edge: Tuple) -> bool:
+        return edge in list(self)
+
+    def __repr__(self) -> str:
+        return 'EdgeDataView({})'.format(list(self))
@@ -1,7 +1,10 @@
 import click
 import logging
 import pandas
-from typing import Union, List, Dict
+import numpy as np
+from array import array
+from functools import lru_cache
+from typing import Union, List, Dict, Hashable, Iterable, Tuple, Generator, Optional, FrozenSet
 
 import networkx as nx
 from prefixcommons.curie_util import expand_uri
@@ -241,6 +244,361 @@ def update(d:dict, key, value):
     else:
         d[key] = value
 
+class DisjointSet(object):
+    """
+    A disjoint-set forest (union-find) over interned elements, with union by size and path compression.
+
+    Elements are interned to consecutive integer ids, and parents, sizes and links are
+    kept in compact arrays of integers, rather than as a graph of Python objects.
+    Links between elements are kept such that links can be removed, in which case
+    only the sets that contained the removed links are recomputed. The members of each set,
+    and the links of each element, are indexed such that removing links only touches
+    the members and links of the sets that contained them.
+    """
+
+    def __init__(self):
+        self.ids = {}
+        self.elements = []
+        self.parent = array('q')
+        self.size = array('q')
+        # the ids of linked elements, as consecutive pairs, where removed links are replaced by (-1, -1)
+        self.links = array('q')
+        # the ids of the members of each root, for roots of sets with more than one element
+        self.members = {}
+        # the indices of the links of each element, for elements with links
+        self.incident = {}
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def add(self, x: Hashable) -> int:
+        """
+        Add an element, as a set of its own, if it has not been added yet.
+
+        Parameters
+        ----------
+        x: Hashable
+            The element
+
+        Returns
+        -------
+        int
+            The id of the element
+
+        """
+        i = self.ids.get(x)
+        if i is None:
+            i = len(self.elements)
+            self.ids[x] = i
+            self.elements.append(x)
+            self.parent.append(i)
+            self.size.append(1)
+        return i
+
+    def find(self, i: int) -> int:
+        """
+        Find the id of the root of the set containing the element with id ``i``,
+        halving the path to the root along the way.
+        """
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def _union(self, i: int, j: int) -> None:
+        i = self.find(i)
+        j = self.find(j)
+        if i == j:
+            return
+        if self.size[i] < self.size[j]:
+            i, j = j, i
+        self.parent[j] = i
+        self.size[i] += self.size[j]
+        # merge the members of the smaller set into those of the larger set
+        self.members.setdefault(i, [i]).extend(self.members.pop(j, [j]))
+
+    def union(self, x: Hashable, y: Hashable) -> None:
+        """
+        Link two elements, merging the sets containing them.
+
+        Parameters
+        ----------
+        x: Hashable
+            An element
+        y: Hashable
+            Another element
+
+        """
+        i = self.add(x)
+        j = self.add(y)
+        k = len(self.links) >> 1
+        self.links.append(i)
+        self.links.append(j)
+        self.incident.setdefault(i, []).append(k)
+        if i != j:
+            self.incident.setdefault(j, []).append(k)
+        self._union(i, j)
+
+    def _link_keys(self) -> np.ndarray:
+        """
+        Get the distinct links, irrespective of direction, as sorted keys of the form ``min(i, j) << 32 | max(i, j)``.
+        """
+        pairs = np.frombuffer(self.links, dtype=np.int64).reshape(-1, 2)
+        pairs = pairs[pairs[:, 0] >= 0]
+        return np.unique(pairs.min(axis=1) << 32 | pairs.max(axis=1))
+
+    def get_link_ids(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the distinct links between elements, irrespective of direction, as ids.
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray]
+            The ids of the elements at either end of each link
+
+        """
+        keys = self._link_keys()
+        return keys >> 32, keys & 0xFFFFFFFF
+
+    def get_links(self) -> Generator[Tuple[Hashable, Hashable], None, None]:
+        """
+        Get the distinct links between elements, irrespective of direction.
+
+        Returns
+        -------
+        Generator[Tuple[Hashable, Hashable], None, None]
+            A generator of pairs of linked elements
+
+        """
+        for key in self._link_keys().tolist():
+            yield self.elements[key >> 32], self.elements[key & 0xFFFFFFFF]
+
+    def count_links(self) -> int:
+        """
+        Get the number of distinct links between elements, irrespective of direction.
+        """
+        return len(self._link_keys())
+
+    def remove_links(self, links: Iterable[Tuple[Hashable, Hashable]]) -> None:
+        """
+        Remove links between elements, in either direction, and split the sets that contained them.
+
+        Only the members of the sets that contained removed links are reset,
+        and rebuilt from their remaining links.
+
+        Parameters
+        ----------
+        links: Iterable[Tuple[Hashable, Hashable]]
+            Pairs of linked elements
+
+        """
+        pairs = self.links
+        incident = self.incident
+        affected = set()
+        for x, y in links:
+            i = self.ids[x]
+            j = self.ids[y]
+            for k in incident.get(i, ()):
+                a = pairs[2 * k]
+                b = pairs[2 * k + 1]
+                if (a == i and b == j) or (a == j and b == i):
+                    pairs[2 * k] = -1
+                    pairs[2 * k + 1] = -1
+                    affected.add(self.find(i))
+        for root in affected:
+            members = self.members.pop(root, [root])
+            for i in members:
+                self.parent[i] = i
+                self.size[i] = 1
+            for i in members:
+                if i in incident:
+                    incident[i] = [k for k in incident[i] if pairs[2 * k] >= 0]
+            for i in members:
+                for k in incident.get(i, ()):
+                    # each link is in the incident links of both of its elements, but is only needed once
+                    if pairs[2 * k] == i:
+                        self._union(i, pairs[2 * k + 1])
+
+    def sets(self) -> Generator[List[Hashable], None, None]:
+        """
+        Get the disjoint sets of elements.
+
+        Returns
+        -------
+        Generator[List[Hashable], None, None]
+            A generator of lists of elements, one list for each set
+
+        """
+        members = {}
+        for i in range(len(self.elements)):
+            members.setdefault(self.find(i), []).append(i)
+        for ids in members.values():
+            yield [self.elements[i] for i in ids]
+
+
+@lru_cache(maxsize=None)
+def get_category_ancestors(toolkit, category: str) -> Optional[FrozenSet[str]]:
+    """
+    Get the ancestors of a category in the Biolink Model of ``toolkit``, memoized for each toolkit and category.
+
+    Parameters
+    ----------
+    toolkit: bmt.Toolkit
+        An instance of bmt.Toolkit
+    category: str
+        The category
+
+    Returns
+    -------
+    Optional[FrozenSet[str]]
+        The ancestors of the category, or ``None`` if the category is not in the Biolink Model
+
+    """
+    if toolkit.get_element(category) is None:
+        return None
+    return frozenset(toolkit.ancestors(category))
+
+
+class CategoryCompatibility(object):
+    """
+    Pairwise compatibility of categories, for breaking invalid cliques.
+
+    Two categories are incompatible if both are in the Biolink Model, at least one of them
+    has ancestors, and neither is an ancestor of the other. Each category is a bit, and each
+    category has a bitset of the categories it is incompatible with, such that checking
+    whether two sets of categories are compatible is a single bitwise operation.
+
+    Parameters
+    ----------
+    categories: Iterable[str]
+        The categories to compare
+    toolkit: bmt.Toolkit
+        An instance of bmt.Toolkit (``get_toolkit()``, by default)
+
+    """
+
+    def __init__(self, categories: Iterable[str], toolkit=None):
+        if toolkit is None:
+            toolkit = get_toolkit()
+        self.categories = list(dict.fromkeys(categories))
+        self.index = {c: i for i, c in enumerate(self.categories)}
+        ancestors = [get_category_ancestors(toolkit, c) for c in self.categories]
+        self.incompatible = [0] * len(self.categories)
+        for i, a in enumerate(self.categories):
+            for j in range(i, len(self.categories)):
+                b = self.categories[j]
+                if CategoryCompatibility.is_incompatible(a, ancestors[i], b, ancestors[j]):
+                    self.incompatible[i] |= 1 << j
+                    self.incompatible[j] |= 1 << i
+        self.words = max((len(self.categories) + 63) // 64, 1)
+
+    @staticmethod
+    def is_incompatible(a: str, a_ancestors: Optional[FrozenSet[str]], b: str, b_ancestors: Optional[FrozenSet[str]]) -> bool:
+        if a_ancestors is None or b_ancestors is None:
+            return False
+        if not a_ancestors and not b_ancestors:
+            return False
+        return a not in b_ancestors and b not in a_ancestors
+
+    def get_bits(self, categories: Iterable[str]) -> Tuple[int, int]:
+        """
+        Get the bitset of a set of categories, and the bitset of the categories they are incompatible with.
+
+        Parameters
+        ----------
+        categories: Iterable[str]
+            The categories
+
+        Returns
+        -------
+        Tuple[int, int]
+            The bitset of ``categories``, and the bitset of categories incompatible with any of ``categories``
+
+        """
+        bits = 0
+        incompatible = 0
+        for c in categories:
+            i = self.index[c]
+            bits |= 1 << i
+            incompatible |= self.incompatible[i]
+        return bits, incompatible
+
+    def to_words(self, bits: int) -> List[int]:
+        return [(bits >> (64 * w)) & 0xFFFFFFFFFFFFFFFF for w in range(self.words)]
+
+    def find_incompatible(self, category_sets: List[Tuple[str, ...]], u: np.ndarray, v: np.ndarray, chunk_size: int = 1 << 20) -> np.ndarray:
+        """
+        Check, for each pair of sets of categories, whether any of their categories are incompatible.
+
+        Parameters
+        ----------
+        category_sets: List[Tuple[str, ...]]
+            The distinct sets of categories
+        u: numpy.ndarray
+            The indices, in ``category_sets``, of one side of each pair
+        v: numpy.ndarray
+            The indices, in ``category_sets``, of the other side of each pair
+        chunk_size: int
+            The number of pairs to check at a time, bounding the size of intermediate arrays
+
+        Returns
+        -------
+        numpy.ndarray
+            A boolean array, that is ``True`` for each pair that is incompatible
+
+        """
+        bits = np.zeros((len(category_sets), self.words), dtype=np.uint64)
+        incompatible = np.zeros((len(category_sets), self.words), dtype=np.uint64)
+        for i, categories in enumerate(category_sets):
+            b, inc = self.get_bits(categories)
+            bits[i] = self.to_words(b)
+            incompatible[i] = self.to_words(inc)
+        result = np.zeros(len(u), dtype=bool)
+        for start in range(0, len(u), chunk_size):
+            end = start + chunk_size
+            result[start:end] = (incompatible[u[start:end]] & bits[v[start:end]]).any(axis=1)
+        return result
+
+
+def get_invalid_links(graph: nx.Graph, cliques: DisjointSet) -> List[Tuple[Hashable, Hashable]]:
+    """
+    Get the links of cliques between nodes with incompatible categories.
+
+    Nodes are grouped by their categories, and the compatibility of each link is checked
+    with a bitwise operation on the categories of either node, across all links at once.
+    Elements of cliques that are not nodes of ``graph`` are compatible with any node.
+
+    Parameters
+    ----------
+    graph: networkx.Graph
+        The graph containing the nodes of the cliques
+    cliques: DisjointSet
+        The cliques
+
+    Returns
+    -------
+    List[Tuple[Hashable, Hashable]]
+        The pairs of nodes whose links are invalid
+
+    """
+    category_sets = {(): 0}
+    set_ids = array('q')
+    nodes = graph.nodes
+    for n in cliques.elements:
+        if n in nodes:
+            categories = tuple(nodes[n].get('category', []))
+            set_ids.append(category_sets.setdefault(categories, len(category_sets)))
+        else:
+            set_ids.append(0)
+    set_ids = np.frombuffer(set_ids, dtype=np.int64)
+    category_sets = list(category_sets.keys())
+    compatibility = CategoryCompatibility(c for categories in category_sets for c in categories)
+    u, v = cliques.get_link_ids()
+    invalid = compatibility.find_incompatible(category_sets, set_ids[u], set_ids[v])
+    return [(cliques.elements[i], cliques.elements[j]) for i, j in zip(u[invalid].tolist(), v[invalid].tolist())]
+
+
 def build_clique_graph(graph:nx.Graph) -> nx.Graph:
     """
     Builds a graph induced by `same_as` relationships.
@@ -269,54 +627,36 @@ def clique_merge(graph:nx.Graph, report=False) -> nx.Graph:
 
     This method will also expand the `same_as` attribute of the nodes to
     include the discovered clique.
+
+    Cliques are computed with a union-find over interned node ids, and links
+    that join nodes of incompatible categories are removed by recomputing only
+    the cliques that contain them. The categories of the nodes of all links are
+    checked at once, with bitsets of precomputed category compatibilities.
     """
     original_size = len(graph)
     print('original graph has {} nodes'.format(original_size))
 
-    cliqueGraph = nx.Graph()
+    cliques = DisjointSet()
 
     with click.progressbar(graph.nodes(data=True), label='building cliques from same_as node property') as bar:
         for n, attr_dict in bar:
             if 'same_as' in attr_dict:
                 for m in attr_dict['same_as']:
-                    cliqueGraph.add_edge(n, m)
+                    cliques.union(n, m)
 
     with click.progressbar(graph.edges(data=True), label='building cliques from same_as edges') as bar:
         for u, v, attr_dict in bar:
             if 'edge_label' in attr_dict and attr_dict['edge_label'] == 'same_as':
-                cliqueGraph.add_edge(u, v)
+                cliques.union(u, v)
 
-    edges = []
-    with click.progressbar(cliqueGraph.edges(), label='Breaking invalid cliques') as bar:
-        for u, v in bar:
-            try:
-                u_categories = graph.nodes[u].get('category', [])
-                v_categories = graph.nodes[v].get('category', [])
-            except:
-                continue
-            l = len(edges)
-            for a in u_categories:
-                if len(edges) > l:
-                    break
-                if get_toolkit().get_element(a) is None:
-                    continue
-                for b in v_categories:
-                    if get_toolkit().get_element(b) is None:
-                        continue
-                    a_ancestors = get_toolkit().ancestors(a)
-                    b_ancestors = get_toolkit().ancestors(b)
-                    if a_ancestors == b_ancestors == []:
-                        continue
-                    elif a not in b_ancestors and b not in a_ancestors:
-                        edges.append((u, v))
-                        break
+    edges = get_invalid_links(graph, cliques)
 
     print('breaking {} many edges'.format(len(edges)))
-    cliqueGraph.remove_edges_from(edges)
+    cliques.remove_links(edges)
 
     mapping = {}
 
-    connected_components = list(nx.connected_components(cliqueGraph))
+    connected_components = list(cliques.sets())
 
     print('Discovered {} cliques'.format(len(connected_components)))
 
@@ -4,7 +4,7 @@ from typing import Optional, Tuple
 import networkx as nx
 import stringcase
 
-from kgx.utils.kgx_utils import generate_edge_key, get_toolkit, snakecase_to_sentencecase, sentencecase_to_snakecase
+from kgx.utils.kgx_utils import generate_edge_key, get_edge_key_strategy, get_toolkit, snakecase_to_sentencecase, sentencecase_to_snakecase
 
 SAME_AS = 'same_as'
 LEADER_ANNOTATION = 'clique_leader'
@@ -339,51 +339,49 @@ class CliqueMerge(object):
             for node in clique:
                 if node == leader:
                     continue
-                in_edges = self.target_graph.in_edges(node, True)
-                filtered_in_edges = [x for x in in_edges if x[2]['edge_label'] != SAME_AS]
+                in_edges = self.target_graph.in_edges(node, keys=True, data=True)
+                filtered_in_edges = [x for x in in_edges if x[3]['edge_label'] != SAME_AS]
                 print("IN EDGES: {}".format(filtered_in_edges))
-                equiv_in_edges = [x for x in in_edges if x[2]['edge_label'] == SAME_AS]
+                equiv_in_edges = [x for x in in_edges if x[3]['edge_label'] == SAME_AS]
                 logging.debug("Moving {} in-edges from {} to {}".format(len(in_edges), node, leader))
-                for u, v, edge_data in filtered_in_edges:
-                    key = generate_edge_key(u, edge_data['edge_label'], v)
+                for u, v, key, edge_data in filtered_in_edges:
                     self.target_graph.remove_edge(u, v, key=key)
                     edge_data['_original_subject'] = edge_data['subject']
                     edge_data['_original_object'] = edge_data['object']
                     edge_data['object'] = leader
-                    key = generate_edge_key(u, edge_data['edge_label'], leader)
+                    key = generate_edge_key(u, edge_data['edge_label'], leader, get_edge_key_strategy(u, v, key, edge_data['edge_label']))
                     self.target_graph.add_edge(edge_data['subject'], edge_data['object'], key, **edge_data)
 
-                out_edges = self.target_graph.out_edges(node, True)
-                filtered_out_edges = [x for x in out_edges if x[2]['edge_label'] != SAME_AS]
-                equiv_out_edges = [x for x in out_edges if x[2]['edge_label'] == SAME_AS]
+                out_edges = self.target_graph.out_edges(node, keys=True, data=True)
+                filtered_out_edges = [x for x in out_edges if x[3]['edge_label'] != SAME_AS]
+                equiv_out_edges = [x for x in out_edges if x[3]['edge_label'] == SAME_AS]
                 logging.debug("Moving {} out-edges from {} to {}".format(len(out_edges), node, leader))
-                for u, v, edge_data in filtered_out_edges:
-                    key = generate_edge_key(u, edge_data['edge_label'], v)
+                for u, v, key, edge_data in filtered_out_edges:
                     self.target_graph.remove_edge(u, v, key=key)
                     edge_data['_original_subject'] = edge_data['subject']
                     edge_data['_original_object'] = edge_data['object']
                     edge_data['subject'] = leader
-                    key = generate_edge_key(leader, edge_data['edge_label'], v)
+                    key = generate_edge_key(leader, edge_data['edge_label'], v, get_edge_key_strategy(u, v, key, edge_data['edge_label']))
                     self.target_graph.add_edge(edge_data['subject'], edge_data['object'], key, **edge_data)
 
                 aliases = self.target_graph.nodes[leader].get('aliases') if 'aliases' in self.target_graph.nodes[leader] else []
 
-                for u, v, edge_data in equiv_in_edges:
+                for u, v, key, edge_data in equiv_in_edges:
                     if u != leader:
                         aliases.append(u)
                     if v != leader:
                         aliases.append(v)
-                    self.target_graph.remove_edge(u, v, key=generate_edge_key(u, SAME_AS, v))
+                    self.target_graph.remove_edge(u, v, key=key)
 
                 logging.debug("equiv out edges: {}".format(equiv_out_edges))
-                for u, v, edge_data in equiv_out_edges:
+                for u, v, key, edge_data in equiv_out_edges:
                     if u != leader:
                         logging.debug("{} is an alias of leader {}".format(u, leader))
                         aliases.append(u)
                     if v != leader:
                         logging.debug("{} is an alias of leader {}".format(v, leader))
                         aliases.append(v)
-                    self.target_graph.remove_edge(u, v, key=generate_edge_key(u, SAME_AS, v))
+                    self.target_graph.remove_edge(u, v, key=key)
 
                 # set aliases for leader
                 nx.set_node_attributes(self.target_graph, {leader: {'aliases': aliases}})
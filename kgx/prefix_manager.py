@@ -4,6 +4,8 @@ from typing import Dict
 
 import prefixcommons.curie_util as cu
 
+from kgx.utils.kgx_utils import PrefixTrie
+
 
 class PrefixManager(object):
     """
@@ -15,6 +17,8 @@ class PrefixManager(object):
 
     prefix_map = None
     reverse_prefix_map = None
+    prefix_trie = None
+    default_prefix_trie = None
 
     def __init__(self, url: str = None):
         """
@@ -44,6 +48,7 @@ class PrefixManager(object):
         """
         self.prefix_map = m
         self.reverse_prefix_map = {y: x for x, y in m.items() if isinstance(y, str)}
+        self.prefix_trie = PrefixTrie([m])
 
     def expand(self, curie: str, fallback: bool = True) -> str:
         """
@@ -73,7 +78,7 @@ class PrefixManager(object):
             uri = cu.expand_uri(curie, [self.prefix_map])
             if uri == curie and fallback:
                 uri = cu.expand_uri(curie)
-        print("CURIE {} to IRI {}".format(curie, uri))
+        logging.debug("CURIE {} to IRI {}".format(curie, uri))
         return uri
 
     def contract(self, uri: str, fallback: bool = True) -> str:
@@ -97,18 +102,14 @@ class PrefixManager(object):
         """
         # always prioritize non-CURIE shortform
         curie = None
-        print(uri)
         if uri in self.reverse_prefix_map:
             curie = self.reverse_prefix_map[uri]
         else:
-            curie_list = cu.contract_uri(uri, [self.prefix_map])
-            print(curie_list)
-            if len(curie_list) == 0 and fallback:
-                curie_list = cu.contract_uri(uri)
-                if len(curie_list) != 0:
-                    curie = curie_list[0]
-            else:
-                curie = curie_list[0]
+            curie = self.prefix_trie.contract(uri)
+            if curie is None and fallback:
+                if PrefixManager.default_prefix_trie is None:
+                    PrefixManager.default_prefix_trie = PrefixTrie(cu.default_curie_maps)
+                curie = PrefixManager.default_prefix_trie.contract(uri)
         return curie
 
     @staticmethod
@@ -1,13 +1,25 @@
-import json, logging
+import re, json, logging, textwrap
 from kgx.transformers.pandas_transformer import PandasTransformer
-from typing import List, Dict
+from tempfile import TemporaryFile
+from typing import List, Dict, Tuple, Generator, IO
+
+_whitespace = ' \t\n\r'
+_brackets = re.compile(r'["\[\]{}]')
+_quotes = re.compile(r'["\\]')
+
 
 class JsonTransformer(PandasTransformer):
     """
     Transformer that parses a JSON, and loads nodes and edges into a networkx.MultiDiGraph
+
+    Two formats are supported,
+        - ``json``: a JSON object with a list of nodes and a list of edges
+        - ``jsonl``: newline-delimited JSON, where each line is either a node or an edge
+
+    Both formats are read and written incrementally, one record at a time.
     """
 
-    def parse(self, filename: str, input_format: str = 'json', provided_by: str = None, **kwargs) -> None:
+    def parse(self, filename: str, input_format: str = None, provided_by: str = None, **kwargs) -> None:
         """
         Parse a JSON file of the format,
 
@@ -16,24 +28,66 @@ class JsonTransformer(PandasTransformer):
             "edges" : [...],
         }
 
+        or a JSON Lines file, where each line is either a node or an edge.
+
         Parameters
         ----------
         filename: str
             JSON file to read from
         input_format: str
-            The input file format (``json``, by default)
+            The input file format (``json`` or ``jsonl``); inferred from ``filename`` if not specified
         provided_by: str
             Define the source providing the input file
         kwargs: dict
             Any additional arguments
 
         """
+        if input_format is None:
+            input_format = 'jsonl' if filename.endswith('.jsonl') else 'json'
         logging.info("Parsing {}".format(filename))
         if provided_by:
             self.graph_metadata['provided_by'] = [provided_by]
-        with open(filename, 'r') as FH:
-            obj = json.load(FH)
-            self.load(obj)
+        with open(filename, 'r') as FH, TemporaryFile('w+') as spool:
+            # nodes are loaded before edges; edges that precede all nodes
+            # are spooled to disk and loaded once all nodes are loaded
+            nodes_seen = False
+            spooled = False
+            for record_type, record in self.read(FH, input_format):
+                if record_type == 'nodes':
+                    nodes_seen = True
+                    self.load_node(record)
+                elif nodes_seen:
+                    self.load_edge(record)
+                else:
+                    spool.write(json.dumps(record))
+                    spool.write('\n')
+                    spooled = True
+            if spooled:
+                spool.seek(0)
+                for record_type, record in JsonTransformer.read_jsonl(spool):
+                    self.load_edge(record)
+
+    def read(self, fh: IO[str], input_format: str = 'json') -> Generator[Tuple[str, Dict], None, None]:
+        """
+        Read nodes and edges from a file handle, one record at a time.
+
+        Parameters
+        ----------
+        fh: IO[str]
+            The file handle to read from
+        input_format: str
+            The input file format (``json`` or ``jsonl``)
+
+        Returns
+        -------
+        Generator[Tuple[str, Dict], None, None]
+            A generator of (record type, record) tuples, where the record type is either ``nodes`` or ``edges``
+
+        """
+        if input_format == 'jsonl':
+            return JsonTransformer.read_jsonl(fh)
+        else:
+            return JsonTransformer.read_json(fh)
 
     def load(self, obj: Dict[str, List]) -> None:
         """
@@ -88,35 +142,308 @@ class JsonTransformer(PandasTransformer):
             A dictionary with a list nodes and a list of edges
 
         """
-        nodes = []
-        edges = []
+        return {
+            'nodes': list(self.export_node_records()),
+            'edges': list(self.export_edge_records())
+        }
+
+    def export_node_records(self) -> Generator[Dict, None, None]:
+        """
+        Export nodes from networkx.MultiDiGraph, one record at a time.
+
+        Returns
+        -------
+        Generator[Dict, None, None]
+            A generator of records, where each record corresponds to a node
+
+        """
         for id, data in self.graph.nodes(data=True):
             node = data.copy()
             node['id'] = id
-            nodes.append(node)
+            yield node
+
+    def export_edge_records(self) -> Generator[Dict, None, None]:
+        """
+        Export edges from networkx.MultiDiGraph, one record at a time.
+
+        Returns
+        -------
+        Generator[Dict, None, None]
+            A generator of records, where each record corresponds to an edge
+
+        """
         for s, o, data in self.graph.edges(data=True):
             edge = data.copy()
             edge['subject'] = s
             edge['object'] = o
-            edges.append(edge)
+            yield edge
 
-        return {
-            'nodes': nodes,
-            'edges': edges
-        }
-
-    def save(self, filename: str, **kwargs) -> None:
+    def save(self, filename: str, extension: str = None, **kwargs) -> None:
         """
-        Write networkx.MultiDiGraph to a file as JSON.
+        Write networkx.MultiDiGraph to a file as JSON, or as JSON Lines.
+
+        Nodes and edges are written as they are exported, without
+        building the whole JSON document in memory.
 
         Parameters
         ----------
         filename: str
             Filename to write to
+        extension: str
+            The output file format (``json`` or ``jsonl``); inferred from ``filename`` if not specified
         kwargs: dict
             Any additional arguments
 
         """
-        obj = self.export()
+        if extension is None:
+            extension = 'jsonl' if filename.endswith('.jsonl') else 'json'
         with open(filename, 'w') as WH:
-            WH.write(json.dumps(obj, indent=4, sort_keys=True))
+            if extension == 'jsonl':
+                JsonTransformer.write_jsonl(WH, self.export_node_records(), self.export_edge_records())
+            else:
+                JsonTransformer.write_json(WH, self.export_node_records(), self.export_edge_records())
+
+    @staticmethod
+    def write_json(fh: IO[str], nodes: Generator[Dict, None, None], edges: Generator[Dict, None, None]) -> None:
+        """
+        Write nodes and edges, one record at a time, as a JSON object of the format,
+
+        {
+            "nodes" : [...],
+            "edges" : [...],
+        }
+
+        Parameters
+        ----------
+        fh: IO[str]
+            The file handle to write to
+        nodes: Generator[Dict, None, None]
+            A generator of nodes
+        edges: Generator[Dict, None, None]
+            A generator of edges
+
+        """
+        fh.write('{')
+        for i, (record_type, records) in enumerate([('nodes', nodes), ('edges', edges)]):
+            fh.write('{}\n    "{}": ['.format(',' if i else '', record_type))
+            separator = '\n'
+            for record in records:
+                fh.write(separator)
+                fh.write(textwrap.indent(json.dumps(record, indent=4, sort_keys=True), ' ' * 8))
+                separator = ',\n'
+            fh.write('\n    ]' if separator == ',\n' else ']')
+        fh.write('\n}')
+
+    @staticmethod
+    def write_jsonl(fh: IO[str], nodes: Generator[Dict, None, None], edges: Generator[Dict, None, None]) -> None:
+        """
+        Write nodes and edges as JSON Lines, where each line is either a node or an edge.
+
+        Parameters
+        ----------
+        fh: IO[str]
+            The file handle to write to
+        nodes: Generator[Dict, None, None]
+            A generator of nodes
+        edges: Generator[Dict, None, None]
+            A generator of edges
+
+        """
+        for records in [nodes, edges]:
+            for record in records:
+                fh.write(json.dumps(record, sort_keys=True))
+                fh.write('\n')
+
+    @staticmethod
+    def read_jsonl(fh: IO[str]) -> Generator[Tuple[str, Dict], None, None]:
+        """
+        Read nodes and edges from JSON Lines, where each line is either a node or an edge.
+
+        A record with both a ``subject`` and an ``object`` is an edge; any other record is a node.
+        Since each line is self-contained, JSON Lines files can be split and parsed in parallel.
+
+        Parameters
+        ----------
+        fh: IO[str]
+            The file handle to read from
+
+        Returns
+        -------
+        Generator[Tuple[str, Dict], None, None]
+            A generator of (record type, record) tuples, where the record type is either ``nodes`` or ``edges``
+
+        """
+        for line in fh:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if 'subject' in record and 'object' in record:
+                yield 'edges', record
+            else:
+                yield 'nodes', record
+
+    @staticmethod
+    def read_json(fh: IO[str], prefix: Tuple[str, ...] = (), chunk_size: int = 1 << 16) -> Generator[Tuple[str, Dict], None, None]:
+        """
+        Incrementally read nodes and edges from a JSON object of the format,
+
+        {
+            "nodes" : [...],
+            "edges" : [...],
+        }
+
+        Records are decoded one at a time, and thus memory usage is bounded
+        by the size of the largest record rather than the size of the file.
+
+        Parameters
+        ----------
+        fh: IO[str]
+            The file handle to read from
+        prefix: Tuple[str, ...]
+            The path of keys leading to the object containing nodes and edges.
+            For example, ``('knowledge_graph',)`` for a Reasoner Std API message.
+        chunk_size: int
+            The number of characters to read from ``fh`` at a time
+
+        Returns
+        -------
+        Generator[Tuple[str, Dict], None, None]
+            A generator of (record type, record) tuples, where the record type is either ``nodes`` or ``edges``
+
+        """
+        reader = _JsonStreamReader(fh, chunk_size)
+        if reader.peek() == '':
+            return
+        yield from reader.read_object((), prefix)
+
+
+class _JsonStreamReader(object):
+    """
+    A minimal incremental JSON reader, that decodes the elements
+    of the ``nodes`` and ``edges`` arrays (or any other ``arrays``) of a JSON object one at a time.
+    """
+
+    def __init__(self, fh: IO[str], chunk_size: int = 1 << 16, arrays: Tuple[str, ...] = ('nodes', 'edges')):
+        self.fh = fh
+        self.chunk_size = chunk_size
+        self.arrays = arrays
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """
+        Read the next chunk from the file handle, discarding what was already consumed.
+        Returns ``False`` if there is nothing left to read.
+        """
+        if self.eof:
+            return False
+        chunk = self.fh.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        Skip whitespace and return the next character, or an empty string at the end of the input.
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _whitespace:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self.fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, c: str) -> None:
+        found = self.peek()
+        if found != c:
+            raise ValueError("Expected '{}' but found '{}' at position {} of the current chunk".format(c, found, self.pos))
+        self.pos += 1
+
+    def decode(self):
+        """
+        Decode the next JSON value, reading more of the input until the value is complete.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # a value that ends at the end of the buffer, like a number, may continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.fill()
+
+    def skip(self) -> None:
+        """
+        Skip the next JSON value without decoding it, by scanning for the bracket that closes it.
+        """
+        if self.peek() not in '[{"':
+            self.decode()
+            return
+        depth = 0
+        in_string = False
+        while True:
+            m = (_quotes if in_string else _brackets).search(self.buffer, self.pos)
+            if m is None or (m.group() == '\\' and m.end() == len(self.buffer)):
+                # keep an escape that ends the buffer, such that the character it escapes is read with it
+                self.pos = len(self.buffer) if m is None else m.start()
+                if not self.fill():
+                    raise ValueError("Unexpected end of input")
+                continue
+            c = m.group()
+            if c == '\\':
+                self.pos = m.end() + 1
+                continue
+            self.pos = m.end()
+            if c == '"':
+                in_string = not in_string
+            elif c in '[{':
+                depth += 1
+            else:
+                depth -= 1
+            if depth == 0 and not in_string:
+                return
+
+    def read_object(self, path: Tuple[str, ...], prefix: Tuple[str, ...]) -> Generator[Tuple[str, Dict], None, None]:
+        self.expect('{')
+        while True:
+            c = self.peek()
+            if c == '}':
+                self.pos += 1
+                return
+            elif c == ',':
+                self.pos += 1
+                continue
+            elif c == '':
+                raise ValueError("Unexpected end of input")
+            key = self.decode()
+            self.expect(':')
+            c = self.peek()
+            depth = len(path)
+            if depth < len(prefix) and key == prefix[depth] and c == '{':
+                yield from self.read_object(path + (key,), prefix)
+            elif depth == len(prefix) and key in self.arrays and c == '[':
+                yield from self.read_array(key)
+            else:
+                self.skip()
+
+    def read_array(self, record_type: str) -> Generator[Tuple[str, Dict], None, None]:
+        self.expect('[')
+        while True:
+            c = self.peek()
+            if c == ']':
+                self.pos += 1
+                return
+            elif c == ',':
+                self.pos += 1
+                continue
+            elif c == '':
+                raise ValueError("Unexpected end of input")
+            yield record_type, self.decode()
@@ -1,30 +1,186 @@
 import logging
-import itertools
 import uuid
+import math
+import time
+import queue
+import threading
 import click
 import networkx as nx
-from typing import Tuple, List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, List, Dict, Any, Generator
+from urllib.parse import urlparse
 
 from kgx.transformers.transformer import Transformer
 from kgx.utils.kgx_utils import generate_edge_key
+from neo4j import GraphDatabase as bolt_gdb
 from neo4jrestclient.client import GraphDatabase as http_gdb, Node, Relationship
 from neo4jrestclient.query import CypherException
 
+from neo4j.exceptions import TransientError, ServiceUnavailable
+
+try:
+    from neo4j.exceptions import CypherError as BoltError
+except ImportError:
+    # neo4j >= 4.0
+    from neo4j.exceptions import Neo4jError as BoltError
+
+BOLT_SCHEMES = {'bolt', 'bolt+routing', 'bolt+s', 'bolt+ssc', 'neo4j', 'neo4j+s', 'neo4j+ssc'}
+
 
 class NeoTransformer(Transformer):
     """
     Transformer for reading from and writing to a Neo4j database.
+
+    Two protocols are supported,
+        - ``http``: the Neo4j REST API, via neo4jrestclient
+        - ``bolt``: the Bolt protocol, via the neo4j driver, with a pool of connections
+
+    The protocol is inferred from the scheme of ``uri`` (``http://`` or ``bolt://``), unless specified.
     """
 
-    def __init__(self, graph: nx.MultiDiGraph = None, uri: str = None, username: str = None, password: str = None):
+    def __init__(self, graph: nx.MultiDiGraph = None, uri: str = None, username: str = None, password: str = None, graph_backend: str = 'networkx', edge_key_strategy: str = 'string', protocol: str = None, pool_size: int = None):
         """
         Initialize an instance of NeoTransformer.
+
+        Parameters
+        ----------
+        graph: networkx.MultiDiGraph
+            The graph to save into Neo4j
+        uri: str
+            The URI of the Neo4j database; ``http://`` for the REST API or ``bolt://`` for the Bolt protocol
+        username: str
+            Username for authentication
+        password: str
+            Password for authentication
+        graph_backend: str
+            The graph backend to use
+        edge_key_strategy: str
+            The strategy for generating edge keys
+        protocol: str
+            The protocol to use (``http`` or ``bolt``); inferred from ``uri`` if not specified
+        pool_size: int
+            The maximum number of pooled connections, for the Bolt protocol
+
         """
-        super(NeoTransformer, self).__init__(graph)
+        super(NeoTransformer, self).__init__(graph, graph_backend, edge_key_strategy)
+        self.protocol = protocol if protocol else NeoTransformer.get_protocol(uri)
         self.http_driver = None
-        self.http_driver = http_gdb(uri, username=username, password=password)
+        self.bolt_driver = None
+        if self.protocol == 'bolt':
+            config = {} if pool_size is None else {'max_connection_pool_size': pool_size}
+            self.bolt_driver = bolt_gdb.driver(uri, auth=(username, password), **config)
+        elif self.protocol == 'http':
+            self.http_driver = http_gdb(uri, username=username, password=password)
+        else:
+            raise ValueError("Unsupported protocol for Neo4j: {}".format(self.protocol))
+
+    @staticmethod
+    def get_protocol(uri: str) -> str:
+        """
+        Get the protocol to use for a given Neo4j URI.
+
+        Parameters
+        ----------
+        uri: str
+            The URI of the Neo4j database
+
+        Returns
+        -------
+        str
+            ``bolt`` for a Bolt URI, and ``http`` otherwise
+
+        """
+        scheme = urlparse(uri).scheme if uri else ''
+        return 'bolt' if scheme in BOLT_SCHEMES else 'http'
+
+    def query(self, query: str, params: Dict = None, returns: Any = None) -> Generator[List, None, None]:
+        """
+        Run a read query against the Neo4j database, and stream its records.
+
+        With the Bolt protocol, the query runs in an explicit transaction,
+        on a session borrowed from the connection pool, and records are
+        consumed as they arrive rather than being buffered.
+
+        Parameters
+        ----------
+        query: str
+            The cypher query
+        params: Dict
+            The query parameters
+        returns: Any
+            The types of the values returned, for the REST API (for example, ``(Node, Relationship, Node)``)
+
+        Returns
+        -------
+        Generator[List, None, None]
+            A generator of records, where each record is a list of values
 
-    def load(self, start: int = 0, end: int = None, is_directed: bool = True) -> None:
+        """
+        try:
+            if self.bolt_driver is not None:
+                with self.bolt_driver.session() as session:
+                    with session.begin_transaction() as tx:
+                        for record in tx.run(query, params or {}):
+                            yield record.values()
+            else:
+                yield from self.http_driver.query(query, params=params, returns=returns)
+        except (CypherException, BoltError) as e:
+            logging.error(e)
+
+    def execute(self, query: str, params: Dict = None, retries: int = 0) -> bool:
+        """
+        Run a write query against the Neo4j database.
+
+        With the Bolt protocol, the query runs in an explicit transaction
+        that is committed once the query completes, and rolled back otherwise.
+        Transactions that fail with a transient error, like a deadlock,
+        are retried up to ``retries`` times, with an exponential backoff.
+
+        Parameters
+        ----------
+        query: str
+            The cypher query
+        params: Dict
+            The query parameters
+        retries: int
+            The number of times to retry on a transient error (``0``, by default)
+
+        Returns
+        -------
+        bool
+            Whether the query was committed
+
+        """
+        for attempt in range(retries + 1):
+            try:
+                if self.bolt_driver is not None:
+                    with self.bolt_driver.session() as session:
+                        with session.begin_transaction() as tx:
+                            tx.run(query, params or {}).consume()
+                            tx.commit()
+                else:
+                    self.http_driver.query(query, params=params)
+                return True
+            except (TransientError, ServiceUnavailable) as e:
+                if attempt == retries:
+                    logging.error(e)
+                else:
+                    logging.warning("Retrying after a transient error ({}/{}): {}".format(attempt + 1, retries, e))
+                    time.sleep(0.1 * 2 ** attempt)
+            except (CypherException, BoltError) as e:
+                logging.error(e)
+                break
+        return False
+
+    def close(self) -> None:
+        """
+        Close all pooled connections to the Neo4j database.
+
+        """
+        if self.bolt_driver is not None:
+            self.bolt_driver.close()
+
+    def load(self, start: int = 0, end: int = None, is_directed: bool = True, page_size: int = 10_000, workers: int = 1) -> None:
         """
         Read nodes and edges from a Neo4j database and create a networkx.MultiDiGraph
 
@@ -36,26 +192,41 @@ class NeoTransformer(Transformer):
             End for pagination
         is_directed: bool
             Are edges directed or undirected (``True``, by default, since edges in most cases are directed)
+        page_size: int
+            Size of each page (``10000``, by default)
+        workers: int
+            The number of concurrent sessions to fetch pages with (``1``, by default).
+            With more than one, edges are fetched by ranges of edge ids, in parallel, and ``start`` must be ``0``.
 
         """
-        # TODO: make PAGE_SIZE configurable
-
-        PAGE_SIZE = 10_000
-
         if end is None:
             # get total number of records to be fetched from Neo4j
             count = self.count(is_directed=is_directed)
         else:
             count = end - start
 
+        if workers > 1:
+            if start:
+                raise ValueError("Parallel loading from Neo4j does not support a start other than 0")
+            pages = self.get_partitioned_pages(self.get_edges, workers, page_size=page_size, **{'is_directed': is_directed})
+        else:
+            pages = self.get_pages(self.get_edges, start, end, page_size=page_size, **{'is_directed': is_directed})
+
+        records = 0
         with click.progressbar(length=count, label='Getting {:,} records from Neo4j'.format(count)) as bar:
             time_start = self.current_time_in_millis()
-            for page in self.get_pages(self.get_edges, start, end, page_size=PAGE_SIZE, **{'is_directed': is_directed}):
+            for page in pages:
+                if end is not None and records + len(page) > end - start:
+                    page = page[:end - start - records]
                 self.load_edges(page)
-                bar.update(PAGE_SIZE)
-            bar.update(count)
+                records += len(page)
+                bar.update(len(page))
+                if end is not None and records >= end - start:
+                    pages.close()
+                    break
             time_end = self.current_time_in_millis()
-            logging.debug("time taken to load edges: {} ms".format(time_end - time_start))
+            elapsed = max(time_end - time_start, 1)
+            logging.info("Loaded {:,} records in {} ms ({:,.0f} records/s)".format(records, elapsed, records * 1000 / elapsed))
 
     def count(self, is_directed: bool = True) -> int:
         """
@@ -79,12 +250,7 @@ class NeoTransformer(Transformer):
         """
 
         logging.debug("Query: {}".format(query))
-        try:
-            query_result = self.http_driver.query(query)
-        except CypherException as ce:
-            logging.error(ce)
-
-        for result in query_result:
+        for result in self.query(query):
             return result[0]
 
     def load_nodes(self, nodes: List[Node]) -> None:
@@ -93,8 +259,8 @@ class NeoTransformer(Transformer):
 
         Parameters
         ----------
-        nodes: List[neo4jrestclient.client.Node]
-            A list of node records
+        nodes: List[Node]
+            A list of node records, either neo4jrestclient.client.Node or neo4j Node
 
         """
         start = self.current_time_in_millis()
@@ -105,20 +271,21 @@ class NeoTransformer(Transformer):
 
     def load_node(self, node: Node) -> None:
         """
-        Load node from neo4jrestclient.client.Node into networkx.MultiDiGraph
+        Load node from neo4jrestclient.client.Node, or from neo4j Node, into networkx.MultiDiGraph
 
         Parameters
         ----------
-        node: neo4jrestclient.client.Node
+        node: Node
             A node
 
         """
 
-        attributes = {}
-        for key, value in node.properties.items():
-            attributes[key] = value
+        attributes = NeoTransformer.get_properties(node)
 
-        node_labels = [x._label for x in node.labels]
+        if isinstance(node, Node):
+            node_labels = [x._label for x in node.labels]
+        else:
+            node_labels = list(node.labels)
 
         if 'category' not in attributes:
             attributes['category'] = node_labels
@@ -143,37 +310,38 @@ class NeoTransformer(Transformer):
         Parameters
         ----------
         edges: List
-            A list of edge records
+            A list of edge records, where each record is of the form (subject, edge, object)
 
         """
         start = self.current_time_in_millis()
         for record in edges:
-            edge = record[1]
-            self.load_edge(edge)
+            self.load_edge(record[1], record[0], record[2])
         end = self.current_time_in_millis()
         logging.debug("time taken to load edges: {} ms".format(end - start))
 
-    def load_edge(self, edge: Relationship) -> None:
+    def load_edge(self, edge: Relationship, edge_subject: Node = None, edge_object: Node = None) -> None:
         """
-        Load an edge from neo4jrestclient.client.Relationship into networkx.MultiDiGraph
+        Load an edge from neo4jrestclient.client.Relationship, or from neo4j Relationship, into networkx.MultiDiGraph
 
         Parameters
         ----------
-        edge: neo4jrestclient.client.Relationship
+        edge: Relationship
             An edge
+        edge_subject: Node
+            The subject of the edge; taken from ``edge`` if not specified
+        edge_object: Node
+            The object of the edge; taken from ``edge`` if not specified
 
         """
-        edge_subject = edge.start
-        edge_predicate = edge.properties
-        edge_object = edge.end
+        if edge_subject is None:
+            edge_subject = edge.start if isinstance(edge, Relationship) else edge.start_node
+        if edge_object is None:
+            edge_object = edge.end if isinstance(edge, Relationship) else edge.end_node
 
         subject_id = edge_subject['id'] if 'id' in edge_subject else edge_subject.id
         object_id = edge_object['id'] if 'id' in edge_object else edge_object.id
 
-        attributes = {}
-
-        for key, value in edge_predicate.items():
-            attributes[key] = value
+        attributes = NeoTransformer.get_properties(edge)
 
         if 'subject' not in attributes:
             attributes['subject'] = subject_id
@@ -188,14 +356,40 @@ class NeoTransformer(Transformer):
         if not self.graph.has_node(object_id):
             self.load_node(edge_object)
 
-        key = generate_edge_key(subject_id, attributes['edge_label'], object_id)
+        key = generate_edge_key(subject_id, attributes['edge_label'], object_id, self.edge_key_strategy)
         self.graph.add_edge(subject_id, object_id, key, **attributes)
 
-    def get_pages(self, query_function, start: int = 0, end: int = None, page_size: int = 10_000, **kwargs) -> list:
+    @staticmethod
+    def get_properties(entity: Any) -> Dict:
+        """
+        Get a copy of the properties of a node or an edge.
+
+        Parameters
+        ----------
+        entity: Any
+            A neo4jrestclient.client.Node or neo4jrestclient.client.Relationship,
+            or a neo4j Node or Relationship
+
+        Returns
+        -------
+        Dict
+            The properties of the node or edge
+
+        """
+        if isinstance(entity, (Node, Relationship)):
+            return dict(entity.properties)
+        return dict(entity.items())
+
+    def get_pages(self, query_function, start: int = 0, end: int = None, page_size: int = 10_000, cursor_function=None, cursor: Dict[str, int] = None, **kwargs) -> list:
         """
         Get pages of size ``page_size`` from Neo4j.
         Returns an iterator of pages where number of pages is (``end`` - ``start``)/``page_size``
 
+        Pages are fetched with keyset pagination, where each page starts right after
+        the last record of the previous page. Unlike ``SKIP``, this does not require Neo4j
+        to re-scan the records of all previous pages, and thus fetching all records
+        is linear in the number of records. Only the first ``start`` records are skipped.
+
         Parameters
         ----------
         query_function: func
@@ -206,6 +400,11 @@ class NeoTransformer(Transformer):
             End for pagination
         page_size: int
             Size of each page (``10000``, by default)
+        cursor_function: func
+            The function that gets the cursor of a record, to fetch the next page from.
+            Usually this is ``NeoTransformer.get_node_cursor`` or ``NeoTransformer.get_edge_cursor`` (the default)
+        cursor: Dict[str, int]
+            The cursor to fetch the first page after, if any
         **kwargs: dict
             Any additional arguments that might be relevant for ``query_function``
 
@@ -215,35 +414,172 @@ class NeoTransformer(Transformer):
             An iterator for a list of records from Neo4j. The size of the list is ``page_size``
 
         """
-
-        # itertools.count(0) starts counting from zero, and would run indefinitely without a return statement.
-        # it's distinguished from applying a while loop via providing an index which is formative with the for statement
-        for i in itertools.count(0):
+        if cursor_function is None:
+            cursor_function = NeoTransformer.get_edge_cursor
+        skip = start
+        position = start
+        while end is None or position < end:
             # First halt condition: page pointer exceeds the number of values allowed to be returned in total
-            skip = start + (page_size * i)
-            limit = page_size if end is None or skip + page_size <= end else end - skip
-            if limit <= 0:
-                return
-            # execute query_function to get records
-            records = query_function(skip=skip, limit=limit, **kwargs)
-
+            limit = page_size if end is None else min(page_size, end - position)
+            records = query_function(cursor=cursor, skip=skip, limit=limit, **kwargs)
             # Second halt condition: no more data available
-            if records:
-                """
-                * Yield halts execution until next call
-                * Thus, the function continues execution upon next call
-                * Therefore, a new page is calculated before record is instantiated again
-                """
-                yield records
-            else:
+            if not records:
+                return
+            yield records
+            if len(records) < limit:
                 return
+            skip = 0
+            position += len(records)
+            cursor = cursor_function(records[-1])
+
+    def get_partitioned_pages(self, query_function, workers: int = 4, page_size: int = 10_000, partitions: int = None, **kwargs) -> Generator[list, None, None]:
+        """
+        Get pages of size ``page_size`` from Neo4j, fetching partitions of the edges concurrently.
+
+        The edges are partitioned into ranges of edge ids, as given by ``get_partitions``,
+        and each partition is paged through, with ``get_pages``, in a session of its own.
+        Pages are handed over, as they are fetched, through a bounded buffer, such that
+        the caller can load them (for example, into the graph) while other pages are being fetched.
+        Pages from different partitions are interleaved.
+
+        Parameters
+        ----------
+        query_function: func
+            The function to use to fetch records. Usually this is ``self.get_edges``
+        workers: int
+            The number of partitions to fetch concurrently (``4``, by default)
+        page_size: int
+            Size of each page (``10000``, by default)
+        partitions: int
+            The number of partitions (four times ``workers``, by default, to balance uneven partitions)
+        **kwargs: dict
+            Any additional arguments that might be relevant for ``query_function``
+
+        Returns
+        -------
+        Generator[list, None, None]
+            An iterator for a list of records from Neo4j
+
+        """
+        ranges = self.get_partitions(partitions if partitions else workers * 4, is_directed=kwargs.get('is_directed', True))
+        if not ranges:
+            return
+        # a partition that is done puts None in the buffer
+        buffer = queue.Queue(maxsize=workers * 2)
+        stop = threading.Event()
+
+        def put(item) -> None:
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
 
-    def get_nodes(self, skip: int = 0, limit: int = 0) -> List[Node]:
+        def fetch(lower: int, upper: int) -> None:
+            try:
+                cursor = {'last': lower - 1, 'last_subject': -1}
+                for page in self.get_pages(query_function, page_size=page_size, cursor=cursor, upper=upper, **kwargs):
+                    if stop.is_set():
+                        return
+                    put(page)
+            finally:
+                put(None)
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = [executor.submit(fetch, lower, upper) for lower, upper in ranges]
+        try:
+            done = 0
+            while done < len(ranges):
+                page = buffer.get()
+                if page is None:
+                    done += 1
+                else:
+                    yield page
+            for future in futures:
+                future.result()
+        finally:
+            stop.set()
+            executor.shutdown(wait=True)
+
+    def get_partitions(self, partitions: int, is_directed: bool = True) -> List[Tuple[int, int]]:
         """
-        Get a page of nodes from the Neo4j database.
+        Partition the edges to be fetched from the Neo4j database into ranges of edge ids.
 
         Parameters
         ----------
+        partitions: int
+            The number of partitions
+        is_directed: bool
+            Are edges directed or undirected (``True``, by default, since edges in most cases are directed)
+
+        Returns
+        -------
+        List[Tuple[int, int]]
+            A list of (lower, upper) bounds, both inclusive, on edge ids
+
+        """
+        direction = '->' if is_directed else '-'
+        query = f"""
+        MATCH (s{self.get_filter('subject_category')})-[p{self.get_filter('edge_label')}]{direction}(o{self.get_filter('object_category')})
+        RETURN min(id(p)), max(id(p))
+        """
+        logging.debug(query)
+        lower, upper = None, None
+        for record in self.query(query):
+            lower, upper = record[0], record[1]
+        if lower is None:
+            return []
+        size = math.ceil((upper - lower + 1) / partitions)
+        return [(x, min(x + size - 1, upper)) for x in range(lower, upper + 1, size)]
+
+    @staticmethod
+    def get_node_cursor(node: Node) -> Dict[str, int]:
+        """
+        Get the cursor for a node, as the query parameters to fetch the nodes that follow it.
+
+        Parameters
+        ----------
+        node: Node
+            A node
+
+        Returns
+        -------
+        Dict[str, int]
+            The cursor
+
+        """
+        return {'last': node.id}
+
+    @staticmethod
+    def get_edge_cursor(record: List) -> Dict[str, int]:
+        """
+        Get the cursor for an edge record, as the query parameters to fetch the edge records that follow it.
+
+        Since an undirected match yields each edge twice, once for each direction,
+        the cursor is made of both the edge and its subject.
+
+        Parameters
+        ----------
+        record: List
+            An edge record, of the form (subject, edge, object)
+
+        Returns
+        -------
+        Dict[str, int]
+            The cursor
+
+        """
+        return {'last': record[1].id, 'last_subject': record[0].id}
+
+    def get_nodes(self, cursor: Dict[str, int] = None, skip: int = 0, limit: int = 0) -> List[Node]:
+        """
+        Get a page of nodes from the Neo4j database, ordered by their internal id.
+
+        Parameters
+        ----------
+        cursor: Dict[str, int]
+            Fetch the nodes that follow this cursor, as returned by ``NeoTransformer.get_node_cursor``
         skip: int
             Records to skip
         limit: int
@@ -252,76 +588,72 @@ class NeoTransformer(Transformer):
         Returns
         -------
         list
-            A list of neo4jrestclient.client.Node records
+            A list of neo4jrestclient.client.Node, or neo4j Node, records
 
         """
-
-        if limit == 0 or limit is None:
-            query = f"""
-            MATCH (n)
-            WHERE n{self.get_filter('subject_category')} OR n{self.get_filter('object_category')}
-            RETURN n
-            SKIP {skip}
-            """
-        else:
-            query = f"""
-             MATCH (n)
-             WHERE n{self.get_filter('subject_category')} OR n{self.get_filter('object_category')}
-             RETURN n
-             SKIP {skip} LIMIT {limit}
-             """
+        params = {'last': -1, 'skip': skip}
+        if cursor:
+            params.update(cursor)
+        query = f"""
+        MATCH (n)
+        WHERE (n{self.get_filter('subject_category')} OR n{self.get_filter('object_category')}) AND id(n) > $last
+        RETURN n
+        ORDER BY id(n)
+        SKIP $skip
+        """
+        if limit:
+            query += " LIMIT $limit"
+            params['limit'] = limit
 
         logging.debug(query)
-
-        # Filter out all the associated metadata to ensure the results are clean
-        try:
-            results = self.http_driver.query(query, returns=Node)
-        except CypherException as ce:
-            logging.error(ce)
-        logging.debug("Results: {}".format(results))
-        nodes = [node for node in results]
-        logging.debug("Tidied results: {}".format(nodes))
+        nodes = [record[0] for record in self.query(query, params, returns=(Node,))]
         return nodes
 
-    def get_edges(self, skip: int = 0, limit: int = 0, is_directed: bool = True) -> List[Tuple[Node, Relationship, Node]]:
+    def get_edges(self, cursor: Dict[str, int] = None, skip: int = 0, limit: int = 0, is_directed: bool = True, upper: int = None) -> List[Tuple[Node, Relationship, Node]]:
         """
-        Get a page of edges from the Neo4j database.
+        Get a page of edges from the Neo4j database, ordered by their internal id.
 
         Parameters
         ----------
+        cursor: Dict[str, int]
+            Fetch the edges that follow this cursor, as returned by ``NeoTransformer.get_edge_cursor``
         skip: int
             Records to skip
         limit: int
             Total number of records to query for
         is_directed: bool
             Are edges directed or undirected (``True``, by default, since edges in most cases are directed)
+        upper: int
+            The largest edge id to fetch, if any
 
         Returns
         -------
         list
-            A list of 3-tuples of the form (neo4jrestclient.client.Node, neo4jrestclient.client.Relationship, neo4jrestclient.client.Node)
+            A list of 3-tuples of the form (Node, Relationship, Node)
 
         """
-
+        params = {'last': -1, 'last_subject': -1, 'skip': skip}
+        if cursor:
+            params.update(cursor)
+        bound = ''
+        if upper is not None:
+            bound = ' AND id(p) <= $upper'
+            params['upper'] = upper
         direction = '->' if is_directed else '-'
         query = f"""
         MATCH (s{self.get_filter('subject_category')})-[p{self.get_filter('edge_label')}]{direction}(o{self.get_filter('object_category')})
+        WHERE (id(p) > $last OR (id(p) = $last AND id(s) > $last_subject)){bound}
         RETURN s, p, o
-        SKIP {skip}
+        ORDER BY id(p), id(s)
+        SKIP $skip
         """
-
         if limit:
-            query += f" LIMIT {limit}"
+            query += " LIMIT $limit"
+            params['limit'] = limit
 
-        if skip < limit:
-            logging.debug(query)
-            try:
-                results = self.http_driver.query(query, returns=(Node, Relationship, Node))
-            except CypherException as ce:
-                logging.error(ce)
-            edge_triples = [x for x in results]
-            return edge_triples
-        return []
+        logging.debug(query)
+        edge_triples = [x for x in self.query(query, params, returns=(Node, Relationship, Node))]
+        return edge_triples
 
     def save_node(self, obj: dict) -> None:
         """
@@ -342,12 +674,9 @@ class NeoTransformer(Transformer):
         properties = ', '.join('n.{0}=${0}'.format(k) for k in obj.keys())
         query = f"MERGE (n:`{category}` {{id: $id}}) SET {properties}"
         logging.debug(query)
-        try:
-            self.http_driver.query(query, params=obj)
-        except CypherException as ce:
-            logging.error(ce)
+        self.execute(query, params=obj)
 
-    def save_node_unwind(self, nodes_by_category: Dict[str, list]) -> None:
+    def save_node_unwind(self, nodes_by_category: Dict[str, list], batch_size: int = 1000, workers: int = 1, retries: int = 3) -> None:
         """
         Save all nodes into Neo4j using the UNWIND cypher clause.
 
@@ -355,16 +684,19 @@ class NeoTransformer(Transformer):
         ----------
         nodes_by_category: Dict[str, list]
             A dictionary where node category is the key and the value is a list of nodes of that category
+        batch_size: int
+            The number of nodes to commit in each transaction (``1000``, by default)
+        workers: int
+            The number of transactions to commit concurrently (``1``, by default)
+        retries: int
+            The number of times to retry a transaction on a transient error (``3``, by default)
 
         """
-        for category in nodes_by_category.keys():
-            logging.debug("Generating UNWIND for category: {}".format(category))
-            query = self.generate_unwind_node_query(category)
-            logging.info(query)
-            try:
-                self.http_driver.query(query, params={'nodes': nodes_by_category[category]})
-            except CypherException as ce:
-                logging.error(ce)
+        writer = _UnwindWriter(self, 'nodes', batch_size, workers, retries)
+        for category in nodes_by_category:
+            writer.add(category, self.generate_unwind_node_query(category), nodes_by_category[category])
+        writer.close()
+        writer.report()
 
     def generate_unwind_node_query(self, category: str) -> str:
         """
@@ -393,7 +725,7 @@ class NeoTransformer(Transformer):
 
         return query
 
-    def save_edge_unwind(self, edges_by_edge_label: Dict[str, list]) -> None:
+    def save_edge_unwind(self, edges_by_edge_label: Dict[str, list], batch_size: int = 1000, workers: int = 1, retries: int = 3) -> None:
         """
         Save all edges into Neo4j using the UNWIND cypher clause.
 
@@ -401,23 +733,41 @@ class NeoTransformer(Transformer):
         ----------
         edges_by_edge_label: dict
             A dictionary where edge label is the key and the value is a list of edges with that edge label
+        batch_size: int
+            The number of edges to commit in each transaction (``1000``, by default)
+        workers: int
+            The number of transactions to commit concurrently (``1``, by default)
+        retries: int
+            The number of times to retry a transaction on a transient error (``3``, by default)
 
         """
-        for predicate in edges_by_edge_label:
-            query = self.generate_unwind_edge_query(predicate)
-            logging.info(query)
-            edges = edges_by_edge_label[predicate]
-            for i in range(0, len(edges), 1000):
-                end = i + 1000
-                subset = edges[i:end]
-                logging.info("edges subset: {}-{} for predicate {}".format(i, end, predicate))
-                time_start = self.current_time_in_millis()
-                try:
-                    self.http_driver.query(query, params={"relationship": predicate, "edges": subset})
-                except CypherException as ce:
-                    logging.error(ce)
-                time_end = self.current_time_in_millis()
-                logging.debug("time taken to load edges: {} ms".format(time_end - time_start))
+        writer = _UnwindWriter(self, 'edges', batch_size, workers, retries, order=NeoTransformer.get_edge_lock_order)
+        for edge_label in edges_by_edge_label:
+            writer.add(edge_label, self.generate_unwind_edge_query(edge_label), edges_by_edge_label[edge_label])
+        writer.close()
+        writer.report()
+
+    @staticmethod
+    def get_edge_lock_order(edge: Dict) -> Tuple[str, str]:
+        """
+        Get the order in which to write an edge within a batch.
+
+        Merging an edge locks its subject and its object. Writing the edges of every batch
+        in the same order of their nodes makes concurrent transactions acquire their locks
+        in the same order, which avoids most deadlocks between them.
+
+        Parameters
+        ----------
+        edge: Dict
+            An edge
+
+        Returns
+        -------
+        Tuple[str, str]
+            The key to sort edges by
+
+        """
+        return str(edge['subject']), str(edge['object'])
 
     def generate_unwind_edge_query(self, edge_label: str) -> str:
         """
@@ -470,46 +820,58 @@ class NeoTransformer(Transformer):
         SET {properties}
         """
 
-        try:
-            self.http_driver.query(q, params=obj)
-        except CypherException as ce:
-            logging.error(ce)
+        self.execute(q, params=obj)
 
-    def save_with_unwind(self) -> None:
+    def save_with_unwind(self, batch_size: int = 1000, workers: int = 1, retries: int = 3) -> None:
         """
         Save all nodes and edges from networkx.MultiDiGraph into Neo4j using the UNWIND cypher clause.
 
-        """
-        nodes_by_category = {}
+        Nodes are grouped by category, and edges by edge label, into batches of ``batch_size``
+        as they are read from the graph, and each batch is committed in its own transaction
+        as soon as it is full. Up to ``workers`` batches are committed concurrently.
+        All nodes are committed before any edge, and the throughput of each category
+        and edge label is reported once they are saved.
+
+        Parameters
+        ----------
+        batch_size: int
+            The number of nodes, or edges, to commit in each transaction (``1000``, by default)
+        workers: int
+            The number of transactions to commit concurrently (``1``, by default)
+        retries: int
+            The number of times to retry a transaction on a transient error, like a deadlock (``3``, by default)
 
+        """
+        categories = set()
         for n, node_data in self.graph.nodes(data=True):
             if 'id' not in node_data:
                 node_data['id'] = n
             node_data = self.validate_node(node_data)
-            category = ':'.join(node_data['category'])
-            logging.info("Category: {}".format(category))
-            if category not in nodes_by_category:
-                nodes_by_category[category] = [node_data]
-            else:
-                nodes_by_category[category].append(node_data)
-
-        edges_by_edge_label = {}
-        for n, nbrs in self.graph.adjacency():
-            for nbr, eattr in nbrs.items():
-                for entry, adjitem in eattr.items():
-                    edge = self.validate_edge(adjitem)
-                    if adjitem['edge_label'] not in edges_by_edge_label:
-                        edges_by_edge_label[edge['edge_label']] = [edge]
-                    else:
-                        edges_by_edge_label[edge['edge_label']].append(edge)
+            categories.add(':'.join(node_data['category']))
 
         # create indexes
-        print(set(nodes_by_category.keys()))
-        self.create_constraints(set(nodes_by_category.keys()))
+        self.create_constraints(categories)
+
         # save all nodes
-        self.save_node_unwind(nodes_by_category)
+        writer = _UnwindWriter(self, 'nodes', batch_size, workers, retries)
+        queries = {x: self.generate_unwind_node_query(x) for x in categories}
+        for n, node_data in self.graph.nodes(data=True):
+            category = ':'.join(node_data['category'])
+            writer.add(category, queries[category], [node_data])
+        writer.close()
+        writer.report()
+
         # save all edges
-        self.save_edge_unwind(edges_by_edge_label)
+        writer = _UnwindWriter(self, 'edges', batch_size, workers, retries, order=NeoTransformer.get_edge_lock_order)
+        queries = {}
+        for s, o, edge_data in self.graph.edges(data=True):
+            edge = self.validate_edge(edge_data)
+            edge_label = edge['edge_label']
+            if edge_label not in queries:
+                queries[edge_label] = self.generate_unwind_edge_query(edge_label)
+            writer.add(edge_label, queries[edge_label], [edge])
+        writer.close()
+        writer.report()
 
     def save(self) -> None:
         """
@@ -542,20 +904,10 @@ class NeoTransformer(Transformer):
         Give a summary on the number of nodes and edges in the Neo4j database.
 
         """
-        try:
-            node_results = self.http_driver.query("MATCH (n) RETURN COUNT(*)")
-        except CypherException as ce:
-            logging.error(ce)
-
-        for r in node_results:
+        for r in self.query("MATCH (n) RETURN COUNT(*)"):
             logging.info("Number of Nodes: {}".format(r[0]))
 
-        try:
-            edge_results = self.http_driver.query("MATCH (s)-->(o) RETURN COUNT(*)")
-        except CypherException as ce:
-            logging.error(ce)
-
-        for r in edge_results:
+        for r in self.query("MATCH (s)-->(o) RETURN COUNT(*)"):
             logging.info("Number of Edges: {}".format(r[0]))
 
     def create_constraints(self, categories: set) -> None:
@@ -580,10 +932,7 @@ class NeoTransformer(Transformer):
                 label_set.add(label)
 
         for label in label_set:
-            try:
-                self.http_driver.query(query.format(label))
-            except CypherException as ce:
-                logging.error(ce)
+            self.execute(query.format(label))
 
     def get_filter(self, key: str) -> str:
         """
@@ -602,5 +951,99 @@ class NeoTransformer(Transformer):
         """
         value = ''
         if key in self.filters and len(self.filters[key]) != 0:
-            value = f":`{self.filters[key]}`"
+            # labels and relationship types cannot be query parameters; escape them instead
+            value = ":`{}`".format(str(self.filters[key]).replace('`', '``'))
         return value
+
+
+class _UnwindWriter(object):
+    """
+    Groups rows by label, like node category or edge label, and commits them
+    in batches of ``batch_size``, with an UNWIND query for each label.
+
+    Batches are committed as soon as they are full, with up to ``workers`` in flight at a time,
+    and with at most as many full batches waiting to be committed as there are workers.
+    """
+
+    def __init__(self, transformer: NeoTransformer, parameter: str, batch_size: int = 1000, workers: int = 1, retries: int = 3, order=None):
+        self.transformer = transformer
+        self.parameter = parameter
+        self.batch_size = batch_size
+        self.retries = retries
+        self.order = order
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.slots = threading.BoundedSemaphore(workers * 2)
+        self.lock = threading.Lock()
+        self.batches = {}
+        self.queries = {}
+        self.futures = []
+        # label -> [rows committed, rows failed, time of the first commit, time of the last commit]
+        self.stats = {}
+
+    def add(self, label: str, query: str, rows: List[Dict]) -> None:
+        """
+        Add rows for a label, and commit every batch of rows that is full.
+        """
+        self.queries[label] = query
+        batch = self.batches.setdefault(label, [])
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                self.submit(label)
+                batch = self.batches.setdefault(label, [])
+
+    def submit(self, label: str) -> None:
+        batch = self.batches.pop(label)
+        if self.order is not None:
+            batch.sort(key=self.order)
+        self.slots.acquire()
+        future = self.executor.submit(self.commit, label, batch)
+        future.add_done_callback(lambda x: self.slots.release())
+        self.check()
+        self.futures.append(future)
+
+    def check(self) -> None:
+        """
+        Forget batches that were committed, and raise the exception of the first batch that raised one,
+        once the batches in flight are done.
+        """
+        for future in self.futures:
+            if future.done() and future.exception() is not None:
+                self.executor.shutdown(wait=True)
+                raise future.exception()
+        self.futures = [x for x in self.futures if not x.done()]
+
+    def commit(self, label: str, batch: List[Dict]) -> None:
+        start = time.perf_counter()
+        committed = False
+        try:
+            committed = self.transformer.execute(self.queries[label], {self.parameter: batch}, retries=self.retries)
+        finally:
+            end = time.perf_counter()
+            with self.lock:
+                stats = self.stats.setdefault(label, [0, 0, start, end])
+                stats[0 if committed else 1] += len(batch)
+                stats[2] = min(stats[2], start)
+                stats[3] = max(stats[3], end)
+
+    def close(self) -> None:
+        """
+        Commit all partial batches, and wait for every batch to be committed.
+        """
+        for label in list(self.batches):
+            if self.batches[label]:
+                self.submit(label)
+        self.executor.shutdown(wait=True)
+        for future in self.futures:
+            future.result()
+
+    def report(self) -> None:
+        """
+        Log the number of rows committed for each label, and the rate at which they were committed.
+        """
+        for label in sorted(self.stats):
+            committed, failed, start, end = self.stats[label]
+            elapsed = end - start
+            logging.info("{} {}: {:,} rows committed ({:,} failed) in {:.2f}s ({:,.0f} rows/s)".format(
+                self.parameter, label, committed, failed, elapsed, committed / elapsed if elapsed else 0
+            ))
@@ -1,13 +1,19 @@
+import io
+import os
 import re
+import csv
+import shlex
+import itertools
 import pandas as pd
 import numpy as np
 import logging, tarfile
+from contextlib import contextmanager
 from tempfile import TemporaryFile
 from kgx.utils import make_path
 from kgx.utils.kgx_utils import generate_edge_key
 from kgx.transformers.transformer import Transformer
 
-from typing import List, Dict
+from typing import List, Dict, Tuple, Generator, Iterator, IO
 
 LIST_DELIMITER = '|'
 
@@ -33,6 +39,14 @@ _archive_mode = {
     'tar.bz2': 'r:bz2'
 }
 
+_neo4j_import_columns = {
+    'nodes': [('id:ID', 'string'), (':LABEL', 'string[]')],
+    'relationships': [(':START_ID', 'string'), (':END_ID', 'string'), (':TYPE', 'string')]
+}
+
+# delimiters for arrays in neo4j-admin import, in order of preference, after the requested one
+_neo4j_array_delimiters = [';', '|', ',', '\x1f']
+
 _archive_format = {
     'w': 'tar',
     'w:gz': 'tar.gz',
@@ -45,9 +59,9 @@ class PandasTransformer(Transformer):
     Transformer that parses a pandas.DataFrame, and loads nodes and edges into a networkx.MultiDiGraph
     """
 
-    # TODO: Support parsing and export of neo4j-import tool compatible CSVs with appropriate headers
+    # TODO: Support parsing of neo4j-import tool compatible CSVs
 
-    def parse(self, filename: str, input_format: str = 'csv', provided_by: str = None, **kwargs) -> None:
+    def parse(self, filename: str, input_format: str = 'csv', provided_by: str = None, chunksize: int = None, **kwargs) -> None:
         """
         Parse a CSV/TSV (or plain text) file.
 
@@ -56,6 +70,9 @@ class PandasTransformer(Transformer):
 
         The file can also be data.tar.gz or data.tar.bz2
 
+        When ``chunksize`` is set, the file is read and loaded ``chunksize`` records at a time,
+        such that peak memory is bounded by the size of a chunk rather than the size of the file.
+
         Parameters
         ----------
         filename: str
@@ -64,10 +81,54 @@ class PandasTransformer(Transformer):
             The input file format (``csv``, by default)
         provided_by: str
             Define the source providing the input file
+        chunksize: int
+            The number of records to read and load at a time (``None``, by default, reads the entire file at once)
         kwargs: Dict
             Any additional arguments
 
         """
+        if provided_by:
+            self.graph_metadata['provided_by'] = [provided_by]
+
+        for record_type, df in self.read(filename, input_format, chunksize=chunksize, **kwargs):
+            if record_type == 'nodes':
+                self.load_nodes(df)
+            elif record_type == 'edges':
+                self.load_edges(df)
+            else:
+                self.load(df)
+
+    def read(self, filename: str, input_format: str = 'csv', chunksize: int = None, **kwargs) -> Generator[Tuple[str, pd.DataFrame], None, None]:
+        """
+        Read a CSV/TSV (or plain text) file, or a tar archive of such files,
+        as a stream of pandas.DataFrame.
+
+        This allows for records to be fed to a downstream consumer, one chunk at a time,
+        without loading them into a networkx.MultiDiGraph.
+
+        Parameters
+        ----------
+        filename: str
+            File to read from
+        input_format: str
+            The input file format (``csv``, by default)
+        chunksize: int
+            The number of records in each DataFrame (``None``, by default, reads the entire file at once)
+        kwargs: Dict
+            Any additional arguments
+
+        Returns
+        -------
+        Generator[Tuple[str, pandas.DataFrame], None, None]
+            A generator of tuples, where each tuple is of the form (record type, DataFrame).
+            The record type is either ``nodes`` or ``edges`` for members of a tar archive,
+            and ``None`` for a plain file, where the record type is to be inferred from the columns
+
+        """
+        if input_format in _archive_mode:
+            # an archive is expected to contain CSV files
+            input_format = 'csv'
+
         if 'delimiter' not in kwargs:
             # infer delimiter from file format
             kwargs['delimiter'] = _extension_types[input_format]
@@ -82,23 +143,25 @@ class PandasTransformer(Transformer):
             # file is not an archive
             mode = None
 
-        if provided_by:
-            self.graph_metadata['provided_by'] = [provided_by]
-
         if mode:
             with tarfile.open(filename, mode=mode) as tar:
-                for member in tar.getmembers():
-                    f = tar.extractfile(member)
-                    df = pd.read_csv(f, **kwargs) # type: pd.DataFrame
+                # iterating over the archive, instead of tar.getmembers(),
+                # ensures that members are discovered as the archive is read
+                for member in tar:
+                    if not member.isfile():
+                        continue
                     if re.search('nodes.{}'.format(input_format), member.name):
-                        self.load_nodes(df)
+                        record_type = 'nodes'
                     elif re.search('edges.{}'.format(input_format), member.name):
-                        self.load_edges(df)
+                        record_type = 'edges'
                     else:
                         raise Exception('Tar archive contains an unrecognized file: {}'.format(member.name))
+                    f = tar.extractfile(member)
+                    for df in PandasTransformer._read_csv(f, chunksize, **kwargs):
+                        yield record_type, df
         else:
-            df = pd.read_csv(filename, dtype=str, **kwargs) # type: pd.DataFrame
-            self.load(df)
+            for df in PandasTransformer._read_csv(filename, chunksize, dtype=str, **kwargs):
+                yield None, df
 
     def load(self, df: pd.DataFrame) -> None:
         """
@@ -125,8 +188,12 @@ class PandasTransformer(Transformer):
             Dataframe containing records that represent nodes
 
         """
-        for obj in df.to_dict('record'):
-            self.load_node(obj)
+        for node in PandasTransformer._build_records(df):
+            if 'id' in node:
+                node = Transformer.validate_node(node)
+                self.graph.add_node(node['id'], **node)
+            else:
+                logging.info("Ignoring node with no 'id': {}".format(node))
 
     def load_node(self, node: Dict) -> None:
         """
@@ -156,8 +223,15 @@ class PandasTransformer(Transformer):
             Dataframe containing records that represent edges
 
         """
-        for obj in df.to_dict('record'):
-            self.load_edge(obj)
+        for edge in PandasTransformer._build_records(df):
+            if 'subject' in edge and 'object' in edge:
+                edge = Transformer.validate_edge(edge)
+                s = edge['subject']
+                o = edge['object']
+                key = generate_edge_key(s, edge['edge_label'], o, self.edge_key_strategy)
+                self.graph.add_edge(s, o, key, **edge)
+            else:
+                logging.info("Ignoring edge with either a missing 'subject' or 'object': {}".format(edge))
 
     def load_edge(self, edge: Dict) -> None:
         """
@@ -174,7 +248,7 @@ class PandasTransformer(Transformer):
         if 'subject' in kwargs and 'object' in kwargs:
             s = kwargs['subject']
             o = kwargs['object']
-            key = generate_edge_key(s, kwargs['edge_label'], o)
+            key = generate_edge_key(s, kwargs['edge_label'], o, self.edge_key_strategy)
             self.graph.add_edge(s, o, key, **kwargs)
         else:
             logging.info("Ignoring edge with either a missing 'subject' or 'object': {}".format(kwargs))
@@ -189,14 +263,24 @@ class PandasTransformer(Transformer):
             A Dataframe where each record corresponds to a node from the networkx.MultiDiGraph
 
         """
-        rows = []
+        df = pd.DataFrame.from_records(list(self.export_node_rows()))
+        return df
+
+    def export_node_rows(self) -> Generator[Dict, None, None]:
+        """
+        Export nodes from networkx.MultiDiGraph, one row at a time.
+
+        Returns
+        -------
+        Generator[Dict, None, None]
+            A generator of rows, where each row corresponds to a node from the networkx.MultiDiGraph
+
+        """
         for n, data in self.graph.nodes(data=True):
             data = self.validate_node(data)
             row = PandasTransformer._build_export_row(data.copy())
             row['id'] = n
-            rows.append(row)
-        df = pd.DataFrame.from_records(rows)
-        return df
+            yield row
 
     def export_edges(self) -> pd.DataFrame:
         """
@@ -208,24 +292,72 @@ class PandasTransformer(Transformer):
             A Dataframe where each record corresponds to an edge from the networkx.MultiDiGraph
 
         """
-        rows = []
+        df = pd.DataFrame.from_records(list(self.export_edge_rows()))
+        cols = df.columns.tolist()
+        cols = PandasTransformer._order_cols(cols)
+        df = df[cols]
+        return df
+
+    def export_edge_rows(self) -> Generator[Dict, None, None]:
+        """
+        Export edges from networkx.MultiDiGraph, one row at a time.
+
+        Returns
+        -------
+        Generator[Dict, None, None]
+            A generator of rows, where each row corresponds to an edge from the networkx.MultiDiGraph
+
+        """
         for s, o, data in self.graph.edges(data=True):
             data = self.validate_edge(data)
             row = PandasTransformer._build_export_row(data.copy())
             row['subject'] = s
             row['object'] = o
-            rows.append(row)
-        df = pd.DataFrame.from_records(rows)
-        cols = df.columns.tolist()
-        cols = PandasTransformer._order_cols(cols)
-        df = df[cols]
-        return df
+            yield row
+
+    def get_node_columns(self) -> List[str]:
+        """
+        Get the columns required to export all nodes from networkx.MultiDiGraph,
+        without building any of the rows.
+
+        Returns
+        -------
+        List[str]
+            A list of column names
 
-    def save(self, filename: str, extension: str = 'csv', mode: str = 'w', **kwargs) -> str:
+        """
+        cols = {'id': None}
+        for n, data in self.graph.nodes(data=True):
+            if len(data) != 0 and 'category' not in data:
+                # validate_node adds a default category
+                cols['category'] = None
+            cols.update((k, None) for k, v in data.items() if v is not np.nan)
+        return PandasTransformer._order_cols(list(cols.keys()))
+
+    def get_edge_columns(self) -> List[str]:
+        """
+        Get the columns required to export all edges from networkx.MultiDiGraph,
+        without building any of the rows.
+
+        Returns
+        -------
+        List[str]
+            A list of column names
+
+        """
+        cols = {'subject': None, 'object': None}
+        for s, o, data in self.graph.edges(data=True):
+            cols.update((k, None) for k, v in data.items() if v is not np.nan)
+        return PandasTransformer._order_cols(list(cols.keys()))
+
+    def save(self, filename: str, extension: str = 'csv', mode: str = 'w', batch_size: int = 10_000, **kwargs) -> str:
         """
         Writes two files representing the node set and edge set of a networkx.MultiDiGraph,
         and add them to a `.tar` archive.
 
+        Rows are written in batches of ``batch_size``, directly to the output,
+        such that peak memory does not depend on the size of the graph.
+
         Parameters
         ----------
         filename: str
@@ -233,7 +365,10 @@ class PandasTransformer(Transformer):
         extension: str
             The output file format (``csv``, by default)
         mode: str
-            Form of compression to use (``w``, by default, signifies no compression)
+            Form of compression to use (``w``, by default, signifies no compression).
+            If ``None`` then the two files are written as-is, without a tar archive.
+        batch_size: int
+            The number of rows to write at a time (``10000``, by default)
         kwargs: dict
             Any additional arguments
 
@@ -241,22 +376,379 @@ class PandasTransformer(Transformer):
         if extension not in _extension_types:
             raise Exception('Unsupported extension: ' + extension)
 
-        archive_name = "{}.{}".format(filename, _archive_format[mode])
         delimiter = _extension_types[extension]
 
-        nodes_content = self.export_nodes().to_csv(sep=delimiter, index=False, escapechar="\\", doublequote=False)
-        edges_content = self.export_edges().to_csv(sep=delimiter, index=False, escapechar="\\", doublequote=False)
-
         nodes_file_name = "{}_nodes.{}".format(filename, extension)
         edges_file_name = "{}_edges.{}".format(filename, extension)
 
-        make_path(archive_name)
-        with tarfile.open(name=archive_name, mode=mode) as tar:
-            PandasTransformer._add_to_tar(tar, nodes_file_name, nodes_content)
-            PandasTransformer._add_to_tar(tar, edges_file_name, edges_content)
+        node_columns = self.get_node_columns()
+        edge_columns = self.get_edge_columns()
+
+        if mode is None:
+            make_path(nodes_file_name)
+            with open(nodes_file_name, 'w', encoding='utf-8', newline='') as f:
+                PandasTransformer._write_rows(f, self.export_node_rows(), node_columns, delimiter, batch_size)
+            with open(edges_file_name, 'w', encoding='utf-8', newline='') as f:
+                PandasTransformer._write_rows(f, self.export_edge_rows(), edge_columns, delimiter, batch_size)
+        else:
+            archive_name = "{}.{}".format(filename, _archive_format[mode])
+            make_path(archive_name)
+            with tarfile.open(name=archive_name, mode=mode) as tar:
+                with PandasTransformer._tar_member(tar, nodes_file_name) as f:
+                    PandasTransformer._write_rows(f, self.export_node_rows(), node_columns, delimiter, batch_size)
+                with PandasTransformer._tar_member(tar, edges_file_name) as f:
+                    PandasTransformer._write_rows(f, self.export_edge_rows(), edge_columns, delimiter, batch_size)
 
         return filename
 
+    def save_neo4j_import(self, directory: str, array_delimiter: str = ';', database: str = 'graph.db') -> List[str]:
+        """
+        Write the nodes and edges of a networkx.MultiDiGraph as CSVs that can be bulk imported
+        into a new Neo4j database with ``neo4j-admin import``.
+
+        Nodes are written to one file per category, with an ``id:ID`` and a ``:LABEL`` column,
+        and edges to one file per edge label, with ``:START_ID``, ``:END_ID`` and ``:TYPE`` columns.
+        Each property is a typed column (for example, ``negated:boolean`` or ``publications:string[]``),
+        where multi-valued properties are arrays delimited by ``array_delimiter``.
+        The graph is read twice, once to find the columns of each file and once to write its rows,
+        such that rows are streamed to the files rather than held in memory.
+        If any value of an array, or any label, contains ``array_delimiter``, which would split the value on import,
+        the first of ``;``, ``|``, ``,`` and ``\\x1f`` that no such value contains is used instead.
+
+        The ``neo4j-admin import`` command for the files is written to ``import.sh`` in ``directory``.
+
+        Parameters
+        ----------
+        directory: str
+            The directory to write to
+        array_delimiter: str
+            The preferred delimiter for values of multi-valued properties (``;``, by default)
+        database: str
+            The name of the database to import into, in ``import.sh`` (``graph.db``, by default)
+
+        Returns
+        -------
+        List[str]
+            The arguments of the ``neo4j-admin import`` command
+
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        def node_rows():
+            for n, data in self.graph.nodes(data=True):
+                data = self.validate_node(data)
+                row = {k: v for k, v in data.items() if v is not np.nan and k != 'id'}
+                labels = PandasTransformer._listify(row.get('category', []))
+                if Transformer.DEFAULT_NODE_LABEL not in labels:
+                    labels.append(Transformer.DEFAULT_NODE_LABEL)
+                yield ':'.join(labels), [n, labels], row
+
+        def edge_rows():
+            for s, o, data in self.graph.edges(data=True):
+                data = self.validate_edge(data)
+                row = {k: v for k, v in data.items() if v is not np.nan}
+                row['subject'] = s
+                row['object'] = o
+                yield row['edge_label'], [s, o, row['edge_label']], row
+
+        # first pass: the type of every property in every file, and the delimiters that values of each property contain
+        record_types = {}
+        record_delimiters = {}
+        candidates = [array_delimiter] + [x for x in _neo4j_array_delimiters if x != array_delimiter]
+        for record_type, rows in [('nodes', node_rows), ('relationships', edge_rows)]:
+            special_columns = _neo4j_import_columns[record_type]
+            types = record_types[record_type] = {}
+            contained = record_delimiters[record_type] = {}
+            for group, special, row in rows():
+                group_types = types.setdefault(group, {})
+                group_contained = contained.setdefault(group, {})
+                for k, v in itertools.chain(zip((k for k, t in special_columns), special), row.items()):
+                    if k in row:
+                        group_types[k] = PandasTransformer._neo4j_type(k, v, group_types.get(k))
+                    for x in v if isinstance(v, (list, set, tuple)) else [v]:
+                        if isinstance(x, str):
+                            for d in candidates:
+                                if d in x:
+                                    group_contained.setdefault(k, set()).add(d)
+
+        # neo4j-admin import only splits arrays, so only the delimiters in values of arrays matter
+        found = set()
+        for record_type, contained in record_delimiters.items():
+            special_arrays = {k for k, t in _neo4j_import_columns[record_type] if t.endswith('[]')}
+            for group, group_contained in contained.items():
+                for k, ds in group_contained.items():
+                    if k in special_arrays or record_types[record_type][group][k].endswith('[]'):
+                        found.update(ds)
+        delimiters = [d for d in candidates if d not in found]
+        if not delimiters:
+            raise ValueError("Values of arrays contain every array delimiter of {}".format([array_delimiter] + _neo4j_array_delimiters))
+        if delimiters[0] != array_delimiter:
+            logging.warning("Values of arrays contain the array delimiter '{}'; using '{}' instead".format(array_delimiter, delimiters[0]))
+            array_delimiter = delimiters[0]
+
+        args = ['neo4j-admin', 'import', '--database={}'.format(database), '--id-type=STRING', '--array-delimiter={}'.format(array_delimiter)]
+        for record_type, rows in [('nodes', node_rows), ('relationships', edge_rows)]:
+            special_columns = _neo4j_import_columns[record_type]
+            types = record_types[record_type]
+            filenames = PandasTransformer._neo4j_filenames(record_type, list(types.keys()))
+            properties = {group: PandasTransformer._order_cols(list(group_types.keys())) for group, group_types in types.items()}
+
+            # second pass: the rows of every file
+            handles = {}
+            writers = {}
+            try:
+                for group, special, row in rows():
+                    if group not in writers:
+                        handles[group] = open(os.path.join(directory, filenames[group]), 'w', encoding='utf-8', newline='')
+                        writers[group] = csv.writer(handles[group])
+                        header = [k for k, t in special_columns]
+                        header += ['{}:{}'.format(k, types[group][k]) for k in properties[group]]
+                        writers[group].writerow(header)
+                    values = [PandasTransformer._neo4j_value(v, t, array_delimiter) for v, (k, t) in zip(special, special_columns)]
+                    values += [PandasTransformer._neo4j_value(row.get(k), types[group][k], array_delimiter) for k in properties[group]]
+                    writers[group].writerow(values)
+            finally:
+                for f in handles.values():
+                    f.close()
+            args += ['--{}={}'.format(record_type, filenames[group]) for group in types]
+
+        with open(os.path.join(directory, 'import.sh'), 'w') as f:
+            f.write('#!/bin/sh\n')
+            f.write('# run from this directory, while the Neo4j database is stopped\n')
+            f.write(' '.join(shlex.quote(x) for x in args))
+            f.write('\n')
+        logging.info("Wrote CSVs for neo4j-admin import to {}".format(directory))
+        return args
+
+    @staticmethod
+    def _neo4j_filenames(record_type: str, groups: List[str]) -> Dict[str, str]:
+        """
+        Get a distinct filename for each group of records, like nodes of a category, for neo4j-admin import.
+
+        Parameters
+        ----------
+        record_type: str
+            Either ``nodes`` or ``relationships``
+        groups: List[str]
+            The groups of records
+
+        Returns
+        -------
+        Dict[str, str]
+            A dictionary of group to filename
+
+        """
+        filenames = {}
+        seen = set()
+        for group in sorted(groups):
+            name = re.sub(r'[^A-Za-z0-9_.-]+', '_', group)
+            filename = '{}_{}.csv'.format(record_type, name)
+            i = 1
+            while filename in seen:
+                i += 1
+                filename = '{}_{}_{}.csv'.format(record_type, name, i)
+            seen.add(filename)
+            filenames[group] = filename
+        return filenames
+
+    @staticmethod
+    def _neo4j_type(key: str, value, current: str = None) -> str:
+        """
+        Get the neo4j-admin import type of a property, given a value and the type of all previous values.
+
+        Booleans are ``boolean``, integers are ``long`` and other numbers are ``double``;
+        anything else is a ``string``. Multi-valued properties, and lists, are arrays of these types.
+        A property with values of different types is a ``string`` (or a ``string[]``).
+
+        Parameters
+        ----------
+        key: str
+            The property
+        value: object
+            A value of the property
+        current: str
+            The type of all previous values of the property, if any
+
+        Returns
+        -------
+        str
+            The type of the property
+
+        """
+        is_array = isinstance(value, (list, set, tuple)) or _column_types.get(key) == list
+        values = PandasTransformer._listify(value) if is_array else [value]
+        element = current[:-2] if current and current.endswith('[]') else current
+        for v in values:
+            if v is None or v is np.nan:
+                continue
+            elif isinstance(v, (bool, np.bool_)):
+                t = 'boolean'
+            elif isinstance(v, (int, np.integer)):
+                t = 'long'
+            elif isinstance(v, (float, np.floating)):
+                t = 'double'
+            else:
+                t = 'string'
+            if element is None or element == t:
+                element = t
+            elif {element, t} == {'long', 'double'}:
+                element = 'double'
+            else:
+                element = 'string'
+        if element is None:
+            element = 'string'
+        if is_array or (current and current.endswith('[]')):
+            return element + '[]'
+        return element
+
+    @staticmethod
+    def _neo4j_value(value, neo4j_type: str, array_delimiter: str = ';') -> str:
+        """
+        Format a value as a field of a CSV for neo4j-admin import.
+
+        Parameters
+        ----------
+        value: object
+            The value
+        neo4j_type: str
+            The neo4j-admin import type of the value's column
+        array_delimiter: str
+            The delimiter for values of arrays
+
+        Returns
+        -------
+        str
+            The formatted value, or ``None`` if there is no value
+
+        """
+        if value is None or value is np.nan:
+            return None
+        if neo4j_type.endswith('[]'):
+            values = PandasTransformer._listify(value) if isinstance(value, (list, set, tuple, str)) else [value]
+            # elements without a value are left out of arrays
+            values = [PandasTransformer._neo4j_value(x, neo4j_type[:-2]) for x in values]
+            return array_delimiter.join(x for x in values if x is not None)
+        if isinstance(value, (bool, np.bool_)):
+            return 'true' if value else 'false'
+        # values that span multiple lines are escaped, as in other exports
+        return str(value).replace('\n', '\\n')
+
+    @staticmethod
+    def _read_csv(f, chunksize: int = None, **kwargs) -> Generator[pd.DataFrame, None, None]:
+        """
+        Read a CSV/TSV (or plain text) file, or file-like object, one chunk at a time.
+
+        Parameters
+        ----------
+        f: Union[str, IO]
+            A filename or a file-like object
+        chunksize: int
+            The number of records in each chunk (``None``, by default, reads the entire file as a single chunk)
+        kwargs: Dict
+            Any additional arguments for ``pandas.read_csv``
+
+        Returns
+        -------
+        Generator[pandas.DataFrame, None, None]
+            A generator of DataFrames
+
+        """
+        if chunksize is None:
+            yield pd.read_csv(f, **kwargs)
+        else:
+            for df in pd.read_csv(f, chunksize=chunksize, **kwargs):
+                yield df
+
+    @staticmethod
+    def _build_columns(df: pd.DataFrame) -> Dict[str, pd.Series]:
+        """
+        Sanitize the columns of a pandas.DataFrame, one whole column at a time.
+
+        This is the column-wise counterpart of ``_build_kwargs``, where multi-valued
+        properties are split on ``LIST_DELIMITER`` and boolean properties are coerced
+        to bool, according to the type specified in ``_column_types``.
+
+        The DataFrame itself is left unchanged.
+
+        Parameters
+        ----------
+        df: pandas.DataFrame
+            A DataFrame containing records that represent nodes or edges
+
+        Returns
+        -------
+        Dict[str, pandas.Series]
+            A dictionary of column name to processed column
+
+        """
+        columns = {}
+        for key in df.columns:
+            column = df[key]
+            if key in _column_types:
+                if _column_types[key] == list:
+                    if column.dtype == object:
+                        values = column.str.split(LIST_DELIMITER)
+                        # values that are not strings, like lists or numbers,
+                        # are not split by pandas and are handled individually
+                        others = column.notna() & values.isna()
+                        if others.any():
+                            values[others] = column[others].map(PandasTransformer._listify)
+                    else:
+                        values = column.astype(str).map(lambda x: [x])
+                    column = values
+                elif _column_types[key] == bool:
+                    column = column.astype(bool)
+            columns[key] = column
+        return columns
+
+    @staticmethod
+    def _build_records(df: pd.DataFrame) -> Generator[Dict, None, None]:
+        """
+        Sanitize a pandas.DataFrame, column-wise, and generate records from it.
+
+        Any value that is missing from a record, like ``numpy.nan``, is dropped.
+
+        Parameters
+        ----------
+        df: pandas.DataFrame
+            A DataFrame containing records that represent nodes or edges
+
+        Returns
+        -------
+        Generator[Dict, None, None]
+            A generator of records as dictionaries
+
+        """
+        columns = PandasTransformer._build_columns(df)
+        keys = list(columns.keys())
+        values = [columns[k].tolist() for k in keys]
+        masks = [df[k].notna().tolist() for k in keys]
+        for row, mask in zip(zip(*values), zip(*masks)):
+            yield {k: v for k, v, m in zip(keys, row, mask) if m}
+
+    @staticmethod
+    def _listify(value) -> List:
+        """
+        Cast a value of a multi-valued property to a list.
+
+        Parameters
+        ----------
+        value: object
+            A value
+
+        Returns
+        -------
+        list
+            A list of values
+
+        """
+        if isinstance(value, (list, set, tuple)):
+            return list(value)
+        elif isinstance(value, str):
+            return value.split(LIST_DELIMITER)
+        else:
+            return [str(value)]
+
     @staticmethod
     def _build_kwargs(data: Dict) -> Dict:
         """
@@ -280,12 +772,7 @@ class PandasTransformer(Transformer):
             # process value as a list if key is a multi-valued property
             if key in _column_types:
                 if _column_types[key] == list:
-                    if isinstance(value, (list, set, tuple)):
-                        data[key] = list(value)
-                    elif isinstance(value, str):
-                        data[key] = value.split(LIST_DELIMITER)
-                    else:
-                        data[key] = [str(value)]
+                    data[key] = PandasTransformer._listify(value)
                 elif _column_types[key] == bool:
                     try:
                         data[key] = bool(value)
@@ -368,10 +855,42 @@ class PandasTransformer(Transformer):
         return cols2 + cols
 
     @staticmethod
-    def _add_to_tar(tar: tarfile.TarFile, filename: str, filecontent: pd.DataFrame) -> None:
+    def _write_rows(f: IO, rows: Iterator[Dict], columns: List[str], delimiter: str, batch_size: int = 10_000) -> None:
+        """
+        Write rows to a file handle as delimiter-separated values, one batch of rows at a time.
+
+        Parameters
+        ----------
+        f: IO
+            A file handle opened in text mode
+        rows: Iterator[Dict]
+            An iterator of rows
+        columns: List[str]
+            The columns to write, in order
+        delimiter: str
+            The delimiter for separating values
+        batch_size: int
+            The number of rows to write at a time (``10000``, by default)
+
+        """
+        header = True
+        for batch in iter(lambda: list(itertools.islice(rows, batch_size)), []):
+            df = pd.DataFrame.from_records(batch, columns=columns)
+            df.to_csv(f, sep=delimiter, index=False, header=header, escapechar="\\", doublequote=False)
+            header = False
+        if header:
+            # write just the header when there are no rows
+            pd.DataFrame(columns=columns).to_csv(f, sep=delimiter, index=False, escapechar="\\", doublequote=False)
+
+    @staticmethod
+    @contextmanager
+    def _tar_member(tar: tarfile.TarFile, filename: str) -> Generator[IO, None, None]:
         """
-        Write file contents to a given filename and add the file
-        to a specified tar archive.
+        Provide a text file handle whose contents are added to a specified tar archive,
+        as ``filename``, once the handle is released.
+
+        The contents are spooled to a temporary file on disk, rather than held in memory,
+        since the size of a tar member must be known before it is added to the archive.
 
         Parameters
         ----------
@@ -379,14 +898,19 @@ class PandasTransformer(Transformer):
             Tar archive handle
         filename: str
             Name of file to add to the archive
-        filecontent: pandas.DataFrame
-            DataFrame containing data to write to filename
+
+        Returns
+        -------
+        Generator[IO, None, None]
+            A file handle opened in text mode
 
         """
-        content = filecontent.encode()
         with TemporaryFile() as tmp:
-            tmp.write(content)
-            tmp.seek(0)
+            f = io.TextIOWrapper(tmp, encoding='utf-8', newline='')
+            yield f
+            f.flush()
+            f.detach()
             info = tarfile.TarInfo(name=filename)
-            info.size = len(content)
+            info.size = tmp.tell()
+            tmp.seek(0)
             tar.addfile(tarinfo=info, fileobj=tmp)
@@ -0,0 +1,327 @@
+import logging
+import itertools
+from typing import List, Dict, Iterator, Generator
+
+from kgx.utils import make_path
+from kgx.utils.kgx_utils import generate_edge_key
+from kgx.transformers.transformer import Transformer
+from kgx.transformers.pandas_transformer import PandasTransformer, _column_types
+
+_required_columns = {
+    'nodes': ['id'],
+    'edges': ['subject', 'edge_label', 'object']
+}
+
+
+class ParquetTransformer(PandasTransformer):
+    """
+    Transformer that reads and writes Apache Parquet files, and loads nodes and edges into a networkx.MultiDiGraph
+
+    Nodes and edges are stored as typed columns, where multi-valued properties
+    (like ``category``, ``publications`` and ``same_as``) are stored as native list columns.
+
+    .. note::
+        This transformer requires ``pyarrow`` to be installed.
+
+    """
+
+    def parse(self, filename: str, input_format: str = 'parquet', provided_by: str = None, columns: List[str] = None, batch_size: int = 65_536, **kwargs) -> None:
+        """
+        Parse a Parquet file, one batch of records at a time.
+
+        The file can represent either nodes (nodes.parquet) or edges (edges.parquet).
+
+        Parameters
+        ----------
+        filename: str
+            File to read from
+        input_format: str
+            The input file format (``parquet``, by default)
+        provided_by: str
+            Define the source providing the input file
+        columns: List[str]
+            The columns to read (``None``, by default, reads all columns).
+            Columns that are required for a node or an edge are always read.
+        batch_size: int
+            The maximum number of records to read at a time (``65536``, by default)
+        kwargs: dict
+            Any additional arguments
+
+        """
+        pq = _import_pyarrow_parquet()
+
+        if provided_by:
+            self.graph_metadata['provided_by'] = [provided_by]
+
+        parquet_file = pq.ParquetFile(filename)
+        names = parquet_file.schema_arrow.names
+        record_type = 'edges' if 'subject' in names else 'nodes'
+
+        if columns is not None:
+            columns = [x for x in names if x in columns or x in _required_columns[record_type]]
+
+        logging.info("Parsing {} as {} in {} row group(s)".format(filename, record_type, parquet_file.num_row_groups))
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+            records = ParquetTransformer._batch_records(batch)
+            if record_type == 'nodes':
+                self.load_node_records(records)
+            else:
+                self.load_edge_records(records)
+
+    def load_node_records(self, records: Iterator[Dict]) -> None:
+        """
+        Load typed node records into a networkx.MultiDiGraph
+
+        Parameters
+        ----------
+        records: Iterator[Dict]
+            An iterator of records, where each record represents a node
+
+        """
+        for node in records:
+            node = Transformer.validate_node(node)
+            self.graph.add_node(node['id'], **node)
+
+    def load_edge_records(self, records: Iterator[Dict]) -> None:
+        """
+        Load typed edge records into a networkx.MultiDiGraph
+
+        Parameters
+        ----------
+        records: Iterator[Dict]
+            An iterator of records, where each record represents an edge
+
+        """
+        for edge in records:
+            edge = Transformer.validate_edge(edge)
+            s = edge['subject']
+            o = edge['object']
+            key = generate_edge_key(s, edge['edge_label'], o, self.edge_key_strategy)
+            self.graph.add_edge(s, o, key, **edge)
+
+    def save(self, filename: str, extension: str = 'parquet', compression: str = 'snappy', batch_size: int = 65_536, **kwargs) -> str:
+        """
+        Writes two Parquet files representing the node set and edge set of a networkx.MultiDiGraph.
+
+        Rows are written in batches of ``batch_size``, where each batch becomes a row group.
+
+        Parameters
+        ----------
+        filename: str
+            Prefix for the files to create; nodes are written to ``{filename}_nodes.parquet``
+            and edges are written to ``{filename}_edges.parquet``
+        extension: str
+            The output file format (``parquet``, by default)
+        compression: str
+            The compression codec to use (``snappy``, by default)
+        batch_size: int
+            The number of rows to write at a time (``65536``, by default)
+        kwargs: dict
+            Any additional arguments
+
+        Returns
+        -------
+        str
+            The prefix of the files created
+
+        """
+        nodes_file_name = "{}_nodes.{}".format(filename, extension)
+        edges_file_name = "{}_edges.{}".format(filename, extension)
+        make_path(nodes_file_name)
+
+        node_schema = ParquetTransformer._build_schema(self.graph.nodes(data=True), ['id'])
+        ParquetTransformer._write_records(nodes_file_name, self.export_node_records(), node_schema, compression, batch_size)
+
+        edge_schema = ParquetTransformer._build_schema(self.graph.edges(data=True), ['subject', 'object'])
+        ParquetTransformer._write_records(edges_file_name, self.export_edge_records(), edge_schema, compression, batch_size)
+
+        return filename
+
+    def export_node_records(self) -> Generator[Dict, None, None]:
+        """
+        Export nodes from networkx.MultiDiGraph, one typed record at a time.
+
+        Returns
+        -------
+        Generator[Dict, None, None]
+            A generator of records, where each record corresponds to a node
+
+        """
+        for n, data in self.graph.nodes(data=True):
+            record = self.validate_node(data).copy()
+            record['id'] = n
+            yield record
+
+    def export_edge_records(self) -> Generator[Dict, None, None]:
+        """
+        Export edges from networkx.MultiDiGraph, one typed record at a time.
+
+        Returns
+        -------
+        Generator[Dict, None, None]
+            A generator of records, where each record corresponds to an edge
+
+        """
+        for s, o, data in self.graph.edges(data=True):
+            record = self.validate_edge(data).copy()
+            record['subject'] = s
+            record['object'] = o
+            yield record
+
+    @staticmethod
+    def _build_schema(elements: Iterator, required: List[str]):
+        """
+        Build an Arrow schema for all nodes or all edges in a graph.
+
+        Properties defined as multi-valued in ``_column_types``, or whose values
+        are lists, become list columns. Booleans become bool columns, integers become
+        int64 columns and other numbers become float64 columns, as for ``neo4j-admin import``;
+        properties with values of different types, or of any other type, become string columns.
+        Properties defined as bool in ``_column_types`` always become bool columns.
+
+        Parameters
+        ----------
+        elements: Iterator
+            An iterator of nodes, as (n, data) tuples, or edges, as (u, v, data) tuples
+        required: List[str]
+            Columns that are always part of the schema
+
+        Returns
+        -------
+        pyarrow.Schema
+            The schema
+
+        """
+        pa = _import_pyarrow()
+        arrow_types = {
+            'boolean': pa.bool_(),
+            'long': pa.int64(),
+            'double': pa.float64(),
+            'string': pa.string(),
+        }
+        types = {x: 'string' for x in required}
+        if 'id' in required:
+            # validate_node adds a default category
+            types['category'] = 'string[]'
+        for element in elements:
+            for key, value in element[-1].items():
+                if value is None:
+                    continue
+                types[key] = PandasTransformer._neo4j_type(key, value, types.get(key))
+
+        fields = []
+        for key in PandasTransformer._order_cols(list(types.keys())):
+            t = types[key]
+            if _column_types.get(key) == bool:
+                fields.append(pa.field(key, pa.bool_()))
+            elif t.endswith('[]'):
+                fields.append(pa.field(key, pa.list_(arrow_types[t[:-2]])))
+            else:
+                fields.append(pa.field(key, arrow_types[t]))
+        return pa.schema(fields)
+
+    @staticmethod
+    def _write_records(filename: str, records: Iterator[Dict], schema, compression: str = 'snappy', batch_size: int = 65_536) -> None:
+        """
+        Write records to a Parquet file, one batch of records at a time.
+
+        Parameters
+        ----------
+        filename: str
+            File to write to
+        records: Iterator[Dict]
+            An iterator of records
+        schema: pyarrow.Schema
+            The schema of the file
+        compression: str
+            The compression codec to use (``snappy``, by default)
+        batch_size: int
+            The number of records to write at a time (``65536``, by default)
+
+        """
+        pa = _import_pyarrow()
+        pq = _import_pyarrow_parquet()
+        with pq.ParquetWriter(filename, schema, compression=compression) as writer:
+            for batch in iter(lambda: list(itertools.islice(records, batch_size)), []):
+                columns = []
+                for field in schema:
+                    values = [ParquetTransformer._cast(x.get(field.name), field.type) for x in batch]
+                    columns.append(pa.array(values, type=field.type))
+                writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+
+    @staticmethod
+    def _cast(value, arrow_type):
+        """
+        Cast a value to the Python type corresponding to an Arrow type.
+
+        Parameters
+        ----------
+        value: object
+            A value
+        arrow_type: pyarrow.DataType
+            The Arrow type of the column
+
+        Returns
+        -------
+        object
+            The value cast to str, bool, int or float, or a list of these; ``None`` if the value is missing
+
+        """
+        pa = _import_pyarrow()
+        if value is None or value != value:
+            # missing value or NaN
+            return None
+        if pa.types.is_list(arrow_type):
+            if not isinstance(value, (list, set, tuple)):
+                value = [value]
+            values = [ParquetTransformer._cast(x, arrow_type.value_type) for x in value]
+            return [x for x in values if x is not None]
+        elif pa.types.is_boolean(arrow_type):
+            return bool(value)
+        elif pa.types.is_integer(arrow_type):
+            return int(value)
+        elif pa.types.is_floating(arrow_type):
+            return float(value)
+        else:
+            return str(value)
+
+    @staticmethod
+    def _batch_records(batch) -> Generator[Dict, None, None]:
+        """
+        Generate records from an Arrow record batch, dropping missing values.
+
+        Parameters
+        ----------
+        batch: pyarrow.RecordBatch
+            A batch of records
+
+        Returns
+        -------
+        Generator[Dict, None, None]
+            A generator of records
+
+        """
+        columns = batch.to_pydict()
+        keys = list(columns.keys())
+        for row in zip(*columns.values()):
+            yield {k: v for k, v in zip(keys, row) if v is not None}
+
+
+def _import_pyarrow():
+    """
+    Import pyarrow, which is an optional dependency for ParquetTransformer.
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("ParquetTransformer requires pyarrow; install it with 'pip install pyarrow'")
+    return pyarrow
+
+
+def _import_pyarrow_parquet():
+    """
+    Import pyarrow.parquet, which is an optional dependency for ParquetTransformer.
+    """
+    _import_pyarrow()
+    import pyarrow.parquet
+    return pyarrow.parquet
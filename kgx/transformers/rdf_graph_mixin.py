@@ -9,6 +9,7 @@ from kgx.utils.rdf_utils import property_mapping, process_iri, make_curie, is_pr
 from kgx.utils.kgx_utils import generate_edge_key
 from prefixcommons.curie_util import read_remote_jsonld_context
 from kgx.prefix_manager import PrefixManager
+from kgx.transformers.transformer import Transformer
 
 biolink_prefix_map = read_remote_jsonld_context('https://biolink.github.io/biolink-model/context.jsonld')
 
@@ -31,12 +32,13 @@ class RdfGraphMixin(object):
     BIOLINK = Namespace('https://w3id.org/biolink/')
     DEFAULT_EDGE_LABEL = 'related_to'
 
-    def __init__(self, source_graph: nx.MultiDiGraph = None):
+    def __init__(self, source_graph: nx.MultiDiGraph = None, graph_backend: str = 'networkx', edge_key_strategy: str = 'string'):
         if source_graph:
             self.graph = source_graph
         else:
-            self.graph = nx.MultiDiGraph()
+            self.graph = Transformer.create_graph(graph_backend)
 
+        self.edge_key_strategy = Transformer.check_edge_key_strategy(edge_key_strategy)
         self.graph_metadata = {}
 
     def load_networkx_graph(self, rdfgraph: rdflib.Graph = None, predicates: Set[URIRef] = None, **kwargs) -> None:
@@ -153,7 +155,7 @@ class RdfGraphMixin(object):
         if 'provided_by' in self.graph_metadata:
             kwargs['provided_by'] = self.graph_metadata['provided_by']
 
-        key = generate_edge_key(s, edge_label, o)
+        key = generate_edge_key(s, edge_label, o, self.edge_key_strategy)
         if not self.graph.has_edge(s, o, key=key):
             self.graph.add_edge(s, o, key=key, **kwargs)
 
@@ -235,7 +237,7 @@ class RdfGraphMixin(object):
             edge_label = process_iri(predicate_iri)
             if PrefixManager.is_curie(edge_label):
                 edge_label = curie_lookup(edge_label)
-            edge_key = generate_edge_key(subject_curie, edge_label, object_curie)
+            edge_key = generate_edge_key(subject_curie, edge_label, object_curie, self.edge_key_strategy)
             attr_dict = self.graph.get_edge_data(subject_curie, object_curie, key=edge_key)
             self._add_attribute(attr_dict, key, value)
 
@@ -1,16 +1,17 @@
-import click, rdflib, logging, os, uuid
+import click, rdflib, logging, os, uuid, time, gzip, weakref
 import networkx as nx
-from typing import Tuple, Union, Set, List, Dict
+from typing import Tuple, Union, Set, List, Dict, Generator, Optional
 from rdflib import Namespace, URIRef
 from rdflib.namespace import RDF, RDFS, OWL
 from collections import defaultdict
+from cachetools import LRUCache
 from prefixcommons.curie_util import read_remote_jsonld_context
 
 from kgx.prefix_manager import PrefixManager
 from kgx.transformers.transformer import Transformer
 from kgx.transformers.rdf_graph_mixin import RdfGraphMixin
-from kgx.utils.rdf_utils import property_mapping, make_curie, infer_category
-from kgx.utils.kgx_utils import get_toolkit
+from kgx.utils.rdf_utils import property_mapping, make_curie, infer_category, guess_format, read_ntriples, RdfWriter
+from kgx.utils.kgx_utils import get_toolkit, render_edge_key
 
 biolink_prefix_map = read_remote_jsonld_context('https://biolink.github.io/biolink-model/context.jsonld')
 
@@ -34,17 +35,22 @@ class RdfTransformer(RdfGraphMixin, Transformer):
     has_subsequence = URIRef('http://purl.obolibrary.org/obo/RO_0002524')
     is_subsequence_of = URIRef('http://purl.obolibrary.org/obo/RO_0002525')
 
-    def __init__(self, source_graph: nx.MultiDiGraph = None):
-        super().__init__(source_graph)
+    def __init__(self, source_graph: nx.MultiDiGraph = None, graph_backend: str = 'networkx', edge_key_strategy: str = 'string'):
+        super().__init__(source_graph, graph_backend, edge_key_strategy)
         self.ontologies = []
         self.prefix_manager = PrefixManager()
         self.toolkit = get_toolkit()
 
-    def parse(self, filename: str = None, input_format: str = None, provided_by: str = None, predicates: Set[URIRef] = None) -> None:
+    # formats that can be parsed one triple at a time, without a rdflib.Graph
+    STREAMING_FORMATS = ['nt', 'nquads']
+
+    def parse(self, filename: str = None, input_format: str = None, provided_by: str = None, predicates: Set[URIRef] = None, stream: bool = True) -> None:
         """
         Parse a file, containing triples, into a rdflib.Graph
 
         The file can be either a 'turtle' file or any other format supported by rdflib.
+        N-Triples and N-Quads files are streamed, one triple at a time, without a rdflib.Graph.
+        Files with a ``.gz`` extension are decompressed as they are read.
 
         Parameters
         ----------
@@ -55,16 +61,14 @@ class RdfTransformer(RdfGraphMixin, Transformer):
             If ``None`` is provided then the format is guessed using ``rdflib.util.guess_format()``
         provided_by : str
             Define the source providing the input file.
+        predicates: Set[URIRef]
+            A set of rdflib.URIRef representing predicates to be loaded
+        stream: bool
+            Whether to stream N-Triples and N-Quads files (``True``, by default)
 
         """
-        rdfgraph = rdflib.Graph()
-
         if input_format is None:
-            input_format = rdflib.util.guess_format(filename)
-
-        logging.info("Parsing {} with '{}' format".format(filename, input_format))
-        rdfgraph.parse(filename, format=input_format)
-        logging.info("{} parsed with {} triples".format(filename, len(rdfgraph)))
+            input_format = guess_format(filename)
 
         # TODO: use source from RDF
         if provided_by:
@@ -75,10 +79,63 @@ class RdfTransformer(RdfGraphMixin, Transformer):
             elif hasattr(filename, 'name'):
                 self.graph_metadata['provided_by'] = [filename.name]
 
-        self.load_networkx_graph(rdfgraph, predicates)
-        self.load_node_attributes(rdfgraph)
+        if stream and input_format in self.STREAMING_FORMATS and isinstance(filename, str):
+            self.parse_stream(filename, input_format, predicates)
+        else:
+            rdfgraph = rdflib.Graph()
+            logging.info("Parsing {} with '{}' format".format(filename, input_format))
+            if isinstance(filename, str) and filename.endswith('.gz'):
+                with gzip.open(filename, 'rb') as f:
+                    rdfgraph.parse(f, format=input_format)
+            else:
+                rdfgraph.parse(filename, format=input_format)
+            logging.info("{} parsed with {} triples".format(filename, len(rdfgraph)))
+
+            self.load_networkx_graph(rdfgraph, predicates)
+            self.load_node_attributes(rdfgraph)
         self.report()
 
+    def parse_stream(self, filename: str, input_format: str = 'nt', predicates: Set[URIRef] = None) -> None:
+        """
+        Parse a N-Triples or a N-Quads file one triple at a time, and load triples,
+        as nodes and edges, into networkx.MultiDiGraph as they are read.
+
+        Only the triples needed to attach node attributes and categories
+        are kept until the whole file is read.
+
+        Parameters
+        ----------
+        filename : str
+            File to read from.
+        input_format : str
+            The input file format; either ``nt`` or ``nquads``
+        predicates: Set[URIRef]
+            A set of rdflib.URIRef representing predicates to be loaded
+
+        """
+        predicates = self.get_predicates(predicates)
+        # triples that may become node attributes, by subject
+        node_triples = defaultdict(list)
+        # subClassOf triples, for inferring categories
+        subclass_graph = rdflib.Graph()
+
+        logging.info("Streaming {} with '{}' format".format(filename, input_format))
+        start = time.time()
+        count = 0
+        # lines with any other predicate, and a non-literal object, are skipped before they are parsed
+        keep = predicates.union(property_mapping.keys(), [RDFS.subClassOf])
+        for s, p, o in read_ntriples(filename, input_format, predicates=keep, literals=True):
+            count += 1
+            self.load_triple(s, p, o, predicates)
+            if p in property_mapping or isinstance(o, rdflib.term.Literal):
+                node_triples[s].append((p, o))
+            if p == RDFS.subClassOf:
+                subclass_graph.add((s, p, o))
+        elapsed = time.time() - start
+        logging.info("{} streamed with {} relevant triples in {:.2f}s ({:.0f} triples/s)".format(filename, count, elapsed, count / elapsed if elapsed else 0))
+
+        self.load_node_attributes(subclass_graph, node_triples)
+
     def add_ontology(self, file: str) -> None:
         """
         Load an ontology OWL into a Rdflib.Graph
@@ -114,32 +171,72 @@ class RdfTransformer(RdfGraphMixin, Transformer):
         kwargs: dict
             Any additional arguments
 
+        """
+        predicates = self.get_predicates(predicates)
+        logging.info("Loading from rdflib.Graph to networkx.MultiDiGraph")
+        # only the triples with one of the predicates are looked up, via the predicate index of rdflib.Graph
+        with click.progressbar(sorted(predicates), label='Progress') as bar:
+            for predicate in bar:
+                for s, p, o in rdfgraph.triples((None, predicate, None)):
+                    self.load_triple(s, p, o, predicates)
+
+    def get_predicates(self, predicates: Set[URIRef] = None) -> Set[URIRef]:
+        """
+        Get the predicates to be loaded, as described in ``load_networkx_graph``,
+        as a set of rdflib.URIRef.
+
+        Predicates are matched exactly, and thus predicates given as strings
+        are converted to rdflib.URIRef.
+
+        Parameters
+        ----------
+        predicates: Set[URIRef]
+            A set of rdflib.URIRef representing predicates to be loaded
+
+        Returns
+        -------
+        Set[URIRef]
+            ``predicates``, or the default predicates if ``predicates`` is ``None``
+
         """
         if predicates is None:
             predicates = set()
             predicates = predicates.union(self.OWL_PREDICATES, [self.is_about, self.is_subsequence_of, self.has_subsequence])
+        return {x if isinstance(x, URIRef) else URIRef(x) for x in predicates}
+
+    def load_triple(self, s: URIRef, p: URIRef, o: URIRef, predicates: Set[URIRef]) -> None:
+        """
+        Load a triple into networkx.MultiDiGraph, if its predicate is one of ``predicates``.
+
+        Parameters
+        ----------
+        s: rdflib.URIRef
+            Subject of the triple
+        p: rdflib.URIRef
+            Predicate of the triple
+        o: rdflib.URIRef
+            Object of the triple
+        predicates: Set[URIRef]
+            A set of rdflib.URIRef representing predicates to be loaded
 
-        triples = rdfgraph.triples((None, None, None))
-        logging.info("Loading from rdflib.Graph to networkx.MultiDiGraph")
-        with click.progressbar(list(triples), label='Progress') as bar:
-            for s, p, o in bar:
-                if (p == self.is_about) and (p in predicates):
-                    logging.debug("Loading is_about predicate")
-                    # if predicate is 'is_about' then treat object as publication
-                    self.add_node_attribute(o, key=s, value='publications')
-                elif (p == self.is_subsequence_of) and (p in predicates):
-                    logging.debug("Loading is_subsequence_of predicate")
-                    # if predicate is 'is_subsequence_of'
-                    self.add_edge(s, o, self.is_subsequence_of)
-                elif (p == self.has_subsequence) and (p in predicates):
-                    logging.debug("Loading has_subsequence predicate")
-                    # if predicate is 'has_subsequence', interpret the inverse relation 'is_subsequence_of'
-                    self.add_edge(o, s, self.is_subsequence_of)
-                elif any(p.lower() == x.lower() for x in predicates):
-                    logging.debug("Loading {} predicate".format(p))
-                    self.add_edge(s, o, p)
-
-    def load_node_attributes(self, rdfgraph: rdflib.Graph) -> None:
+        """
+        if (p == self.is_about) and (p in predicates):
+            logging.debug("Loading is_about predicate")
+            # if predicate is 'is_about' then treat object as publication
+            self.add_node_attribute(o, key=s, value='publications')
+        elif (p == self.is_subsequence_of) and (p in predicates):
+            logging.debug("Loading is_subsequence_of predicate")
+            # if predicate is 'is_subsequence_of'
+            self.add_edge(s, o, self.is_subsequence_of)
+        elif (p == self.has_subsequence) and (p in predicates):
+            logging.debug("Loading has_subsequence predicate")
+            # if predicate is 'has_subsequence', interpret the inverse relation 'is_subsequence_of'
+            self.add_edge(o, s, self.is_subsequence_of)
+        elif p in predicates:
+            logging.debug("Loading {} predicate".format(p))
+            self.add_edge(s, o, p)
+
+    def load_node_attributes(self, rdfgraph: rdflib.Graph, node_triples: Dict[URIRef, List[Tuple]] = None) -> None:
         """
         This method loads the properties of nodes into networkx.MultiDiGraph
         As there can be many values for a single key, all properties are lists by default.
@@ -151,34 +248,45 @@ class RdfTransformer(RdfGraphMixin, Transformer):
         ----------
         rdfgraph: rdflib.Graph
             Graph containing nodes and edges
+        node_triples: Dict[URIRef, List[Tuple]]
+            The (predicate, object) pairs of every subject, to use instead of the triples in ``rdfgraph``.
+            In which case, ``rdfgraph`` only needs to contain the ``subClassOf`` triples for inferring categories.
 
         """
         logging.info("Loading node attributes from rdflib.Graph into networkx.MultiDiGraph")
-        with click.progressbar(self.graph.nodes(data=True), label='Progress') as bar:
-            for n, data in bar:
-                if 'id' not in data:
-                    data['id'] = n
-                if 'iri' in data:
-                    uriref = URIRef(data['iri'])
-                else:
-                    provided_by = self.graph_metadata.get('provided_by')
-                    logging.warning("No 'iri' property for {} provided by {}".format(n, provided_by))
-                    continue
+        nodes = {}
+        for n, data in self.graph.nodes(data=True):
+            if 'id' not in data:
+                data['id'] = n
+            if 'iri' in data:
+                nodes[URIRef(data['iri'])] = n
+            else:
+                provided_by = self.graph_metadata.get('provided_by')
+                logging.warning("No 'iri' property for {} provided by {}".format(n, provided_by))
 
-                for s, p, o in rdfgraph.triples((uriref, None, None)):
-                    if p in property_mapping:
-                        # predicate corresponds to a property on subject
-                        if not (isinstance(s, rdflib.term.BNode) and isinstance(o, rdflib.term.BNode)):
-                            # neither subject nor object is a BNode
-                            if isinstance(o, rdflib.term.Literal):
-                                o = o.value
-                            self.add_node_attribute(uriref, key=p, value=o)
-                    elif isinstance(o, rdflib.term.Literal):
-                        # object is a Literal
-                        # i.e. predicate corresponds to a property on subject
-                        self.add_node_attribute(uriref, key=p, value=o.value)
-
-                categories = infer_category(uriref, rdfgraph)
+        if node_triples is None:
+            # a single pass over all triples, rather than a lookup for each node
+            triples = (t for t in rdfgraph.triples((None, None, None)) if t[0] in nodes)
+        else:
+            triples = ((uriref, p, o) for uriref in nodes for p, o in node_triples.get(uriref, []))
+        for s, p, o in triples:
+            if p in property_mapping:
+                # predicate corresponds to a property on subject
+                if not (isinstance(s, rdflib.term.BNode) and isinstance(o, rdflib.term.BNode)):
+                    # neither subject nor object is a BNode
+                    if isinstance(o, rdflib.term.Literal):
+                        o = o.value
+                    self.add_node_attribute(s, key=p, value=o)
+            elif isinstance(o, rdflib.term.Literal):
+                # object is a Literal
+                # i.e. predicate corresponds to a property on subject
+                self.add_node_attribute(s, key=p, value=o.value)
+
+        # the subClassOf closure of each class is computed once, and shared by all of its subclasses
+        closure_cache = {}
+        with click.progressbar(nodes, label='Progress') as bar:
+            for uriref in bar:
+                categories = infer_category(uriref, rdfgraph, closure_cache)
                 logging.debug("Inferred '{}' as category for node '{}'".format(categories, uriref))
                 for category in categories:
                     self.add_node_attribute(uriref, key='category', value=category)
@@ -193,6 +301,12 @@ class ObanRdfTransformer(RdfTransformer):
 
     """
 
+    # dereifying OBAN.association triples requires a rdflib.Graph
+    STREAMING_FORMATS = []
+
+    # serialization plans for attributes, by toolkit, along with the Biolink Model version they are for
+    attribute_plans = weakref.WeakKeyDictionary()
+
     def load_networkx_graph(self, rdfgraph: rdflib.Graph = None, predicates: Set[URIRef] = None, **kwargs) -> None:
         """
         Walk through the rdflib.Graph and load all triples into networkx.MultiDiGraph
@@ -277,6 +391,54 @@ class ObanRdfTransformer(RdfTransformer):
             uri = self.prefix_manager.expand(identifier)
         return URIRef(uri)
 
+    def get_attribute_plans(self) -> Dict[str, Optional['AttributePlan']]:
+        """
+        Get the serialization plans for attributes, for the current toolkit and Biolink Model version.
+
+        Plans are shared by all instances of ObanRdfTransformer with the same toolkit,
+        like the one of ``get_toolkit()``, and are only computed again if the toolkit
+        or its Biolink Model version changes. Plans are dropped along with their toolkit.
+
+        Returns
+        -------
+        Dict[str, Optional[AttributePlan]]
+            A dictionary of attribute name to plan, where the plan is ``None`` for attributes that are not saved
+
+        """
+        version = self.toolkit.generator.schema.version
+        entry = ObanRdfTransformer.attribute_plans.get(self.toolkit)
+        if entry is None or entry[0] != version:
+            entry = ObanRdfTransformer.attribute_plans[self.toolkit] = (version, {})
+        return entry[1]
+
+    def get_attribute_plan(self, key: str) -> Optional['AttributePlan']:
+        """
+        Get the serialization plan for an attribute.
+
+        Parameters
+        ----------
+        key: str
+            The name of the attribute
+
+        Returns
+        -------
+        Optional[AttributePlan]
+            The plan, or ``None`` if the attribute is not saved
+
+        """
+        plans = self.get_attribute_plans()
+        if key not in plans:
+            plan = None
+            element = self.toolkit.get_element(key)
+            if element is not None and (element.is_a == 'association slot' or element.is_a == 'node property'):
+                if key in property_mapping:
+                    predicate = property_mapping[key]
+                else:
+                    predicate = URIRef('{}{}'.format(BIOLINK, element.name.replace(' ', '_')))
+                plan = AttributePlan(predicate, element.range)
+            plans[key] = plan
+        return plans[key]
+
     def save_attribute(self, rdfgraph: rdflib.Graph, object_iri: URIRef, key: str, value: Union[List[str], str]) -> None:
         """
         Saves a node or edge attributes from networkx.MultiDiGraph into rdflib.Graph
@@ -295,47 +457,75 @@ class ObanRdfTransformer(RdfTransformer):
             The value of the attribute; Can be either a List or just a string
 
         """
-        element = self.toolkit.get_element(key)
-        if element is None:
-            return
-        if element.is_a == 'association slot' or element.is_a == 'node property':
-            if key in property_mapping:
-                key = property_mapping[key]
-            else:
-                key = URIRef('{}{}'.format(BIOLINK, element.name.replace(' ', '_')))
-            if not isinstance(value, (list, tuple, set)):
-                value = [value]
-            for value in value:
-                if element.range == 'iri type':
-                    value = URIRef('{}{}'.format(BIOLINK, ''.join(value.title().split(' '))))
-                rdfgraph.add((object_iri, key, rdflib.term.Literal(value)))
+        for triple in self.attribute_triples(object_iri, key, value):
+            rdfgraph.add(triple)
 
-    def save(self, filename: str = None, output_format: str = "turtle", **kwargs) -> None:
+    def attribute_triples(self, object_iri: URIRef, key: str, value: Union[List[str], str]) -> List[Tuple]:
         """
-        Transform networkx.MultiDiGraph into rdflib.Graph that follow OBAN-style reification and export
-        this graph as a file (``turtle``, by default).
+        Get the triples that represent a node or edge attribute from networkx.MultiDiGraph
 
         Parameters
         ----------
-        filename: str
-            Filename to write to
-        output_format: str
-            The output format; default: ``turtle``
-        kwargs: dict
-            Any additional arguments
+        object_iri: rdflib.URIRef
+            IRI of an object in the graph
+        key: str
+            The name of the attribute
+        value: Union[List[str], str]
+            The value of the attribute; Can be either a List or just a string
+
+        Returns
+        -------
+        List[Tuple]
+            A list of (subject, predicate, object) triples
 
         """
-        # Make a new rdflib.Graph() instance to generate RDF triples
-        rdfgraph = rdflib.Graph()
+        plan = self.get_attribute_plan(key)
+        if plan is None:
+            return []
+        return plan.triples(object_iri, value)
 
-        # Register OBAN URL prefix (http://purl.org/oban/) as `OBAN` in the namespace.
-        rdfgraph.bind('OBAN', str(OBAN))
+    def association_id(self, u: str, v: str, key, data: Dict) -> URIRef:
+        """
+        Get the IRI of the OBAN.association for an edge.
 
-        # <http://purl.obolibrary.org/obo/RO_0002558> is currently stored as OBO:RO_0002558 rather than RO:0002558
-        # because of the bug in rdflib. See https://github.com/RDFLib/rdflib/issues/632
-        rdfgraph.bind('OBO', str(OBO))
-        rdfgraph.bind('biolink', str(BIOLINK))
+        The ``id`` of the edge is used, if defined. Otherwise, the IRI is a
+        UUID derived from the subject, key and object of the edge, such that
+        the same edge always yields the same IRI.
+
+        Parameters
+        ----------
+        u: str
+            Subject of the edge
+        v: str
+            Object of the edge
+        key: Hashable
+            Key of the edge
+        data: Dict
+            Attributes of the edge
+
+        Returns
+        -------
+        rdflib.URIRef
+            IRI of the association
+
+        """
+        if 'id' in data and data['id'] is not None:
+            return URIRef(data['id'])
+        name = '{}|{}|{}'.format(u, render_edge_key(u, v, key, data.get('edge_label')), v)
+        return URIRef('urn:uuid:{}'.format(uuid.uuid5(uuid.NAMESPACE_URL, name)))
+
+    def export_triples(self) -> Generator[List[Tuple], None, None]:
+        """
+        Export networkx.MultiDiGraph as triples that follow OBAN-style reification,
+        one node or one edge at a time.
+
+        Returns
+        -------
+        Generator[List[Tuple], None, None]
+            A generator of lists of (subject, predicate, object) triples, where each list
+            represents a node, or an edge as an OBAN.association
 
+        """
         # saving all nodes
         for n, data in self.graph.nodes(data=True):
             if 'iri' not in n:
@@ -343,32 +533,128 @@ class ObanRdfTransformer(RdfTransformer):
             else:
                 uriRef = URIRef(data['iri'])
 
+            triples = []
             for key, value in data.items():
                 if key not in ['id', 'iri']:
-                    self.save_attribute(rdfgraph, uriRef, key=key, value=value)
+                    triples.extend(self.attribute_triples(uriRef, key=key, value=value))
+            yield triples
 
         # saving all edges
-        for u, v, data in self.graph.edges(data=True):
+        for u, v, k, data in self.graph.edges(keys=True, data=True):
             if 'relation' not in data:
                 raise Exception('Relation is a required edge property in the biolink model, edge {} --> {}'.format(u, v))
 
-            if 'id' in data and data['id'] is not None:
-                assoc_id = URIRef(data['id'])
-            else:
-                # generating a UUID for association
-                assoc_id = URIRef('urn:uuid:{}'.format(uuid.uuid4()))
-
-            rdfgraph.add((assoc_id, RDF.type, OBAN.association))
-            rdfgraph.add((assoc_id, OBAN.association_has_subject, self.uriref(u)))
-            rdfgraph.add((assoc_id, OBAN.association_has_predicate, self.uriref(data['relation'])))
-            rdfgraph.add((assoc_id, OBAN.association_has_object, self.uriref(v)))
-
+            assoc_id = self.association_id(u, v, k, data)
+            triples = [
+                (assoc_id, RDF.type, OBAN.association),
+                (assoc_id, OBAN.association_has_subject, self.uriref(u)),
+                (assoc_id, OBAN.association_has_predicate, self.uriref(data['relation'])),
+                (assoc_id, OBAN.association_has_object, self.uriref(v)),
+            ]
             for key, value in data.items():
                 if key not in ['subject', 'relation', 'object']:
-                    self.save_attribute(rdfgraph, assoc_id, key=key, value=value)
+                    triples.extend(self.attribute_triples(assoc_id, key=key, value=value))
+            yield triples
+
+    def save(self, filename: str = None, output_format: str = "turtle", stream: bool = True, **kwargs) -> None:
+        """
+        Transform networkx.MultiDiGraph into triples that follow OBAN-style reification and export
+        them to a file (``turtle``, by default).
+
+        N-Triples (``nt``) and Turtle (``turtle`` or ``ttl``) are written one node
+        and one edge at a time. Any other format supported by rdflib is written
+        via a rdflib.Graph that contains all triples.
+
+        Parameters
+        ----------
+        filename: str
+            Filename to write to
+        output_format: str
+            The output format; default: ``turtle``
+        stream: bool
+            Whether to write N-Triples and Turtle without a rdflib.Graph (``True``, by default)
+        kwargs: dict
+            Any additional arguments
+
+        """
+        # Register OBAN URL prefix (http://purl.org/oban/) as `OBAN` in the namespace.
+        # <http://purl.obolibrary.org/obo/RO_0002558> is currently stored as OBO:RO_0002558 rather than RO:0002558
+        # because of the bug in rdflib. See https://github.com/RDFLib/rdflib/issues/632
+        namespaces = {
+            'OBAN': str(OBAN),
+            'OBO': str(OBO),
+            'biolink': str(BIOLINK),
+        }
+
+        if stream and output_format in RdfWriter.FORMATS:
+            with open(filename, 'w', encoding='utf-8') as fh:
+                writer = RdfWriter(fh, output_format, namespaces)
+                for triples in self.export_triples():
+                    writer.write(triples)
+        else:
+            # Make a new rdflib.Graph() instance to generate RDF triples
+            rdfgraph = rdflib.Graph()
+            for prefix, namespace in namespaces.items():
+                rdfgraph.bind(prefix, namespace)
+            for triples in self.export_triples():
+                for triple in triples:
+                    rdfgraph.add(triple)
+
+            # Serialize the graph into the file.
+            rdfgraph.serialize(destination=filename, format=output_format)
+
+
+class AttributePlan(object):
+    """
+    How an attribute is serialized as triples, as determined by its Biolink Model element.
+
+    Parameters
+    ----------
+    predicate: rdflib.URIRef
+        The predicate for the attribute
+    range: str
+        The range of the attribute
+    maxsize: int
+        The maximum number of IRIs to keep for the values of an ``iri type`` attribute
 
-        # Serialize the graph into the file.
-        rdfgraph.serialize(destination=filename, format=output_format)
+    """
+
+    __slots__ = ('predicate', 'range', 'iri_values')
+
+    def __init__(self, predicate: URIRef, range: str, maxsize: int = 1024):
+        self.predicate = predicate
+        self.range = range
+        # values of 'iri type' attributes, like category, mostly come from a small set
+        self.iri_values = LRUCache(maxsize) if range == 'iri type' else None
+
+    def triples(self, object_iri: URIRef, value: Union[List[str], str]) -> List[Tuple]:
+        """
+        Get the triples that represent a value of the attribute.
+
+        Parameters
+        ----------
+        object_iri: rdflib.URIRef
+            IRI of an object in the graph
+        value: Union[List[str], str]
+            The value of the attribute; Can be either a List or just a string
+
+        Returns
+        -------
+        List[Tuple]
+            A list of (subject, predicate, object) triples
+
+        """
+        if not isinstance(value, (list, tuple, set)):
+            value = [value]
+        if self.iri_values is None:
+            return [(object_iri, self.predicate, rdflib.term.Literal(x)) for x in value]
+        triples = []
+        for x in value:
+            iri = self.iri_values.get(x)
+            if iri is None:
+                iri = self.iri_values[x] = rdflib.term.Literal(URIRef('{}{}'.format(BIOLINK, ''.join(x.title().split(' ')))))
+            triples.append((object_iri, self.predicate, iri))
+        return triples
 
 
 class RdfOwlTransformer(RdfTransformer):
@@ -376,6 +662,9 @@ class RdfOwlTransformer(RdfTransformer):
     Transformer that parses an OWL ontology in RDF, while retaining class-class relationships.
     """
 
+    # resolving OWL restrictions requires a rdflib.Graph
+    STREAMING_FORMATS = []
+
     def load_networkx_graph(self, rdfgraph: rdflib.Graph = None, predicates: Set[URIRef] = None, **kwargs) -> None:
         """
         Walk through the rdflib.Graph and load all triples into networkx.MultiDiGraph
@@ -1,16 +1,111 @@
+import os
 import logging
-from typing import Dict, List
+from typing import Dict, List, Tuple, Generator, IO
 
 from kgx import PandasTransformer
-from kgx.transformers.json_transformer import JsonTransformer
-from kgx.utils.kgx_utils import generate_edge_key
+from kgx.transformers.json_transformer import JsonTransformer, _JsonStreamReader
 
 
 class RsaTransformer(JsonTransformer):
     """
     Transformer that parses a Reasoner Std API format JSON and loads nodes and edges into a networkx.MultiDiGraph
+
+    Input can be a single message, a stream of concatenated messages, or a directory of messages.
+    Messages are read one at a time, and thus memory usage is bounded by the size of the largest message.
     """
 
+    def parse(self, filename: str, input_format: str = 'json', provided_by: str = None, **kwargs) -> None:
+        """
+        Parse one or more Reasoner Std API messages, one message at a time.
+
+        Parameters
+        ----------
+        filename: str
+            File to read from; either a single message, a stream of concatenated messages,
+            or a directory, in which case every ``.json`` file in the directory is parsed
+        input_format: str
+            The input file format (``json``, by default)
+        provided_by: str
+            Define the source providing the input file
+        kwargs: dict
+            Any additional arguments
+
+        """
+        if provided_by:
+            self.graph_metadata['provided_by'] = [provided_by]
+        if os.path.isdir(filename):
+            filenames = [os.path.join(filename, x) for x in sorted(os.listdir(filename)) if x.endswith('.json')]
+        else:
+            filenames = [filename]
+
+        for f in filenames:
+            logging.info("Parsing {}".format(f))
+            with open(f, 'r') as FH:
+                for nodes, edges in RsaTransformer.read_messages(FH):
+                    self.load_nodes(nodes)
+                    self.load_edges(edges)
+
+    def read(self, fh: IO[str], input_format: str = 'json') -> Generator[Tuple[str, Dict], None, None]:
+        """
+        Read nodes and edges from the ``knowledge_graph`` of one or more Reasoner Std API messages, one record at a time.
+
+        Parameters
+        ----------
+        fh: IO[str]
+            The file handle to read from
+        input_format: str
+            The input file format (``json``, by default)
+
+        Returns
+        -------
+        Generator[Tuple[str, Dict], None, None]
+            A generator of (record type, record) tuples, where the record type is either ``nodes`` or ``edges``
+
+        """
+        for nodes, edges in RsaTransformer.read_messages(fh):
+            yield from (('nodes', x) for x in nodes)
+            yield from (('edges', x) for x in edges)
+
+    @staticmethod
+    def read_messages(fh: IO[str], chunk_size: int = 1 << 16) -> Generator[Tuple[List[Dict], List[Dict]], None, None]:
+        """
+        Incrementally read Reasoner Std API messages from a file handle.
+
+        The file handle can contain a single message, messages that are concatenated
+        (optionally separated by whitespace, like JSON Lines), or a JSON array of messages.
+        Only the ``knowledge_graph`` of each message is kept; all other fields,
+        like ``query_graph`` and ``results``, are skipped by scanning for their closing brackets, without being decoded.
+
+        Parameters
+        ----------
+        fh: IO[str]
+            The file handle to read from
+        chunk_size: int
+            The number of characters to read from ``fh`` at a time
+
+        Returns
+        -------
+        Generator[Tuple[List[Dict], List[Dict]], None, None]
+            A generator of (nodes, edges) tuples, one for each message
+
+        """
+        reader = _JsonStreamReader(fh, chunk_size)
+        while True:
+            c = reader.peek()
+            if c == '':
+                return
+            elif c in '[,]':
+                reader.pos += 1
+                continue
+            nodes = []
+            edges = []
+            for record_type, record in reader.read_object((), ('knowledge_graph',)):
+                if record_type == 'nodes':
+                    nodes.append(record)
+                else:
+                    edges.append(record)
+            yield nodes, edges
+
     def load(self, obj: Dict[str, List]) -> None:
         """
         Load a Reasoner Std API format JSON object, containing nodes and edges, into networkx.MultiDiGraph
@@ -29,6 +124,40 @@ class RsaTransformer(JsonTransformer):
         if 'edges' in obj['knowledge_graph']:
             self.load_edges(obj['knowledge_graph']['edges'])
 
+    def load_nodes(self, nodes: List[Dict]) -> None:
+        """
+        Load a list of nodes into a networkx.MultiDiGraph
+
+        .. Note::
+            This method transforms Reasoner Std API format fields to Biolink Model fields.
+
+        Parameters
+        ----------
+        nodes: list
+            List of nodes
+
+        """
+        logging.info("Loading {} nodes into networkx.MultiDiGraph".format(len(nodes)))
+        for node in nodes:
+            PandasTransformer.load_node(self, RsaTransformer.rename_node(node))
+
+    def load_edges(self, edges: List[Dict]) -> None:
+        """
+        Load a list of edges into a networkx.MultiDiGraph
+
+        .. Note::
+            This method transforms Reasoner Std API format fields to Biolink Model fields.
+
+        Parameters
+        ----------
+        edges: list
+            List of edges
+
+        """
+        logging.info("Loading {} edges into networkx.MultiDiGraph".format(len(edges)))
+        for edge in edges:
+            PandasTransformer.load_edge(self, RsaTransformer.rename_edge(edge))
+
     def load_node(self, node: dict) -> None:
         """
         Load a node into networkx.MultiDiGraph
@@ -42,18 +171,7 @@ class RsaTransformer(JsonTransformer):
             A node
 
         """
-
-        if 'type' in node and 'category' not in node:
-            node['category'] = node['type']
-            del node['type']
-
-        node = self.validate_node(node)
-        kwargs = PandasTransformer._build_kwargs(node.copy())
-        if 'id' in kwargs:
-            n = kwargs['id']
-            self.graph.add_node(n, **kwargs)
-        else:
-            logging.info("Ignoring node with no 'id': {}".format(node))
+        PandasTransformer.load_node(self, RsaTransformer.rename_node(node))
 
     def load_edge(self, edge: Dict) -> None:
         """
@@ -67,6 +185,47 @@ class RsaTransformer(JsonTransformer):
         edge : dict
             An edge
 
+        """
+        PandasTransformer.load_edge(self, RsaTransformer.rename_edge(edge))
+
+    @staticmethod
+    def rename_node(node: Dict) -> Dict:
+        """
+        Rename Reasoner Std API node fields to Biolink Model fields, in place,
+        where ``type`` becomes ``category``.
+
+        Parameters
+        ----------
+        node: Dict
+            A node
+
+        Returns
+        -------
+        Dict
+            The same node
+
+        """
+        if 'type' in node and 'category' not in node:
+            node['category'] = node.pop('type')
+        return node
+
+    @staticmethod
+    def rename_edge(edge: Dict) -> Dict:
+        """
+        Rename Reasoner Std API edge fields to Biolink Model fields, in place,
+        where ``source_id`` and ``target_id`` become ``subject`` and ``object``,
+        and the first ``relation_label`` becomes ``edge_label``.
+
+        Parameters
+        ----------
+        edge: Dict
+            An edge
+
+        Returns
+        -------
+        Dict
+            The same edge
+
         """
         if 'source_id' in edge:
             edge['subject'] = edge['source_id']
@@ -74,13 +233,4 @@ class RsaTransformer(JsonTransformer):
             edge['object'] = edge['target_id']
         if 'relation_label' in edge:
             edge['edge_label'] = edge['relation_label'][0]
-
-        edge = self.validate_edge(edge)
-        kwargs = PandasTransformer._build_kwargs(edge.copy())
-        if 'subject' in kwargs and 'object' in kwargs:
-            s = kwargs['subject']
-            o = kwargs['object']
-            key = generate_edge_key(s, kwargs['edge_label'], o)
-            self.graph.add_edge(s, o, key, **kwargs)
-        else:
-            logging.info("Ignoring edge with either a missing 'subject' or 'object': {}".format(kwargs))
+        return edge
@@ -1,22 +1,52 @@
+import io
+import re
+import csv
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
 
 import rdflib
+import requests
 from rdflib import URIRef
 from requests import HTTPError
+from requests.adapters import HTTPAdapter
 import networkx as nx
-from typing import Set, List, Dict, Generator
+from typing import Set, List, Dict, Generator, Iterable, IO, Optional
 
 from pystache import render
-from SPARQLWrapper import SPARQLWrapper, JSON, POSTDIRECTLY
-from itertools import zip_longest
+from itertools import zip_longest, islice
 from kgx.transformers.transformer import Transformer
 from kgx.transformers.rdf_graph_mixin import RdfGraphMixin
+from kgx.transformers.json_transformer import _JsonStreamReader
+from kgx.utils.sparql_utils import SparqlResultCache
+
+
+SPARQL_RESULT_FORMATS = {
+    'json': 'application/sparql-results+json',
+    'tsv': 'text/tab-separated-values',
+    'csv': 'text/csv',
+}
+
+XSD = 'http://www.w3.org/2001/XMLSchema#'
+
+_tsv_literal = re.compile(r'^"((?:[^"\\]|\\.)*)"(?:@([A-Za-z0-9-]+)|\^\^<([^>]*)>)?$')
+_tsv_escape = re.compile(r'\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))')
+_tsv_escapes = {'t': '\t', 'n': '\n', 'r': '\r', 'b': '\b', 'f': '\f'}
+_csv_iri = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*:[^\s]*$')
 
 
 class SparqlTransformer(RdfGraphMixin, Transformer):
     """
     Transformer for communicating with a SPARQL endpoint.
 
+    All queries to the endpoint share a HTTP session, with a pool of up to ``workers`` connections
+    that are kept alive between queries. If a ``cache`` is given, the results of queries
+    are cached on disk, and repeated queries are answered from the cache.
+
+    Results are requested in ``result_format`` (``json``, ``tsv`` or ``csv``) and are parsed
+    as they are received, one binding at a time. ``tsv`` is the most compact format that
+    preserves the type of each value; ``csv`` is more compact still, but types are guessed.
+
     """
 
     # TODO: fix query
@@ -43,10 +73,17 @@ class SparqlTransformer(RdfGraphMixin, Transformer):
 
     """
 
-    def __init__(self, source_graph: nx.MultiDiGraph = None, url: str = None):
-        super().__init__(source_graph)
+    def __init__(self, source_graph: nx.MultiDiGraph = None, url: str = None, graph_backend: str = 'networkx', edge_key_strategy: str = 'string', workers: int = 1, cache: SparqlResultCache = None, result_format: str = 'json'):
+        super().__init__(source_graph, graph_backend, edge_key_strategy)
         # set the URL for SPARQL endpoint
         self.url = url
+        # the number of queries to run concurrently
+        self.workers = max(workers, 1)
+        self.session = None
+        self.cache = cache
+        if result_format not in SPARQL_RESULT_FORMATS:
+            raise ValueError("Unrecognized SPARQL result format '{}'; expected one of {}".format(result_format, list(SPARQL_RESULT_FORMATS.keys())))
+        self.result_format = result_format
 
     def load_networkx_graph(self, rdfgraph: rdflib.Graph = None, predicates: Set[URIRef] = None, **kwargs) -> None:
         """
@@ -65,8 +102,7 @@ class SparqlTransformer(RdfGraphMixin, Transformer):
         for predicate in predicates:
             predicate = '<{}>'.format(predicate)
             q = render(self.edge_query, {'predicate': predicate})
-            results = self.query(q)
-            for r in results:
+            for r in self.query_iter(q):
                 s = r['subject']['value']
                 p = r['predicate']['value']
                 o = r['object']['value']
@@ -75,10 +111,29 @@ class SparqlTransformer(RdfGraphMixin, Transformer):
                 else:
                     self.add_edge(s, o, p)
 
-    def query(self, q: str) -> Dict:
+    def get_session(self) -> requests.Session:
+        """
+        Get the HTTP session for querying the SPARQL endpoint.
+
+        Returns
+        -------
+        requests.Session
+            A HTTP session, with a pool of up to ``self.workers`` connections
+
+        """
+        if self.session is None:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+        return self.session
+
+    def query(self, q: str) -> List[Dict]:
         """
         Query a SPARQL endpoint.
 
+        This method is safe to call from multiple threads.
+
         Parameters
         ----------
         q: str
@@ -86,18 +141,257 @@ class SparqlTransformer(RdfGraphMixin, Transformer):
 
         Returns
         -------
-        dict
-            A dictionary containing results from the query
+        List[Dict]
+            A list of bindings, one for each result of the query
+
+        """
+        return list(self.query_iter(q))
+
+    def query_iter(self, q: str) -> Generator[Dict, None, None]:
+        """
+        Query a SPARQL endpoint, and yield bindings as they are received.
+
+        The query is sent in the body of a POST request, on a pooled connection,
+        such that queries can be of any length. The response is parsed incrementally,
+        so the whole result set is never held in memory, unless it is to be cached.
+
+        If ``self.cache`` is set, cached results are returned without querying the endpoint.
+        Results are cached for each result format, and results in a format other than
+        the requested one are not cached. In offline mode, a query that is not cached raises a ``KeyError``.
+
+        Parameters
+        ----------
+        q: str
+            The query string
+
+        Returns
+        -------
+        Generator[Dict, None, None]
+            A generator of bindings, one for each result of the query
 
         """
-        sparql = SPARQLWrapper(self.url)
-        sparql.setQuery(q)
-        sparql.setReturnFormat(JSON)
         logging.info("Query: {}".format(q))
-        results = sparql.query().convert()
-        bindings = results['results']['bindings']
-        logging.info("Rows fetched: {}".format(len(bindings)))
-        return bindings
+        if self.cache is not None:
+            bindings = self.cache.get(self.url, q, self.result_format)
+            if bindings is not None:
+                logging.info("Rows fetched from cache: {}".format(len(bindings)))
+                yield from bindings
+                return
+            if self.cache.offline:
+                raise KeyError("No cached results for query to {} in offline mode: {}".format(self.url, q))
+        accept = SPARQL_RESULT_FORMATS[self.result_format]
+        with self.get_session().post(self.url, data={'query': q}, headers={'Accept': accept}, stream=True) as response:
+            response.raise_for_status()
+            # endpoints may ignore the requested format, so the format of the response is taken from its content type
+            content_type = response.headers.get('Content-Type', accept).split(';')[0].strip()
+            result_format = next((k for k, v in SPARQL_RESULT_FORMATS.items() if v == content_type), self.result_format)
+            response.raw.decode_content = True
+            # keep the response open once it is read, such that the text wrapper can tell it is at the end
+            response.raw.auto_close = False
+            fh = io.TextIOWrapper(response.raw, encoding=response.encoding or 'utf-8', newline='' if result_format == 'csv' else None)
+            if self.cache is not None and result_format != self.result_format:
+                logging.warning("Results of query to {} are in {} rather than {}, and are not cached".format(self.url, result_format, self.result_format))
+            bindings = [] if self.cache is not None and result_format == self.result_format else None
+            count = 0
+            for binding in self.read(fh, result_format):
+                count += 1
+                if bindings is not None:
+                    bindings.append(binding)
+                yield binding
+        logging.info("Rows fetched: {}".format(count))
+        if bindings is not None:
+            self.cache.put(self.url, q, bindings, self.result_format)
+
+    def read(self, fh: IO[str], result_format: str = 'json') -> Generator[Dict, None, None]:
+        """
+        Read bindings from SPARQL query results, one binding at a time.
+
+        Parameters
+        ----------
+        fh: IO[str]
+            The file handle to read from
+        result_format: str
+            The format of the results (``json``, ``tsv`` or ``csv``)
+
+        Returns
+        -------
+        Generator[Dict, None, None]
+            A generator of bindings, in the form of SPARQL JSON results
+
+        """
+        if result_format == 'tsv':
+            return SparqlTransformer.read_tsv(fh)
+        elif result_format == 'csv':
+            return SparqlTransformer.read_csv(fh)
+        else:
+            return SparqlTransformer.read_json(fh)
+
+    @staticmethod
+    def read_json(fh: IO[str], chunk_size: int = 1 << 16) -> Generator[Dict, None, None]:
+        """
+        Incrementally read bindings from SPARQL JSON results.
+
+        Parameters
+        ----------
+        fh: IO[str]
+            The file handle to read from
+        chunk_size: int
+            The number of characters to read from ``fh`` at a time
+
+        Returns
+        -------
+        Generator[Dict, None, None]
+            A generator of bindings
+
+        """
+        reader = _JsonStreamReader(fh, chunk_size, arrays=('bindings',))
+        if reader.peek() == '':
+            return
+        for key, binding in reader.read_object((), ('results',)):
+            yield binding
+
+    @staticmethod
+    def read_tsv(fh: IO[str]) -> Generator[Dict, None, None]:
+        """
+        Read bindings from SPARQL TSV results, where values are RDF terms in Turtle syntax.
+
+        Parameters
+        ----------
+        fh: IO[str]
+            The file handle to read from
+
+        Returns
+        -------
+        Generator[Dict, None, None]
+            A generator of bindings, in the form of SPARQL JSON results
+
+        """
+        header = fh.readline()
+        if not header:
+            return
+        variables = [x.lstrip('?$') for x in header.rstrip('\r\n').split('\t')]
+        for line in fh:
+            line = line.rstrip('\r\n')
+            binding = {}
+            for variable, term in zip(variables, line.split('\t')):
+                value = SparqlTransformer.parse_tsv_term(term)
+                if value is not None:
+                    binding[variable] = value
+            yield binding
+
+    @staticmethod
+    def parse_tsv_term(term: str) -> Optional[Dict]:
+        """
+        Parse a RDF term from SPARQL TSV results.
+
+        Parameters
+        ----------
+        term: str
+            A RDF term in Turtle syntax
+
+        Returns
+        -------
+        Optional[Dict]
+            The term, in the form of SPARQL JSON results, or ``None`` if the term is unbound
+
+        """
+        if term == '':
+            return None
+        elif term.startswith('<') and term.endswith('>'):
+            return {'type': 'uri', 'value': term[1:-1]}
+        elif term.startswith('_:'):
+            return {'type': 'bnode', 'value': term[2:]}
+        match = _tsv_literal.match(term)
+        if match:
+            value = _tsv_escape.sub(SparqlTransformer._unescape, match.group(1))
+            d = {'type': 'literal', 'value': value}
+            if match.group(2):
+                d['xml:lang'] = match.group(2)
+            elif match.group(3):
+                d['datatype'] = match.group(3)
+            return d
+        # abbreviated numbers and booleans
+        if term in ('true', 'false'):
+            datatype = 'boolean'
+        elif re.match(r'^[+-]?\d+$', term):
+            datatype = 'integer'
+        elif re.match(r'^[+-]?\d*\.\d+$', term):
+            datatype = 'decimal'
+        else:
+            datatype = 'double'
+        return {'type': 'literal', 'value': term, 'datatype': XSD + datatype}
+
+    @staticmethod
+    def _unescape(match) -> str:
+        if match.group(1) or match.group(2):
+            return chr(int(match.group(1) or match.group(2), 16))
+        return _tsv_escapes.get(match.group(3), match.group(3))
+
+    @staticmethod
+    def read_csv(fh: IO[str]) -> Generator[Dict, None, None]:
+        """
+        Read bindings from SPARQL CSV results.
+
+        .. Note::
+            SPARQL CSV results do not preserve the type of values; values that look
+            like IRIs are taken to be IRIs, values that start with ``_:`` are taken
+            to be blank nodes, and all other values are taken to be literals.
+
+        Parameters
+        ----------
+        fh: IO[str]
+            The file handle to read from
+
+        Returns
+        -------
+        Generator[Dict, None, None]
+            A generator of bindings, in the form of SPARQL JSON results
+
+        """
+        reader = csv.reader(fh)
+        variables = next(reader, None)
+        if variables is None:
+            return
+        for row in reader:
+            binding = {}
+            for variable, value in zip(variables, row):
+                if value == '':
+                    continue
+                elif value.startswith('_:'):
+                    binding[variable] = {'type': 'bnode', 'value': value[2:]}
+                elif _csv_iri.match(value):
+                    binding[variable] = {'type': 'uri', 'value': value}
+                else:
+                    binding[variable] = {'type': 'literal', 'value': value}
+            yield binding
+
+    def query_all(self, executor: ThreadPoolExecutor, queries: Iterable[str]) -> Generator[List[Dict], None, None]:
+        """
+        Run queries concurrently on ``executor``, and yield their results in order.
+
+        Only ``self.workers`` queries run ahead of the results being consumed,
+        such that the results held in memory are bounded, regardless of the number of queries.
+
+        Parameters
+        ----------
+        executor: concurrent.futures.ThreadPoolExecutor
+            The executor to run queries on
+        queries: Iterable[str]
+            The query strings
+
+        Returns
+        -------
+        Generator[List[Dict], None, None]
+            A generator of the bindings of each query
+
+        """
+        queries = iter(queries)
+        pending = deque(executor.submit(self.query, q) for q in islice(queries, self.workers))
+        while pending:
+            bindings = pending.popleft().result()
+            for q in islice(queries, 1):
+                pending.append(executor.submit(self.query, q))
+            yield bindings
 
     def get_filters(self) -> Dict:
         """
@@ -228,14 +522,20 @@ class RedSparqlTransformer(SparqlTransformer):
 
     IS_DEFINED_BY = "Team Red"
 
-    def __init__(self, source_graph: nx.MultiDiGraph = None, url: str ='http://graphdb.dumontierlab.com/repositories/ncats-red-kg'):
-        super().__init__(source_graph, url)
+    def __init__(self, source_graph: nx.MultiDiGraph = None, url: str ='http://graphdb.dumontierlab.com/repositories/ncats-red-kg', graph_backend: str = 'networkx', edge_key_strategy: str = 'string', workers: int = 1, cache: SparqlResultCache = None, result_format: str = 'json'):
+        super().__init__(source_graph, url, graph_backend, edge_key_strategy, workers, cache, result_format)
         self.rdfgraph = rdflib.Graph()
 
     def load_networkx_graph(self, rdfgraph: rdflib.Graph = None, predicates: Set[URIRef] = None, **kwargs: Dict) -> None:
         """
         Fetch all triples using the specified predicates and add them to networkx.MultiDiGraph.
 
+        Pages of triples, and the properties of their nodes, are fetched concurrently,
+        with up to ``self.workers`` queries in flight. Triples are added as each page arrives,
+        while the properties of the nodes of previous pages are still being fetched.
+        With a single worker, queries run one at a time, and triples are added
+        as they are parsed from the response.
+
         Parameters
         ----------
         rdfgraph: rdflib.Graph
@@ -247,39 +547,42 @@ class RedSparqlTransformer(SparqlTransformer):
             Ex: specifying 'limit' argument will limit the number of triples fetched.
 
         """
-        for predicate in predicates:
-            sparql = SPARQLWrapper(self.url)
-            association = '<{}>'.format(predicate)
-            query = render(self.count_query, {'association': association})
-            logging.debug(query)
-            sparql.setQuery(query)
-            sparql.setReturnFormat(JSON)
-            results = sparql.query().convert()
-            count = int(results['results']['bindings'][0]['triples']['value'])
-            logging.info("Expected triples for query: {}".format(count))
-            step = 1000
-            start = 0
-            for i in range(step, count + step, step):
-                end = i
-                query = render(self.edge_query, {'association': association, 'offset': start, 'limit':step})
-                sparql.setQuery(query)
+        step = 1000
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for predicate in predicates:
+                association = '<{}>'.format(predicate)
+                query = render(self.count_query, {'association': association})
+                logging.debug(query)
+                results = self.query(query)
+                count = int(results[0]['triples']['value'])
+                logging.info("Expected triples for query: {}".format(count))
+                offsets = range(0, count, step)
+                if 'limit' in kwargs:
+                    offsets = [x for x in offsets if x < kwargs['limit']]
+                queries = (render(self.edge_query, {'association': association, 'offset': x, 'limit': step}) for x in offsets)
                 logging.debug("Fetching triples with predicate {}".format(predicate))
-                results = sparql.query().convert()
-                node_list = set()
-                for r in results['results']['bindings']:
-                    node_list.add("<{}>".format(r['subject']['value']))
-                    node_list.add("<{}>".format(r['object']['value']))
-                start = end
-                self.load_nodes(node_list)
-                for r in results['results']['bindings']:
-                    s = r['subject']['value']
-                    p = r['predicate']['value']
-                    o = r['object']['value']
-                    self.add_edge(s, o, p)
-                    # TODO: preserve edge properties
-
-                if 'limit' in kwargs and i > kwargs['limit']:
-                    break
+                if self.workers > 1:
+                    pages = self.query_all(executor, queries)
+                else:
+                    # with a single worker, bindings are added as they are parsed from the response
+                    pages = (self.query_iter(q) for q in queries)
+                node_properties = deque()
+                for bindings in pages:
+                    node_list = set()
+                    for r in bindings:
+                        s = r['subject']['value']
+                        p = r['predicate']['value']
+                        o = r['object']['value']
+                        node_list.add("<{}>".format(s))
+                        node_list.add("<{}>".format(o))
+                        self.add_edge(s, o, p)
+                        # TODO: preserve edge properties
+                    node_properties.extend(self.fetch_nodes(executor, node_list))
+                    # load properties that have arrived, and wait for the oldest when too many are in flight
+                    while node_properties and (node_properties[0].done() or len(node_properties) >= self.workers):
+                        self.load_node_properties(node_properties.popleft().result())
+                while node_properties:
+                    self.load_node_properties(node_properties.popleft().result())
 
         self.categorize()
 
@@ -305,37 +608,75 @@ class RedSparqlTransformer(SparqlTransformer):
             A list of node CURIEs
 
         """
-        node_generator = self._grouper(node_set, 10000)
-        nodes = next(node_generator, None)
-        while nodes is not None:
-            logging.info("Fetching properties for {} nodes".format(len(nodes)))
-            nodes = filter(None, nodes)
-            # TODO: is there a better way to fetch node properties?
-            query = self.get_node_properties_query.format(curie_list=' '.join(nodes))
-            logging.info(query)
-            sparql = SPARQLWrapper(self.url)
-            sparql.setRequestMethod(POSTDIRECTLY)
-            sparql.setMethod("POST")
-            sparql.setQuery(query)
-            sparql.setReturnFormat(JSON)
-            node_results = sparql.query().convert()
-            d = {}
-            for r in node_results['results']['bindings']:
-                if r['object']['type'] != 'bnode':
-                    subject = r['subject']['value']
-                    object = r['object']['value']
-                    predicate = r['predicate']['value']
-                    if predicate.startswith('bl:'):
-                        predicate = predicate.split(':')[1]
-                    if subject not in d:
-                        d[subject] = {}
-                    d[subject][predicate] = object
-
-            for node, attr_dict in d.items():
-                for key, value in attr_dict.items():
-                    self.add_node_attribute(node, key=key, value=value)
-            d.clear()
-            nodes = next(node_generator, None)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for future in self.fetch_nodes(executor, node_set):
+                self.load_node_properties(future.result())
+
+    def fetch_nodes(self, executor: ThreadPoolExecutor, node_set: Set) -> List[Future]:
+        """
+        Fetch the properties of nodes, in batches of 10000 nodes, concurrently on ``executor``.
+
+        Parameters
+        ----------
+        executor: concurrent.futures.ThreadPoolExecutor
+            The executor to run queries on
+        node_set: Set
+            A set of node IRIs, of the form ``<iri>``
+
+        Returns
+        -------
+        List[concurrent.futures.Future]
+            A list of futures, one for each batch, whose results are as returned by ``fetch_node_properties``
+
+        """
+        return [executor.submit(self.fetch_node_properties, nodes) for nodes in self._grouper(node_set, 10000)]
+
+    def fetch_node_properties(self, nodes: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Fetch the properties of nodes from the SPARQL endpoint.
+
+        Parameters
+        ----------
+        nodes: Iterable[str]
+            Node IRIs, of the form ``<iri>``
+
+        Returns
+        -------
+        Dict[str, Dict[str, str]]
+            A dictionary of node IRI to its properties
+
+        """
+        nodes = list(filter(None, nodes))
+        logging.info("Fetching properties for {} nodes".format(len(nodes)))
+        # TODO: is there a better way to fetch node properties?
+        query = self.get_node_properties_query.format(curie_list=' '.join(nodes))
+        logging.debug(query)
+        d = {}
+        for r in self.query_iter(query):
+            if r['object']['type'] != 'bnode':
+                subject = r['subject']['value']
+                object = r['object']['value']
+                predicate = r['predicate']['value']
+                if predicate.startswith('bl:'):
+                    predicate = predicate.split(':')[1]
+                if subject not in d:
+                    d[subject] = {}
+                d[subject][predicate] = object
+        return d
+
+    def load_node_properties(self, d: Dict[str, Dict[str, str]]) -> None:
+        """
+        Add properties of nodes, as returned by ``fetch_node_properties``, to networkx.MultiDiGraph.
+
+        Parameters
+        ----------
+        d: Dict[str, Dict[str, str]]
+            A dictionary of node IRI to its properties
+
+        """
+        for node, attr_dict in d.items():
+            for key, value in attr_dict.items():
+                self.add_node_attribute(node, key=key, value=value)
 
     @staticmethod
     def _grouper(iterable: Set, n, fillvalue: str = None) -> Generator:
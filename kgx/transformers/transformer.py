@@ -4,14 +4,20 @@ from typing import Union, List, Dict, Tuple
 from networkx.readwrite import json_graph
 
 from kgx.utils.graph_utils import get_category_via_superclass
-from kgx.utils.kgx_utils import get_toolkit, get_biolink_mapping, sentencecase_to_snakecase
+from kgx.utils.kgx_utils import get_toolkit, get_biolink_mapping, sentencecase_to_snakecase, render_edge_key, EDGE_KEY_STRATEGIES
 
 from kgx.mapper import clique_merge
+from kgx.compact_graph import CompactGraph
 
 SimpleValue = Union[List[str], str]
 
 IGNORE_CLASSES = ['All', 'entity']
 
+_graph_backends = {
+    'networkx': nx.MultiDiGraph,
+    'compact': CompactGraph
+}
+
 ADDITIONAL_LABELS = {
     'phenotypic_abnormality': 'phenotypic_feature',
     'clinical_course': 'phenotypic_feature',
@@ -34,15 +40,57 @@ class Transformer(object):
 
     DEFAULT_NODE_LABEL = 'named_thing'
 
-    def __init__(self, source_graph: nx.MultiDiGraph = None):
+    def __init__(self, source_graph: nx.MultiDiGraph = None, graph_backend: str = 'networkx', edge_key_strategy: str = 'string'):
         if source_graph:
             self.graph = source_graph
         else:
-            self.graph = nx.MultiDiGraph()
+            self.graph = Transformer.create_graph(graph_backend)
 
+        self.edge_key_strategy = Transformer.check_edge_key_strategy(edge_key_strategy)
         self.filters = {}
         self.graph_metadata = {}
 
+    @staticmethod
+    def create_graph(graph_backend: str = 'networkx') -> nx.MultiDiGraph:
+        """
+        Create an empty graph for the given graph backend.
+
+        Parameters
+        ----------
+        graph_backend: str
+            The graph backend to use; either ``networkx`` (networkx.MultiDiGraph)
+            or ``compact`` (kgx.compact_graph.CompactGraph)
+
+        Returns
+        -------
+        networkx.MultiDiGraph
+            An empty graph
+
+        """
+        if graph_backend not in _graph_backends:
+            raise ValueError("Unrecognized graph backend '{}'; expected one of {}".format(graph_backend, list(_graph_backends.keys())))
+        return _graph_backends[graph_backend]()
+
+    @staticmethod
+    def check_edge_key_strategy(edge_key_strategy: str) -> str:
+        """
+        Check that the given edge key strategy is supported by ``generate_edge_key``.
+
+        Parameters
+        ----------
+        edge_key_strategy: str
+            The strategy to use for generating edge keys; one of ``string``, ``tuple`` or ``hash``
+
+        Returns
+        -------
+        str
+            The edge key strategy
+
+        """
+        if edge_key_strategy not in EDGE_KEY_STRATEGIES:
+            raise ValueError("Unrecognized edge key strategy '{}'; expected one of {}".format(edge_key_strategy, EDGE_KEY_STRATEGIES))
+        return edge_key_strategy
+
     def report(self) -> None:
         """
         Print a summary report about self.graph
@@ -272,6 +320,9 @@ class Transformer(object):
         """
         Convert networkx.MultiDiGraph as a dictionary.
 
+        Edge keys are rendered in their string form, regardless of
+        the strategy that was used for generating them.
+
         Parameters
         ----------
         g: networkx.MultiDiGraph
@@ -284,6 +335,9 @@ class Transformer(object):
 
         """
         data = json_graph.node_link_data(g)
+        for link in data['links']:
+            if 'key' in link:
+                link['key'] = render_edge_key(link['source'], link['target'], link['key'], link.get('edge_label'))
         return data
 
     @staticmethod
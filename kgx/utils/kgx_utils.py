@@ -1,12 +1,16 @@
 import stringcase
+from hashlib import blake2b
+from typing import Hashable, Dict, List, Optional
 from bmt import Toolkit
 from cachetools import LRUCache
-from prefixcommons import contract_uri
 from prefixcommons.curie_util import default_curie_maps
 
 toolkit = None
 curie_lookup_service = None
 cache = None
+prefix_trie = None
+
+EDGE_KEY_STRATEGIES = ['string', 'tuple', 'hash']
 
 
 cmaps = [
@@ -74,6 +78,133 @@ def sentencecase_to_snakecase(s: str) -> str:
     return stringcase.snakecase(s).lower()
 
 
+class PrefixTrie(object):
+    """
+    A path-compressed trie of URI prefixes, for contracting URIs to CURIEs
+    in time proportional to the length of the URI rather than the number of prefixes.
+
+    Contraction yields the same CURIE as ``prefixcommons.contract_uri``
+    followed by picking the first of the sorted CURIEs; that is,
+    the shortest CURIE, with ties broken alphabetically.
+    Recently contracted URIs are kept in a bounded LRU cache.
+
+    Parameters
+    ----------
+    prefix_maps: List[Dict]
+        A list of prefix maps, where each prefix map is a dictionary of prefix to URI prefix
+    maxsize: int
+        The max number of URIs to cache (``100000``, by default)
+
+    """
+
+    def __init__(self, prefix_maps: List[Dict] = None, maxsize: int = 100_000):
+        self.root = _PrefixTrieNode()
+        self.cache = LRUCache(maxsize)
+        for prefix_map in prefix_maps or []:
+            for prefix, uri_prefix in prefix_map.items():
+                if isinstance(uri_prefix, str):
+                    self.add(prefix, uri_prefix)
+
+    def add(self, prefix: str, uri_prefix: str) -> None:
+        """
+        Add a prefix to the trie.
+
+        Parameters
+        ----------
+        prefix: str
+            The CURIE prefix
+        uri_prefix: str
+            The URI prefix that ``prefix`` expands to
+
+        """
+        node = self.root
+        i = 0
+        while i < len(uri_prefix):
+            edge = node.children.get(uri_prefix[i])
+            if edge is None:
+                child = _PrefixTrieNode()
+                node.children[uri_prefix[i]] = (uri_prefix[i:], child)
+                node = child
+                break
+            label, child = edge
+            j = 0
+            while j < len(label) and i + j < len(uri_prefix) and label[j] == uri_prefix[i + j]:
+                j += 1
+            if j < len(label):
+                # split the edge where uri_prefix diverges from it
+                split = _PrefixTrieNode()
+                split.children[label[j]] = (label[j:], child)
+                node.children[uri_prefix[i]] = (label[:j], split)
+                child = split
+            node = child
+            i += j
+        if (prefix, uri_prefix) not in node.matches:
+            node.matches.append((prefix, uri_prefix))
+        self.cache.clear()
+
+    def contract(self, uri: str) -> Optional[str]:
+        """
+        Contract a URI to a CURIE.
+
+        Parameters
+        ----------
+        uri: str
+            A URI
+
+        Returns
+        -------
+        Optional[str]
+            The CURIE, or ``None`` if no prefix matches ``uri``
+
+        """
+        try:
+            return self.cache[uri]
+        except KeyError:
+            pass
+        curie = None
+        node = self.root
+        i = 0
+        while True:
+            for prefix, uri_prefix in node.matches:
+                # same as prefixcommons.contract_uri, which replaces every occurrence of the URI prefix
+                candidate = uri.replace(uri_prefix, prefix + ':')
+                if curie is None or len(candidate) < len(curie) or (len(candidate) == len(curie) and candidate < curie):
+                    curie = candidate
+            if i == len(uri):
+                break
+            edge = node.children.get(uri[i])
+            if edge is None or not uri.startswith(edge[0], i):
+                break
+            i += len(edge[0])
+            node = edge[1]
+        self.cache[uri] = curie
+        return curie
+
+
+class _PrefixTrieNode(object):
+    __slots__ = ('children', 'matches')
+
+    def __init__(self):
+        self.children = {}
+        self.matches = []
+
+
+def get_prefix_trie() -> PrefixTrie:
+    """
+    Get an instance of PrefixTrie, built from ``cmaps``.
+    If there no instance defined, then one is instantiated and returned.
+
+    Returns
+    -------
+    PrefixTrie
+        an instance of PrefixTrie
+
+    """
+    global prefix_trie
+    if prefix_trie is None:
+        prefix_trie = PrefixTrie(cmaps)
+    return prefix_trie
+
 def contract(uri) -> str:
     """
     Contract a URI a CURIE.
@@ -90,11 +221,7 @@ def contract(uri) -> str:
         The CURIE
 
     """
-    curies = contract_uri(str(uri), cmaps=cmaps)
-    if len(curies) > 0:
-        curies.sort()
-        return curies[0]
-    return None
+    return get_prefix_trie().contract(str(uri))
 
 def make_curie(uri) -> str:
     """
@@ -143,10 +270,18 @@ def get_toolkit() -> Toolkit:
 
     return toolkit
 
-def generate_edge_key(s: str, edge_label: str, o: str) -> str:
+def generate_edge_key(s: str, edge_label: str, o: str, strategy: str = 'string') -> Hashable:
     """
     Generates an edge key based on a given subject, edge_label and object.
 
+    The key can be generated using one of the following strategies,
+        - ``string``: a string of the form ``{subject}-{edge_label}-{object}`` (default)
+        - ``tuple``: a (subject, edge_label, object) tuple, which shares its strings with the edge
+        - ``hash``: a signed 64-bit integer derived from the ``string`` form of the key
+
+    In all cases, two edges with the same subject, edge_label and object
+    have the same key, and are thus merged into one edge.
+
     Parameters
     ----------
     s: str
@@ -155,14 +290,87 @@ def generate_edge_key(s: str, edge_label: str, o: str) -> str:
         Edge label
     o: str
         Object
+    strategy: str
+        The strategy to use for generating the key (``string``, by default)
+
+    Returns
+    -------
+    Hashable
+        Edge key
+
+    """
+    if strategy == 'string':
+        return '{}-{}-{}'.format(s, edge_label, o)
+    elif strategy == 'tuple':
+        return s, edge_label, o
+    elif strategy == 'hash':
+        digest = blake2b('{}-{}-{}'.format(s, edge_label, o).encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, byteorder='big', signed=True)
+    else:
+        raise ValueError("Unrecognized edge key strategy '{}'; expected one of {}".format(strategy, EDGE_KEY_STRATEGIES))
+
+def get_edge_key_strategy(s: str, o: str, key: Hashable, edge_label: str = None) -> str:
+    """
+    Get the strategy that a given edge key was generated with, by ``generate_edge_key``.
+
+    Keys that were not generated from the given subject, edge_label and object,
+    like the integer keys that networkx assigns to edges, are taken to be ``string`` keys.
+
+    Parameters
+    ----------
+    s: str
+        Subject
+    o: str
+        Object
+    key: Hashable
+        Edge key
+    edge_label: str
+        Edge label
 
     Returns
     -------
     str
-        Edge key as a string
+        The edge key strategy
+
+    """
+    if isinstance(key, tuple) and len(key) == 3 and key[0] == s and key[2] == o:
+        return 'tuple'
+    elif isinstance(key, int) and edge_label is not None and key == generate_edge_key(s, edge_label, o, 'hash'):
+        return 'hash'
+    return 'string'
+
+def render_edge_key(s: str, o: str, key: Hashable, edge_label: str = None) -> Hashable:
+    """
+    Render an edge key in its string form, as generated by ``generate_edge_key``
+    with the ``string`` strategy.
+
+    Keys that were not generated from the given subject, edge_label
+    and object are returned as they are.
+
+    Parameters
+    ----------
+    s: str
+        Subject
+    o: str
+        Object
+    key: Hashable
+        Edge key
+    edge_label: str
+        Edge label
+
+    Returns
+    -------
+    Hashable
+        Edge key as a string, if possible
 
     """
-    return '{}-{}-{}'.format(s, edge_label, o)
+    if isinstance(key, str):
+        return key
+    elif isinstance(key, tuple) and len(key) == 3 and key[0] == s and key[2] == o:
+        return generate_edge_key(s, key[1], o)
+    elif isinstance(key, int) and edge_label is not None and key == generate_edge_key(s, edge_label, o, 'hash'):
+        return generate_edge_key(s, edge_label, o)
+    return key
 
 def get_biolink_mapping(category):
     """
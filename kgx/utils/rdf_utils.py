@@ -1,8 +1,18 @@
+import io
+import re
+import gzip
 import logging
-from typing import List, Union
+from typing import List, Union, Tuple, Generator, Dict, Set, IO
 import rdflib
 from rdflib import Namespace, URIRef
 from rdflib.namespace import RDF, RDFS, OWL
+from rdflib.plugins.parsers.ntriples import ParseError, unquote, uriquote
+try:
+    from rdflib.plugins.parsers.ntriples import W3CNTriplesParser as NTriplesParser
+except ImportError:
+    # rdflib < 6
+    from rdflib.plugins.parsers.ntriples import NTriplesParser
+from cachetools import LRUCache
 from prefixcommons.curie_util import expand_uri
 from kgx.utils.graph_utils import get_category_via_superclass
 from kgx.utils.kgx_utils import get_toolkit, get_curie_lookup_service, make_curie
@@ -134,6 +144,8 @@ is_property_multivalued = {
     'type': False,
 }
 
+iri_mapping = None
+
 def process_iri(iri:Union[str, URIRef]) -> str:
     """
     Casts iri to a string, and then checks whether it maps to any pre-defined
@@ -151,16 +163,17 @@ def process_iri(iri:Union[str, URIRef]) -> str:
         A string corresponding to the IRI
 
     """
-    mappings = [
-        predicate_mapping,
-        category_mapping,
-        property_mapping,
-    ]
+    global iri_mapping
+    if iri_mapping is None:
+        # case-insensitive index of all mappings, where the first matching key wins
+        iri_mapping = {}
+        for mapping in [predicate_mapping, category_mapping, property_mapping]:
+            for key, value in mapping.items():
+                iri_mapping.setdefault(key.lower(), value)
 
-    for mapping in mappings:
-        for key, value in mapping.items():
-            if iri.lower() == key.lower():
-                return value
+    key = iri.lower()
+    if key in iri_mapping:
+        return iri_mapping[key]
 
     return make_curie(iri)
 
@@ -206,7 +219,7 @@ top_level_terms = {
 }
 
 
-def infer_category(iri: URIRef, rdfgraph:rdflib.Graph) -> List[str]:
+def infer_category(iri: URIRef, rdfgraph:rdflib.Graph, closure_cache: Dict[URIRef, List[URIRef]] = None) -> List[str]:
     """
     Infer category for a given iri by traversing rdfgraph.
 
@@ -216,6 +229,9 @@ def infer_category(iri: URIRef, rdfgraph:rdflib.Graph) -> List[str]:
         IRI
     rdfgraph: rdflib.Graph
         A graph to traverse
+    closure_cache: Dict[URIRef, List[URIRef]]
+        A cache of transitive closures over 'subClassOf', as populated by ``get_subclass_closure``,
+        to share between calls for the same ``rdfgraph``
 
     Returns
     -------
@@ -225,7 +241,9 @@ def infer_category(iri: URIRef, rdfgraph:rdflib.Graph) -> List[str]:
     """
     category = None
     subj = None
-    closure = list(rdfgraph.transitive_objects(iri, URIRef(RDFS.subClassOf)))
+    if closure_cache is None:
+        closure_cache = {}
+    closure = get_subclass_closure(iri, rdfgraph, closure_cache)
     category = [top_level_terms[x] for x in closure if x in top_level_terms.keys()]
     if category:
         logging.debug("Inferred category as {} based on transitive closure over 'subClassOf' relation".format(category))
@@ -241,3 +259,332 @@ def infer_category(iri: URIRef, rdfgraph:rdflib.Graph) -> List[str]:
         cls = get_curie_lookup_service()
         category = get_category_via_superclass(cls.ontology_graph, subject_curie)
     return category
+
+def get_subclass_closure(iri: URIRef, rdfgraph: rdflib.Graph, closure_cache: Dict[URIRef, List[URIRef]]) -> List[URIRef]:
+    """
+    Get the transitive closure over 'subClassOf' for a given iri, in the same order
+    as ``rdflib.Graph.transitive_objects``.
+
+    The closure of every class that is visited is added to ``closure_cache``,
+    such that the closure of each class is computed only once.
+    Classes that are part of a cycle are not cached.
+
+    Parameters
+    ----------
+    iri: rdflib.term.URIRef
+        IRI
+    rdfgraph: rdflib.Graph
+        A graph to traverse
+    closure_cache: Dict[URIRef, List[URIRef]]
+        A cache of transitive closures, by IRI
+
+    Returns
+    -------
+    List[URIRef]
+        The transitive closure, starting with ``iri`` itself
+
+    """
+    if iri in closure_cache:
+        return closure_cache[iri]
+    parents = {iri: list(rdfgraph.objects(iri, RDFS.subClassOf))}
+    closures = {}
+    cyclic = False
+    # iterative depth-first traversal, where a class is closed after all of its parents
+    stack = [[iri, 0]]
+    while stack:
+        frame = stack[-1]
+        node, i = frame
+        if i < len(parents[node]):
+            frame[1] += 1
+            parent = parents[node][i]
+            if parent in closure_cache or parent in closures:
+                continue
+            if parent in parents:
+                # parent is still open, and thus is part of a cycle
+                cyclic = True
+                continue
+            parents[parent] = list(rdfgraph.objects(parent, RDFS.subClassOf))
+            stack.append([parent, 0])
+        else:
+            stack.pop()
+            closure = [node]
+            seen = {node}
+            for parent in parents[node]:
+                for x in closure_cache[parent] if parent in closure_cache else closures.get(parent, []):
+                    if x not in seen:
+                        seen.add(x)
+                        closure.append(x)
+            closures[node] = closure
+
+    if cyclic:
+        return list(rdfgraph.transitive_objects(iri, RDFS.subClassOf))
+    closure_cache.update(closures)
+    return closures[iri]
+
+
+def guess_format(filename: str) -> str:
+    """
+    Guess the RDF format of a file from its extension,
+    ignoring a trailing ``.gz`` extension.
+
+    Parameters
+    ----------
+    filename: str
+        The name of the file
+
+    Returns
+    -------
+    str
+        The RDF format, as understood by rdflib; ``None`` if the format cannot be guessed
+
+    """
+    if filename.endswith('.gz'):
+        filename = filename[:-len('.gz')]
+    return rdflib.util.guess_format(filename)
+
+
+def read_ntriples(filename: str, input_format: str = 'nt', predicates: Set[str] = None, literals: bool = False) -> Generator[Tuple, None, None]:
+    """
+    Read triples from a N-Triples or a N-Quads file, one line at a time,
+    without loading them into a rdflib.Graph.
+
+    Files with a ``.gz`` extension are decompressed as they are read.
+    For N-Quads, the graph of each quad is ignored.
+
+    If ``predicates`` is defined, then lines whose predicate is not one of ``predicates``
+    are skipped before their terms are parsed.
+
+    Parameters
+    ----------
+    filename: str
+        The file to read from
+    input_format: str
+        The input file format; either ``nt`` or ``nquads``
+    predicates: Set[str]
+        The predicates of the triples to read (``None``, by default, reads all triples)
+    literals: bool
+        Whether to also read triples whose object is a literal, regardless of their predicate
+
+    Returns
+    -------
+    Generator[Tuple, None, None]
+        A generator of (subject, predicate, object) triples, as rdflib terms
+
+    """
+    parser = _NTriplesStreamParser(quads=input_format == 'nquads', predicates=predicates, literals=literals)
+    if filename.endswith('.gz'):
+        f = gzip.open(filename, 'rb')
+    else:
+        f = open(filename, 'rb')
+    with f:
+        yield from parser.triples(f)
+
+
+# N-Triples terminals, as in the N-Triples grammar
+_r_wspace = re.compile(r'[ \t]*')
+_r_tail = re.compile(r'[ \t]*\.[ \t]*(#.*)?')
+_r_uriref = re.compile(r'<([^:]+:[^\s"<>]*)>')
+
+
+class _NTriplesStreamParser(NTriplesParser):
+    """
+    A N-Triples parser that yields triples, rather than adding them to a sink,
+    and that also accepts N-Quads.
+
+    Since the same IRIs, like predicates, recur throughout a file,
+    recently parsed IRIs are kept in a bounded LRU cache.
+    """
+
+    def __init__(self, quads: bool = False, predicates: Set[str] = None, literals: bool = False, maxsize: int = 100_000):
+        super().__init__()
+        self.quads = quads
+        self.predicates = None if predicates is None else {str(x) for x in predicates}
+        self.literals = literals
+        self.urirefs = LRUCache(maxsize)
+
+    def skip(self) -> bool:
+        """
+        Whether the current line can be skipped without being parsed,
+        based on the predicate and the object of the triple.
+        Any line that cannot be split into terms is not skipped, and is left to the parser.
+        """
+        if self.predicates is None:
+            return False
+        terms = self.line.split(None, 2)
+        if len(terms) < 3:
+            return False
+        predicate = terms[1]
+        if not (predicate.startswith('<') and predicate.endswith('>')) or '\\' in predicate:
+            # not a plain IRI
+            return False
+        if predicate[1:-1] in self.predicates:
+            return False
+        if self.literals and terms[2].startswith('"'):
+            return False
+        return True
+
+    def uriref(self):
+        if self.peek('<'):
+            uri = self.eat(_r_uriref).group(1)
+            try:
+                return self.urirefs[uri]
+            except KeyError:
+                uriref = URIRef(uriquote(unquote(uri)))
+                self.urirefs[uri] = uriref
+                return uriref
+        return False
+
+    def triples(self, f) -> Generator[Tuple, None, None]:
+        # N-Triples 1.1 files should be utf-8 encoded; lines are read
+        # directly from the file, rather than from the buffer of NTriplesParser
+        for line in io.TextIOWrapper(f, encoding='utf-8'):
+            self.line = line.rstrip('\n')
+            if self.skip():
+                continue
+            try:
+                triple = self.parseline()
+            except ParseError:
+                raise ParseError("Invalid line: %r" % self.line)
+            if triple is not None:
+                yield triple
+
+    def parseline(self):
+        self.eat(_r_wspace)
+        if (not self.line) or self.line.startswith('#'):
+            # the line is empty or a comment
+            return None
+
+        subject = self.subject()
+        self.eat(_r_wspace)
+        predicate = self.predicate()
+        self.eat(_r_wspace)
+        object = self.object()
+        self.eat(_r_wspace)
+        if self.quads:
+            # the graph is optional
+            self.uriref() or self.nodeid()
+        self.eat(_r_tail)
+
+        if self.line:
+            raise ParseError("Trailing garbage")
+        return subject, predicate, object
+
+
+class RdfWriter(object):
+    """
+    Writes triples as N-Triples or Turtle, one subject at a time, as they are generated,
+    without building a rdflib.Graph.
+
+    Turtle output declares all ``namespaces`` as prefixes up front, and uses
+    prefixed names for IRIs in these namespaces.
+
+    Parameters
+    ----------
+    fh: IO[str]
+        The file handle to write to
+    output_format: str
+        The output format; one of ``RdfWriter.FORMATS``
+    namespaces: Dict[str, str]
+        A dictionary of prefix to namespace, used for Turtle output
+
+    """
+
+    FORMATS = ['nt', 'turtle', 'ttl']
+
+    # conservative form of a Turtle PN_LOCAL, that does not need escaping
+    _local_name = re.compile(r'[A-Za-z0-9_]([A-Za-z0-9_.-]*[A-Za-z0-9_-])?')
+
+    def __init__(self, fh: IO[str], output_format: str = 'nt', namespaces: Dict[str, str] = None):
+        if output_format not in self.FORMATS:
+            raise ValueError("Unsupported output format '{}'; expected one of {}".format(output_format, self.FORMATS))
+        self.fh = fh
+        self.turtle = output_format != 'nt'
+        self.namespaces = list((namespaces or {}).items()) if self.turtle else []
+        self.header = False
+
+    def write(self, triples: List[Tuple]) -> None:
+        """
+        Write triples, where triples with the same subject are expected to be consecutive.
+        Duplicate triples are written only once.
+
+        Parameters
+        ----------
+        triples: List[Tuple]
+            A list of (subject, predicate, object) triples, as rdflib terms
+
+        """
+        if self.turtle and not self.header:
+            for prefix, namespace in self.namespaces:
+                self.fh.write('@prefix {}: <{}> .\n'.format(prefix, namespace))
+            self.fh.write('\n')
+            self.header = True
+
+        seen = set()
+        subject = None
+        for triple in triples:
+            if triple in seen:
+                continue
+            seen.add(triple)
+            s, p, o = triple
+            if not self.turtle:
+                self.fh.write('{} {} {} .\n'.format(s.n3(), p.n3(), self.term(o)))
+            elif s == subject:
+                self.fh.write(' ;\n    {} {}'.format(self.term(p, predicate=True), self.term(o)))
+            else:
+                if subject is not None:
+                    self.fh.write(' .\n\n')
+                self.fh.write('{} {} {}'.format(self.term(s), self.term(p, predicate=True), self.term(o)))
+                subject = s
+        if subject is not None:
+            self.fh.write(' .\n\n')
+
+    def term(self, t, predicate: bool = False) -> str:
+        """
+        Get the serialized form of a rdflib term.
+
+        Parameters
+        ----------
+        t: rdflib.term.Identifier
+            A rdflib term
+        predicate: bool
+            Whether the term is in the predicate position of a triple
+
+        Returns
+        -------
+        str
+            The serialized term
+
+        """
+        if isinstance(t, rdflib.term.Literal):
+            return RdfWriter.quote_literal(t)
+        if self.turtle and isinstance(t, URIRef):
+            if predicate and t == RDF.type:
+                return 'a'
+            for prefix, namespace in self.namespaces:
+                if t.startswith(namespace) and self._local_name.fullmatch(t, len(namespace)):
+                    return '{}:{}'.format(prefix, t[len(namespace):])
+        return t.n3()
+
+    @staticmethod
+    def quote_literal(literal: rdflib.term.Literal) -> str:
+        """
+        Get the N-Triples form of a literal; unlike ``Literal.n3()``, numbers
+        and booleans are not abbreviated, and datatypes are always written in full.
+
+        Parameters
+        ----------
+        literal: rdflib.term.Literal
+            A rdflib literal
+
+        Returns
+        -------
+        str
+            The serialized literal
+
+        """
+        encoded = '"{}"'.format(literal.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"').replace('\r', '\\r'))
+        if literal.language:
+            return '{}@{}'.format(encoded, literal.language)
+        elif literal.datatype:
+            return '{}^^<{}>'.format(encoded, literal.datatype)
+        return encoded
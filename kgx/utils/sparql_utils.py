@@ -0,0 +1,175 @@
+import os
+import gzip
+import json
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import List, Dict, Optional
+
+
+class SparqlResultCache(object):
+    """
+    A persistent, on-disk cache of the results of SPARQL queries.
+
+    Results are content-addressed by the SHA-256 of the endpoint URL, the query text and the
+    format the results were read from, since bindings read from CSV results lose the types of terms,
+    and are stored as gzip'd JSON bindings, one file per query, under ``directory``.
+
+    Parameters
+    ----------
+    directory: str
+        The directory to store cached results in
+    ttl: float
+        The number of seconds for which cached results are valid (forever, by default)
+    max_size: int
+        The maximum size, in bytes, of all cached results; the least recently used
+        results are evicted when the cache grows beyond this size (unbounded, by default)
+    offline: bool
+        Whether to replay cached results only, regardless of their age, without querying the endpoint
+
+    """
+
+    suffix = '.json.gz'
+
+    def __init__(self, directory: str, ttl: float = None, max_size: int = None, offline: bool = False):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_size = max_size
+        self.offline = offline
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.size = sum(os.path.getsize(x) for x in self.get_filenames())
+
+    @staticmethod
+    def get_key(url: str, query: str, result_format: str = 'json') -> str:
+        """
+        Get the key of a query to an endpoint.
+
+        Parameters
+        ----------
+        url: str
+            The URL of the SPARQL endpoint
+        query: str
+            The query string
+        result_format: str
+            The format of the results (``json``, by default)
+
+        Returns
+        -------
+        str
+            The SHA-256 hex digest of ``url``, ``query`` and ``result_format``
+
+        """
+        return hashlib.sha256('{}\n{}\n{}'.format(url, query, result_format).encode('utf-8')).hexdigest()
+
+    def get_filename(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + self.suffix)
+
+    def get_filenames(self) -> List[str]:
+        return [
+            os.path.join(root, x)
+            for root, dirs, files in os.walk(self.directory)
+            for x in files if x.endswith(self.suffix)
+        ]
+
+    def get(self, url: str, query: str, result_format: str = 'json') -> Optional[List[Dict]]:
+        """
+        Get the cached results of a query to an endpoint.
+
+        Parameters
+        ----------
+        url: str
+            The URL of the SPARQL endpoint
+        query: str
+            The query string
+        result_format: str
+            The format of the results (``json``, by default)
+
+        Returns
+        -------
+        Optional[List[Dict]]
+            The cached bindings, or ``None`` if the query is not cached or its results have expired
+
+        """
+        filename = self.get_filename(self.get_key(url, query, result_format))
+        try:
+            modified = os.path.getmtime(filename)
+            if not self.offline and self.ttl is not None and time.time() - modified > self.ttl:
+                logging.debug("Cached results in {} have expired".format(filename))
+                return None
+            with gzip.open(filename, 'rt', encoding='utf-8') as f:
+                bindings = json.load(f)
+            # the access time orders results for eviction, while the modification time is kept for the TTL
+            os.utime(filename, (time.time(), modified))
+        except FileNotFoundError:
+            return None
+        logging.debug("Using cached results in {}".format(filename))
+        return bindings
+
+    def put(self, url: str, query: str, bindings: List[Dict], result_format: str = 'json') -> None:
+        """
+        Cache the results of a query to an endpoint, evicting the least recently used results if needed.
+
+        Parameters
+        ----------
+        url: str
+            The URL of the SPARQL endpoint
+        query: str
+            The query string
+        bindings: List[Dict]
+            The bindings returned for the query
+        result_format: str
+            The format the bindings were read from (``json``, by default)
+
+        """
+        filename = self.get_filename(self.get_key(url, query, result_format))
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        # write to a temporary file first, such that concurrent readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(filename), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as raw, gzip.open(raw, 'wt', encoding='utf-8') as f:
+            json.dump(bindings, f)
+        size = os.path.getsize(tmp)
+        with self.lock:
+            previous = os.path.getsize(filename) if os.path.exists(filename) else 0
+            os.replace(tmp, filename)
+            self.size += size - previous
+            if self.max_size is not None and self.size > self.max_size:
+                self.evict(self.max_size)
+
+    def evict(self, max_size: int) -> None:
+        """
+        Remove the least recently used results until the cache is no larger than ``max_size`` bytes.
+
+        Parameters
+        ----------
+        max_size: int
+            The size, in bytes, to shrink the cache to
+
+        """
+        entries = []
+        for filename in self.get_filenames():
+            try:
+                stat = os.stat(filename)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_atime, stat.st_size, filename))
+        entries.sort()
+        self.size = sum(x[1] for x in entries)
+        for atime, size, filename in entries:
+            if self.size <= max_size:
+                break
+            try:
+                os.remove(filename)
+            except FileNotFoundError:
+                pass
+            self.size -= size
+            logging.debug("Evicted cached results in {}".format(filename))
+
+    def clear(self) -> None:
+        """
+        Remove all cached results.
+        """
+        with self.lock:
+            self.evict(0)
@@ -13,12 +13,12 @@ REQUIRED = [
     "prefixcommons>=0.1.4",
     "pip>=9.0.1",
     "networkx>=2.2",
-    "SPARQLWrapper>=1.8.2",
+    "requests>=2.20.0",
     "pandas>=0.24.2",
     "pytest>=0.0",
     "mypy>=0.0",
     "pystache>=0.0",
-    "rdflib>=0.0",
+    "rdflib>=5.0.0",
     "Click>=7.0",
     "neo4j>=1.7.4",
     "neo4jrestclient>=0.0",
@@ -33,7 +33,9 @@ REQUIRED = [
     "cachetools>-4.0.0"
 ]
 
-EXTRAS = {}
+EXTRAS = {
+    'parquet': ['pyarrow>=3.0.0']
+}
 
 
 setup(
@@ -0,0 +1,3 @@
+#!/bin/sh
+# run from this directory, while the Neo4j database is stopped
+neo4j-admin import --database=graph.db --id-type=STRING '--array-delimiter=;' --nodes=nodes_gene_named_thing.csv --nodes=nodes_disease_named_thing.csv --relationships=relationships_contributes_to.csv --relationships=relationships_related_to.csv
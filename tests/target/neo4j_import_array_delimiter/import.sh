@@ -0,0 +1,3 @@
+#!/bin/sh
+# run from this directory, while the Neo4j database is stopped
+neo4j-admin import --database=graph.db --id-type=STRING '--array-delimiter=|' --nodes=nodes_gene_named_thing.csv
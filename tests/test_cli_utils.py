@@ -0,0 +1,22 @@
+import os
+
+from kgx.cli.utils import load_transformer
+
+cwd = os.path.abspath(os.path.dirname(__file__))
+resource_dir = os.path.join(cwd, 'resources')
+
+def test_load_transformer_workers():
+    """
+    Test that parsing files in parallel yields the same graph as parsing them sequentially
+    """
+    inputs = [
+        os.path.join(resource_dir, 'cm_nodes.csv'),
+        os.path.join(resource_dir, 'cm_edges.csv'),
+        os.path.join(resource_dir, 'semmed/semmeddb_test_nodes.csv'),
+        os.path.join(resource_dir, 'semmed/semmeddb_test_edges.csv'),
+    ]
+    t1 = load_transformer(inputs)
+    t2 = load_transformer(inputs, workers=3)
+    assert list(t1.graph.nodes(data=True)) == list(t2.graph.nodes(data=True))
+    assert list(t1.graph.edges(keys=True, data=True)) == list(t2.graph.edges(keys=True, data=True))
+    assert t1.graph_metadata == t2.graph_metadata
@@ -0,0 +1,105 @@
+import os
+
+import networkx as nx
+
+from kgx import CompactGraph, PandasTransformer, Validator
+from kgx.mapper import map_graph
+from kgx.operations.clique_merge import CliqueMerge
+from kgx.utils.kgx_utils import generate_edge_key
+
+cwd = os.path.abspath(os.path.dirname(__file__))
+resource_dir = os.path.join(cwd, 'resources')
+target_dir = os.path.join(cwd, 'target')
+
+def to_dict(g):
+    nodes = {n: dict(data) for n, data in g.nodes(data=True)}
+    edges = {(u, v, k): dict(data) for u, v, k, data in g.edges(keys=True, data=True)}
+    return nodes, edges
+
+def test_compact_graph_api():
+    """
+    Test that CompactGraph behaves like networkx.MultiDiGraph
+    """
+    graphs = [nx.MultiDiGraph(), CompactGraph()]
+    for g in graphs:
+        g.add_node('A:1', id='A:1', category=['gene'])
+        g.add_node('A:2', id='A:2', name='two')
+        g.add_edge('A:1', 'A:2', generate_edge_key('A:1', 'interacts_with', 'A:2'), subject='A:1', object='A:2', edge_label='interacts_with', provided_by=['x'])
+        g.add_edge('A:2', 'A:3', subject='A:2', object='A:3', edge_label='part_of')
+        g.add_edge('A:2', 'A:3', subject='A:2', object='A:3', edge_label='related_to')
+        g.nodes['A:1']['category'].append('named_thing')
+        g.edges['A:1', 'A:2', 'A:1-interacts_with-A:2']['provided_by'].append('y')
+        g.get_edge_data('A:2', 'A:3', 0)['edge_label'] = 'has_part'
+        nx.set_node_attributes(g, {'A:3': 'three'}, 'name')
+
+    g1, g2 = graphs
+    assert to_dict(g1) == to_dict(g2)
+    assert len(g2) == 3
+    assert g2.number_of_edges() == 3
+    assert g2.has_edge('A:1', 'A:2', key='A:1-interacts_with-A:2')
+    assert not g2.has_edge('A:1', 'A:2', key='A:1-part_of-A:2')
+    assert len(g2.edges('A:2', data=True)) == 2
+    assert len(g2.in_edges('A:2', data=True)) == 1
+
+    for g in graphs:
+        data = g.get_edge_data('A:1', 'A:2', key='A:1-interacts_with-A:2')
+        g.remove_edge('A:1', 'A:2', key='A:1-interacts_with-A:2')
+        assert data['subject'] == 'A:1'
+        g.remove_node('A:3')
+    assert to_dict(g1) == to_dict(g2)
+    assert g2.number_of_edges() == 0
+
+def test_compact_graph_transformer():
+    """
+    Test loading, validating and exporting a graph using the compact graph backend
+    """
+    graphs = []
+    for backend in ['networkx', 'compact']:
+        t = PandasTransformer(graph_backend=backend)
+        t.parse(os.path.join(resource_dir, "semmed/semmeddb_test_nodes.csv"))
+        t.parse(os.path.join(resource_dir, "semmed/semmeddb_test_edges.csv"))
+        t.save(os.path.join(target_dir, "semmeddb_test_compact_{}".format(backend)), extension='tsv', mode=None)
+        graphs.append(t.graph)
+
+    assert isinstance(graphs[1], CompactGraph)
+    assert to_dict(graphs[0]) == to_dict(graphs[1])
+    assert to_dict(graphs[1].to_networkx()) == to_dict(graphs[0])
+    assert len(Validator().validate(graphs[0])) == len(Validator().validate(graphs[1]))
+
+    for x in ['nodes', 'edges']:
+        with open(os.path.join(target_dir, "semmeddb_test_compact_networkx_{}.tsv".format(x))) as f1:
+            with open(os.path.join(target_dir, "semmeddb_test_compact_compact_{}.tsv".format(x))) as f2:
+                # edges are ordered by insertion rather than by adjacency
+                assert sorted(f1.readlines()) == sorted(f2.readlines())
+
+def test_compact_graph_clique_merge():
+    """
+    Test clique merge on the compact graph backend
+    """
+    graphs = []
+    for backend in ['networkx', 'compact']:
+        t = PandasTransformer(graph_backend=backend)
+        t.parse(os.path.join(resource_dir, 'cm_nodes.csv'))
+        t.parse(os.path.join(resource_dir, 'cm_edges.csv'))
+        cm = CliqueMerge()
+        cm.build_cliques(t.graph)
+        cm.elect_leader()
+        graphs.append(cm.consolidate_edges())
+    assert to_dict(graphs[0]) == to_dict(graphs[1])
+
+def test_compact_graph_map_graph():
+    """
+    Test remapping node identifiers on the compact graph backend
+    """
+    g = CompactGraph()
+    for i in range(10):
+        g.add_node('X:{}'.format(i), id='X:{}'.format(i))
+    for i in range(9):
+        s = 'X:{}'.format(i)
+        o = 'X:{}'.format(i + 1)
+        g.add_edge(s, o, generate_edge_key(s, 'related_to', o), subject=s, object=o, edge_label='related_to')
+    map_graph(g, {'X:{}'.format(i): 'Y:{}'.format(i) for i in range(10)})
+    assert set(g.nodes()) == {'Y:{}'.format(i) for i in range(10)}
+    assert g.nodes['Y:0']['source_curie'] == 'X:0'
+    assert g.number_of_edges() == 9
+    assert g.has_edge('Y:0', 'Y:1', key='X:0-related_to-X:1')
@@ -1,5 +1,9 @@
 import os
 
+import pytest
+import numpy as np
+import pandas as pd
+
 from kgx import PandasTransformer
 
 cwd = os.path.abspath(os.path.dirname(__file__))
@@ -75,3 +79,126 @@ def test_read_achive():
     pt3 = PandasTransformer()
     pt3.parse(tar_bz_file)
     assert not pt3.is_empty()
+
+def test_read_chunked():
+    """
+    Test that reading in chunks yields the same graph as reading an entire file,
+    for both plain files and tar archives
+    """
+    nodes_file = os.path.join(resource_dir, "semmed/semmeddb_test_nodes.csv")
+    edges_file = os.path.join(resource_dir, "semmed/semmeddb_test_edges.csv")
+    tar_gz_file = os.path.join(target_dir, "semmeddb_test_export.tar.gz")
+
+    t1 = PandasTransformer()
+    t1.parse(nodes_file)
+    t1.parse(edges_file)
+
+    t2 = PandasTransformer()
+    t2.parse(nodes_file, chunksize=7)
+    t2.parse(edges_file, chunksize=7)
+    assert t2.graph.number_of_nodes() == t1.graph.number_of_nodes()
+    assert t2.graph.number_of_edges() == t1.graph.number_of_edges()
+
+    t3 = PandasTransformer()
+    t3.parse(tar_gz_file, chunksize=7)
+    assert t3.graph.number_of_nodes() == t1.graph.number_of_nodes()
+    assert t3.graph.number_of_edges() == t1.graph.number_of_edges()
+
+    chunks = list(PandasTransformer().read(edges_file, chunksize=7))
+    assert all(len(df) <= 7 for _, df in chunks)
+
+def test_build_records():
+    """
+    Test column-wise sanitation of records in a pandas.DataFrame
+    """
+    df = pd.DataFrame.from_records([
+        {'id': 'A:1', 'name': 'a', 'category': 'gene|named_thing', 'same_as': np.nan},
+        {'id': 'A:2', 'name': np.nan, 'category': 'protein', 'same_as': 'B:2'},
+    ])
+    records = list(PandasTransformer._build_records(df))
+    assert records[0] == {'id': 'A:1', 'name': 'a', 'category': ['gene', 'named_thing']}
+    assert records[1] == {'id': 'A:2', 'category': ['protein'], 'same_as': ['B:2']}
+
+def test_save_streaming():
+    """
+    Test that writing rows in batches, with and without a tar archive,
+    preserves all nodes and edges
+    """
+    t = PandasTransformer()
+    t.parse(os.path.join(resource_dir, "semmed/semmeddb_test_nodes.csv"))
+    t.parse(os.path.join(resource_dir, "semmed/semmeddb_test_edges.csv"))
+    output = os.path.join(target_dir, "semmeddb_test_batch_export")
+
+    t.save(output, mode=None, batch_size=4)
+    t1 = PandasTransformer()
+    t1.parse("{}_nodes.csv".format(output))
+    t1.parse("{}_edges.csv".format(output))
+    assert t1.graph.number_of_nodes() == t.graph.number_of_nodes()
+    assert t1.graph.number_of_edges() == t.graph.number_of_edges()
+
+    t.save(output, extension='tsv', mode='w:gz', batch_size=4)
+    t2 = PandasTransformer()
+    t2.parse("{}.tar.gz".format(output), input_format='tsv')
+    assert t2.graph.number_of_nodes() == t.graph.number_of_nodes()
+    assert t2.graph.number_of_edges() == t.graph.number_of_edges()
+
+def test_save_neo4j_import():
+    """
+    Test writing CSVs for neo4j-admin import, split by category and edge label, with typed columns
+    """
+    t = PandasTransformer()
+    t.graph.add_node('A:1', id='A:1', name='a', category=['gene'], publications=['PMID:1', 'PMID:2'], score=1)
+    t.graph.add_node('A:2', id='A:2', name='b', category=['gene'], score=2.5)
+    t.graph.add_node('B:1', id='B:1', category=['disease'], negated=True)
+    t.graph.add_edge('A:1', 'B:1', subject='A:1', object='B:1', edge_label='contributes_to', negated=False)
+    t.graph.add_edge('A:2', 'B:1', subject='A:2', object='B:1', edge_label='related_to', provided_by='x|y')
+    output = os.path.join(target_dir, 'neo4j_import')
+    args = t.save_neo4j_import(output)
+
+    assert args[:2] == ['neo4j-admin', 'import']
+    assert '--nodes=nodes_gene_named_thing.csv' in args
+    assert '--relationships=relationships_contributes_to.csv' in args
+    assert os.path.exists(os.path.join(output, 'import.sh'))
+
+    df = pd.read_csv(os.path.join(output, 'nodes_gene_named_thing.csv'), dtype=str)
+    assert df.columns.tolist() == ['id:ID', ':LABEL', 'name:string', 'category:string[]', 'publications:string[]', 'score:double']
+    assert df['id:ID'].tolist() == ['A:1', 'A:2']
+    assert df[':LABEL'].tolist() == ['gene;named_thing', 'gene;named_thing']
+    assert df['publications:string[]'].tolist()[0] == 'PMID:1;PMID:2'
+
+    df = pd.read_csv(os.path.join(output, 'nodes_disease_named_thing.csv'), dtype=str)
+    assert df['negated:boolean'].tolist() == ['true']
+
+    df = pd.read_csv(os.path.join(output, 'relationships_related_to.csv'), dtype=str)
+    assert df.columns.tolist()[:3] == [':START_ID', ':END_ID', ':TYPE']
+    assert df[[':START_ID', ':END_ID', ':TYPE', 'provided_by:string[]']].values.tolist() == [['A:2', 'B:1', 'related_to', 'x;y']]
+
+def test_save_neo4j_import_array_delimiter():
+    """
+    Test that arrays for neo4j-admin import use a delimiter that no value of an array contains, and leave out missing elements
+    """
+    t = PandasTransformer()
+    t.graph.add_node('A:1', id='A:1', name='a; b, c | d\x1f', category=['gene'], publications=[None])
+    t.graph.add_node('A:2', id='A:2', name='e', category=['gene'])
+    output = os.path.join(target_dir, 'neo4j_import_array_delimiter')
+
+    # the delimiters in scalar values are never split on import
+    args = t.save_neo4j_import(output)
+    assert '--array-delimiter=;' in args
+    df = pd.read_csv(os.path.join(output, 'nodes_gene_named_thing.csv'), dtype=str)
+    assert df['name:string'].tolist() == ['a; b, c | d\x1f', 'e']
+    assert df['publications:string[]'].isnull().tolist() == [True, True]
+
+    t.graph.nodes['A:1']['synonym'] = ['a;b', None, 'c']
+    t.graph.nodes['A:2']['synonym'] = ['d']
+    args = t.save_neo4j_import(output)
+    assert '--array-delimiter=|' in args
+    with open(os.path.join(output, 'import.sh')) as f:
+        assert "'--array-delimiter=|'" in f.read()
+    df = pd.read_csv(os.path.join(output, 'nodes_gene_named_thing.csv'), dtype=str)
+    assert df[':LABEL'].tolist() == ['gene|named_thing', 'gene|named_thing']
+    assert df['synonym:string[]'].tolist() == ['a;b|c', 'd']
+
+    t.graph.nodes['A:2']['synonym'] = ['|,;\x1f']
+    with pytest.raises(ValueError):
+        t.save_neo4j_import(output)
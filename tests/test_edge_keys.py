@@ -0,0 +1,77 @@
+import os
+
+import pytest
+import networkx as nx
+
+from kgx import PandasTransformer, Transformer
+from kgx.operations.clique_merge import CliqueMerge
+from kgx.utils.kgx_utils import generate_edge_key, render_edge_key, get_edge_key_strategy
+
+cwd = os.path.abspath(os.path.dirname(__file__))
+resource_dir = os.path.join(cwd, 'resources')
+target_dir = os.path.join(cwd, 'target')
+
+@pytest.mark.parametrize('strategy', ['string', 'tuple', 'hash'])
+def test_generate_edge_key(strategy):
+    """
+    Test that edge keys, for all strategies, are stable and render as strings
+    """
+    key = generate_edge_key('X:1', 'related_to', 'X:2', strategy)
+    assert key == generate_edge_key('X:1', 'related_to', 'X:2', strategy)
+    assert key != generate_edge_key('X:1', 'part_of', 'X:2', strategy)
+    assert get_edge_key_strategy('X:1', 'X:2', key, 'related_to') == strategy
+    assert get_edge_key_strategy('X:1', 'X:3', key, 'related_to') == 'string'
+    assert render_edge_key('X:1', 'X:2', key, 'related_to') == 'X:1-related_to-X:2'
+
+def test_get_edge_key_strategy_networkx_keys():
+    """
+    Test that the integer keys that networkx assigns to edges are not mistaken for hashes
+    """
+    assert get_edge_key_strategy('X:1', 'X:2', 0, 'related_to') == 'string'
+    assert get_edge_key_strategy('X:1', 'X:2', 1) == 'string'
+
+    t = PandasTransformer()
+    t.parse(os.path.join(resource_dir, 'cm_nodes.csv'))
+    t.parse(os.path.join(resource_dir, 'cm_edges.csv'))
+    g = nx.MultiDiGraph()
+    g.add_nodes_from(t.graph.nodes(data=True))
+    g.add_edges_from(t.graph.edges(data=True))
+    cm = CliqueMerge()
+    cm.build_cliques(g)
+    cm.elect_leader()
+    moved = [(u, v, k, d) for u, v, k, d in cm.consolidate_edges().edges(keys=True, data=True) if '_original_subject' in d]
+    assert moved
+    for u, v, k, d in moved:
+        assert k == generate_edge_key(u, d['edge_label'], v)
+
+def test_generate_edge_key_unknown_strategy():
+    with pytest.raises(ValueError):
+        generate_edge_key('X:1', 'related_to', 'X:2', 'nosuch')
+    with pytest.raises(ValueError):
+        PandasTransformer(edge_key_strategy='nosuch')
+
+@pytest.mark.parametrize('graph_backend', ['networkx', 'compact'])
+@pytest.mark.parametrize('strategy', ['tuple', 'hash'])
+def test_edge_key_strategy(strategy, graph_backend):
+    """
+    Test that loading, dumping and clique merging a graph gives the same result for all strategies
+    """
+    graphs = {}
+    for s in ['string', strategy]:
+        t = PandasTransformer(graph_backend=graph_backend, edge_key_strategy=s)
+        t.parse(os.path.join(resource_dir, 'cm_nodes.csv'))
+        t.parse(os.path.join(resource_dir, 'cm_edges.csv'))
+        # duplicate edges are merged, regardless of the strategy
+        t.parse(os.path.join(resource_dir, 'cm_edges.csv'))
+        graphs[s] = t.graph
+
+    dumps = [Transformer.dump(g) for g in graphs.values()]
+    assert sorted(x['key'] for x in dumps[0]['links']) == sorted(x['key'] for x in dumps[1]['links'])
+
+    merged = []
+    for g in graphs.values():
+        cm = CliqueMerge()
+        cm.build_cliques(g)
+        cm.elect_leader()
+        merged.append(Transformer.dump(cm.consolidate_edges()))
+    assert sorted(x['key'] for x in merged[0]['links']) == sorted(x['key'] for x in merged[1]['links'])
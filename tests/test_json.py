@@ -1,4 +1,6 @@
+import io
 import os
+import json
 from kgx import JsonTransformer
 
 cwd = os.path.abspath(os.path.dirname(__file__))
@@ -26,3 +28,48 @@ def test_export():
     jt.parse(json_file)
     jt.save(output_file)
     assert os.path.isfile(output_file)
+
+def test_read_json_streaming():
+    """
+    Test that reading JSON incrementally, with small chunks, gives the same records as json.load
+    """
+    json_file = os.path.join(resource_dir, 'semmed/gene.json')
+    with open(json_file) as f:
+        obj = json.load(f)
+    with open(json_file) as f:
+        records = list(JsonTransformer.read_json(f, chunk_size=7))
+    assert [x for t, x in records if t == 'nodes'] == obj['nodes']
+    assert [x for t, x in records if t == 'edges'] == obj['edges']
+
+    s = '{"graph": {"nodes": [1]}, "kg": {"edges": [{"id": 1.5e3}, {}], "nodes": []}}'
+    assert list(JsonTransformer.read_json(io.StringIO(s), prefix=('kg',), chunk_size=3)) == [('edges', {'id': 1.5e3}), ('edges', {})]
+
+    # values outside of the prefix are skipped, including strings with brackets, quotes and escapes split across chunks
+    s = '{"graph": [{"a": "]}\\\\"}, "\\"[{"], "n": -1, "kg": {"name": "{\\"", "edges": [{"id": "\\\\"}]}, "x": {}}'
+    for chunk_size in range(1, len(s) + 1):
+        assert list(JsonTransformer.read_json(io.StringIO(s), prefix=('kg',), chunk_size=chunk_size)) == [('edges', {'id': '\\'})]
+
+def test_save_streaming():
+    """
+    Test that JSON and JSON Lines written incrementally can be read back
+    """
+    json_file = os.path.join(resource_dir, 'semmed/gene.json')
+    jt = JsonTransformer()
+    jt.parse(json_file)
+
+    output_file = os.path.join(target_dir, 'semmeddb_export_streaming.json')
+    jt.save(output_file)
+    with open(output_file) as f:
+        assert json.load(f) == jt.export()
+
+    output_file = os.path.join(target_dir, 'semmeddb_export_streaming.jsonl')
+    jt.save(output_file)
+    jt2 = JsonTransformer()
+    jt2.parse(output_file)
+    assert jt2.export() == jt.export()
+
+    empty = JsonTransformer()
+    output_file = os.path.join(target_dir, 'empty.json')
+    empty.save(output_file)
+    with open(output_file) as f:
+        assert json.load(f) == {'nodes': [], 'edges': []}
@@ -2,6 +2,7 @@ from kgx import PandasTransformer
 from kgx import ObanRdfTransformer
 import kgx.mapper as mapper
 import networkx as nx
+import numpy as np
 from random import random
 import logging
 
@@ -47,3 +48,70 @@ def curie(n):
     return "X:{}".format(n)
 def mapped_curie(n):
     return "Y:{}".format(n)
+
+def test_disjoint_set():
+    """
+    union elements into sets, and split sets by removing links
+    """
+    ds = mapper.DisjointSet()
+    assert list(ds.get_links()) == []
+    assert list(ds.sets()) == []
+    for u, v in [('A:1', 'A:2'), ('A:2', 'A:3'), ('A:3', 'A:1'), ('A:3', 'A:4'), ('A:4', 'A:3'), ('B:1', 'B:2')]:
+        ds.union(u, v)
+    ds.add('C:1')
+    assert len(ds) == 7
+    assert ds.count_links() == 5
+    assert sorted(sorted(x) for x in ds.sets()) == [['A:1', 'A:2', 'A:3', 'A:4'], ['B:1', 'B:2'], ['C:1']]
+
+    # the cycle keeps A:1, A:2 and A:3 together; the link between A:3 and A:4 is removed in both directions
+    ds.remove_links([('A:1', 'A:2'), ('A:4', 'A:3')])
+    assert ds.count_links() == 3
+    assert sorted(sorted(x) for x in ds.sets()) == [['A:1', 'A:2', 'A:3'], ['A:4'], ['B:1', 'B:2'], ['C:1']]
+    ds.remove_links([('A:2', 'A:3')])
+    assert sorted(sorted(x) for x in ds.sets()) == [['A:1', 'A:3'], ['A:2'], ['A:4'], ['B:1', 'B:2'], ['C:1']]
+    ds.remove_links([('A:3', 'A:1')])
+    assert sorted(sorted(x) for x in ds.sets()) == [['A:1'], ['A:2'], ['A:3'], ['A:4'], ['B:1', 'B:2'], ['C:1']]
+
+    # removing random links gives the connected components of the remaining links
+    random = np.random.RandomState(0)
+    edges = [tuple(x) for x in random.randint(0, 200, size=(300, 2)).tolist()]
+    ds = mapper.DisjointSet()
+    for u, v in edges:
+        ds.union(u, v)
+    G = nx.Graph(edges)
+    for k in range(0, 300, 50):
+        removed = edges[k:k + 50:2]
+        ds.remove_links(removed)
+        G.remove_edges_from(removed)
+        assert sorted(sorted(x) for x in ds.sets()) == sorted(sorted(x) for x in nx.connected_components(G))
+        assert ds.count_links() == G.number_of_edges()
+
+def test_clique_merge():
+    """
+    merge cliques of same_as nodes, breaking links between nodes of incompatible categories
+    """
+    G = nx.MultiDiGraph()
+    G.add_node('HGNC:1', id='HGNC:1', category=['gene'], same_as=['NCBIGene:1'])
+    G.add_node('NCBIGene:1', id='NCBIGene:1', category=['gene'])
+    G.add_node('ENSEMBL:ENSG1', id='ENSEMBL:ENSG1', category=['gene'])
+    G.add_node('MONDO:1', id='MONDO:1', category=['disease'])
+    G.add_node('HGNC:2', id='HGNC:2', category=['gene'])
+    G.add_edge('HGNC:1', 'ENSEMBL:ENSG1', edge_label='same_as')
+    G.add_edge('HGNC:1', 'MONDO:1', edge_label='same_as')
+    G.add_edge('ENSEMBL:ENSG1', 'HGNC:2', edge_label='interacts_with')
+    g = mapper.clique_merge(G)
+    # NCBIGene is the preferred prefix for genes
+    assert sorted(g.nodes()) == ['HGNC:2', 'MONDO:1', 'NCBIGene:1']
+    assert sorted(g.nodes['NCBIGene:1']['same_as']) == ['ENSEMBL:ENSG1', 'HGNC:1']
+    assert 'same_as' not in g.nodes['MONDO:1']
+    assert [(u, v) for u, v in g.edges()] == [('NCBIGene:1', 'HGNC:2')]
+
+def test_category_compatibility():
+    """
+    check the compatibility of sets of categories with bitsets
+    """
+    c = mapper.CategoryCompatibility(['gene', 'gene or gene product', 'disease', 'Node'])
+    category_sets = [(), ('gene',), ('gene or gene product',), ('disease',), ('Node',), ('gene', 'disease')]
+    u = np.array([1, 1, 1, 1, 0, 5, 3])
+    v = np.array([2, 3, 4, 1, 3, 2, 5])
+    assert c.find_incompatible(category_sets, u, v).tolist() == [False, True, False, False, False, True, True]
@@ -1,8 +1,11 @@
 import os
 
 import pytest
+from neo4j.types.graph import Graph
+from neo4j.exceptions import TransientError
 
 from kgx import NeoTransformer, PandasTransformer, JsonTransformer
+from kgx.transformers import neo_transformer
 
 from neo4jrestclient.client import GraphDatabase as http_gdb, Node, Relationship
 from neo4jrestclient.query import CypherException
@@ -115,3 +118,282 @@ def test_neo_to_graph_download():
 
         if stop_after is not None and G.number_of_edges() > stop_after:
             break
+
+
+class StandInBoltDriver(object):
+    """
+    A local stand-in for a neo4j Bolt driver, that answers queries with
+    ``responder`` and keeps track of the transactions that were committed.
+    """
+    def __init__(self, uri, auth=None, responder=None, **config):
+        self.uri = uri
+        self.auth = auth
+        self.config = config
+        self.responder = responder
+        self.sessions = 0
+        self.committed = []
+        self.rolled_back = []
+        self.closed = False
+
+    def session(self):
+        self.sessions += 1
+        return StandInSession(self)
+
+    def close(self):
+        self.closed = True
+
+
+class StandInSession(object):
+    def __init__(self, driver):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def begin_transaction(self):
+        return StandInTransaction(self.driver)
+
+
+class StandInTransaction(object):
+    def __init__(self, driver):
+        self.driver = driver
+        self.statements = []
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if not self.closed:
+            self.rollback()
+
+    def run(self, query, params=None):
+        self.statements.append((query, params))
+        records = self.driver.responder(query, params) if self.driver.responder else []
+        return StandInResult(records)
+
+    def commit(self):
+        self.closed = True
+        self.driver.committed.append(self.statements)
+
+    def rollback(self):
+        self.closed = True
+        self.driver.rolled_back.append(self.statements)
+
+
+class StandInResult(object):
+    def __init__(self, records):
+        self.records = records
+
+    def __iter__(self):
+        for record in self.records:
+            yield StandInRecord(record)
+
+    def consume(self):
+        pass
+
+
+class StandInRecord(list):
+    def values(self):
+        return list(self)
+
+
+def stand_in_bolt_driver(monkeypatch, responder=None) -> list:
+    """
+    Replace the neo4j Bolt driver with a stand-in, and return the list of stand-in drivers that are created.
+    """
+    drivers = []
+
+    class StandInGraphDatabase(object):
+        @staticmethod
+        def driver(uri, **config):
+            driver = StandInBoltDriver(uri, responder=responder, **config)
+            drivers.append(driver)
+            return driver
+
+    monkeypatch.setattr(neo_transformer, 'bolt_gdb', StandInGraphDatabase)
+    return drivers
+
+
+def test_bolt_protocol():
+    assert NeoTransformer.get_protocol('bolt://localhost:7687') == 'bolt'
+    assert NeoTransformer.get_protocol('neo4j://localhost:7687') == 'bolt'
+    assert NeoTransformer.get_protocol('http://localhost:7474') == 'http'
+
+
+def stand_in_edges(count: int = 3) -> list:
+    """
+    Make edge records, of the form (subject, edge, object), as the neo4j Bolt driver would.
+    """
+    g = Graph()
+    n1 = g.put_node(1, ['gene'], {'id': 'HGNC:11603', 'name': 'TBX4'})
+    n2 = g.put_node(2, ['disease'], {'id': 'MONDO:0005002', 'category': 'disease'})
+    n3 = g.put_node(3, ['named_thing'], {'id': 'MONDO:0000001'})
+    e1 = g.put_relationship(10, n1, n2, 'contributes_to', {'provided_by': 'stand-in'})
+    e2 = g.put_relationship(11, n2, n3, 'subclass_of', {})
+    e3 = g.put_relationship(12, n1, n3, 'related_to', {})
+    edges = [[n1, e1, n2], [n2, e2, n3], [n1, e3, n3]]
+    for i in range(3, count):
+        n = g.put_node(100 + i, ['gene'], {'id': 'HGNC:{}'.format(i)})
+        edges.append([n, g.put_relationship(10 + i * 3, n, n3, 'related_to', {}), n3])
+    return edges
+
+
+def stand_in_responder(edges: list, queries: list):
+    """
+    Answer queries for edges, as Neo4j would, keeping track of the parameters of each query for a page.
+    """
+    def respond(query, params):
+        if 'COUNT(*)' in query:
+            return [[len(edges)]]
+        if 'min(id(p))' in query:
+            ids = [x[1].id for x in edges]
+            return [[min(ids), max(ids)]]
+        assert 'SKIP $skip LIMIT $limit' in ' '.join(query.split())
+        queries.append(params)
+        page = [x for x in edges if (x[1].id, x[0].id) > (params['last'], params['last_subject'])]
+        if 'upper' in params:
+            page = [x for x in page if x[1].id <= params['upper']]
+        return page[params['skip']:params['skip'] + params['limit']]
+    return respond
+
+
+def test_bolt_load(monkeypatch):
+    """
+    load from a stand-in for neo4j over the Bolt protocol
+    """
+    queries = []
+    respond = stand_in_responder(stand_in_edges(), queries)
+    drivers = stand_in_bolt_driver(monkeypatch, respond)
+    t = NeoTransformer(uri='bolt://localhost:7687', username='neo4j', password='test', pool_size=4)
+    t.load(page_size=2)
+    t.close()
+
+    # pages start after the last edge of the previous page, rather than skipping over previous pages
+    assert queries == [
+        {'last': -1, 'last_subject': -1, 'skip': 0, 'limit': 2},
+        {'last': 11, 'last_subject': 2, 'skip': 0, 'limit': 2},
+    ]
+
+    driver = drivers[0]
+    assert driver.auth == ('neo4j', 'test')
+    assert driver.config == {'max_connection_pool_size': 4}
+    assert driver.closed
+    # reads are consumed in full, in their own transaction
+    assert len(driver.committed) + len(driver.rolled_back) == driver.sessions
+
+    assert t.graph.number_of_nodes() == 3
+    assert t.graph.number_of_edges() == 3
+    assert t.graph.nodes['HGNC:11603']['name'] == 'TBX4'
+    assert set(t.graph.nodes['MONDO:0005002']['category']) == {'disease', 'named_thing'}
+    edge = t.graph.get_edge_data('HGNC:11603', 'MONDO:0005002')
+    data = list(edge.values())[0]
+    assert data['edge_label'] == 'contributes_to'
+    assert data['provided_by'] == 'stand-in'
+
+
+def test_bolt_save(monkeypatch):
+    """
+    save to a stand-in for neo4j over the Bolt protocol
+    """
+    drivers = stand_in_bolt_driver(monkeypatch)
+    pt = PandasTransformer()
+    pt.parse(os.path.join(resource_dir, "cm_nodes.csv"))
+    pt.parse(os.path.join(resource_dir, "cm_edges.csv"))
+    t = NeoTransformer(pt.graph, uri='bolt://localhost:7687', username='neo4j', password='test')
+    t.save_with_unwind()
+
+    driver = drivers[0]
+    assert driver.config == {}
+    assert not driver.rolled_back
+    # every write is committed in its own, explicit, transaction
+    statements = [x for tx in driver.committed for x in tx]
+    assert len(statements) == len(driver.committed)
+    nodes = [node for query, params in statements if 'UNWIND $nodes' in query for node in params['nodes']]
+    edges = [edge for query, params in statements if 'UNWIND $edges' in query for edge in params['edges']]
+    assert len(nodes) == pt.graph.number_of_nodes()
+    assert len(edges) == pt.graph.number_of_edges()
+    assert any('CREATE CONSTRAINT' in query for query, params in statements)
+
+
+@pytest.mark.parametrize('end', [None, 5])
+def test_bolt_parallel_load(monkeypatch, end):
+    """
+    load from a stand-in for neo4j over the Bolt protocol, with partitions fetched concurrently
+    """
+    edges = stand_in_edges(100)
+    queries = []
+    drivers = stand_in_bolt_driver(monkeypatch, stand_in_responder(edges, queries))
+    t = NeoTransformer(uri='bolt://localhost:7687', username='neo4j', password='test')
+    t.load(end=end, page_size=3, workers=4)
+
+    assert t.graph.number_of_edges() == (end if end else len(edges))
+    if end is None:
+        # 16 partitions of edge ids from 10 to 307, each bounded by its largest edge id
+        assert {x['upper'] for x in queries} == {10 + 19 * i - 1 for i in range(1, 16)} | {307}
+        assert t.graph.number_of_nodes() == 100
+        assert all(t.graph.has_edge(s['id'], o['id']) for s, p, o in edges)
+
+
+def test_bolt_save_batches(monkeypatch):
+    """
+    save to a stand-in for neo4j over the Bolt protocol, in batches committed concurrently
+    """
+    failures = []
+
+    def respond(query, params):
+        # fail the first batch of edges once, as a deadlock would
+        if 'UNWIND $edges' in query and not failures:
+            failures.append(params)
+            raise TransientError('Deadlock detected')
+        return []
+
+    drivers = stand_in_bolt_driver(monkeypatch, respond)
+    pt = PandasTransformer()
+    pt.parse(os.path.join(resource_dir, "cm_nodes.csv"))
+    pt.parse(os.path.join(resource_dir, "cm_edges.csv"))
+    t = NeoTransformer(pt.graph, uri='bolt://localhost:7687', username='neo4j', password='test')
+    t.save_with_unwind(batch_size=2, workers=3)
+
+    driver = drivers[0]
+    assert len(driver.rolled_back) == 1
+    statements = [x for tx in driver.committed for x in tx]
+    batches = [(query, params) for query, params in statements if 'UNWIND' in query]
+    kinds = ['nodes' if 'nodes' in params else 'edges' for query, params in batches]
+    # all nodes are committed before any edge
+    assert kinds == sorted(kinds, reverse=True)
+    nodes = [node['id'] for query, params in batches if 'nodes' in params for node in params['nodes']]
+    edges = [edge for query, params in batches if 'edges' in params for edge in params['edges']]
+    assert sorted(nodes) == sorted(pt.graph.nodes())
+    assert len(edges) == pt.graph.number_of_edges()
+    for query, params in batches:
+        rows = params.get('nodes', params.get('edges'))
+        assert 0 < len(rows) <= 2
+        if 'edges' in params:
+            assert rows == sorted(rows, key=NeoTransformer.get_edge_lock_order)
+
+
+def test_bolt_save_batches_error(monkeypatch):
+    """
+    raise errors that are not transient, when saving in batches committed concurrently
+    """
+    def respond(query, params):
+        if 'UNWIND $edges' in query:
+            raise TypeError('Values of type numpy.int64 are not supported')
+        return []
+
+    drivers = stand_in_bolt_driver(monkeypatch, respond)
+    pt = PandasTransformer()
+    pt.parse(os.path.join(resource_dir, "cm_nodes.csv"))
+    pt.parse(os.path.join(resource_dir, "cm_edges.csv"))
+    t = NeoTransformer(pt.graph, uri='bolt://localhost:7687', username='neo4j', password='test')
+    with pytest.raises(TypeError):
+        t.save_with_unwind(batch_size=1, workers=2)
+
+    driver = drivers[0]
+    statements = [x for tx in driver.committed for x in tx]
+    assert not any('UNWIND $edges' in query for query, params in statements)
+    assert any('UNWIND $edges' in query for tx in driver.rolled_back for query, params in tx)
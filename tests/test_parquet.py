@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from kgx import PandasTransformer, ParquetTransformer
+
+pytest.importorskip('pyarrow')
+
+cwd = os.path.abspath(os.path.dirname(__file__))
+resource_dir = os.path.join(cwd, 'resources')
+target_dir = os.path.join(cwd, 'target')
+
+def test_parquet_roundtrip():
+    """
+    Write a graph as Parquet and read it back
+    """
+    t = PandasTransformer()
+    t.parse(os.path.join(resource_dir, "semmed/semmeddb_test_nodes.csv"))
+    t.parse(os.path.join(resource_dir, "semmed/semmeddb_test_edges.csv"))
+
+    output = os.path.join(target_dir, "semmeddb_test_parquet")
+    pt = ParquetTransformer(t.graph)
+    pt.save(output, batch_size=10)
+
+    pt2 = ParquetTransformer()
+    pt2.parse("{}_nodes.parquet".format(output))
+    pt2.parse("{}_edges.parquet".format(output))
+
+    assert pt2.graph.number_of_nodes() == t.graph.number_of_nodes()
+    assert pt2.graph.number_of_edges() == t.graph.number_of_edges()
+    for n, data in t.graph.nodes(data=True):
+        assert pt2.graph.nodes[n] == data
+    for s, o, key, data in t.graph.edges(keys=True, data=True):
+        assert pt2.graph.edges[s, o, key] == data
+
+def test_parquet_typed_columns():
+    """
+    Write numbers, booleans and lists of numbers as typed columns, and read them back with their types
+    """
+    t = PandasTransformer()
+    t.graph.add_node('A:1', id='A:1', category=['gene'], score=0.5, rank=3, counts=[1, 2], mixed=1)
+    t.graph.add_node('A:2', id='A:2', category=['gene'], score=2, rank=4, counts=[3], mixed='x')
+    t.graph.add_edge('A:1', 'A:2', subject='A:1', object='A:2', edge_label='related_to', weight=1.5, negated=False)
+    output = os.path.join(target_dir, "typed_parquet")
+    ParquetTransformer(t.graph).save(output)
+
+    pt = ParquetTransformer()
+    pt.parse("{}_nodes.parquet".format(output))
+    pt.parse("{}_edges.parquet".format(output))
+    n = pt.graph.nodes['A:1']
+    assert n['score'] == 0.5 and isinstance(n['score'], float)
+    assert n['rank'] == 3 and isinstance(n['rank'], int)
+    assert n['counts'] == [1, 2]
+    assert n['mixed'] == '1'
+    assert pt.graph.nodes['A:2']['score'] == 2.0 and isinstance(pt.graph.nodes['A:2']['score'], float)
+    e = list(pt.graph.edges(data=True))[0][-1]
+    assert e['weight'] == 1.5 and isinstance(e['weight'], float)
+    assert e['negated'] is False
+
+def test_parquet_column_projection():
+    """
+    Read a subset of columns from a Parquet file
+    """
+    t = PandasTransformer()
+    t.parse(os.path.join(resource_dir, "semmed/semmeddb_test_nodes.csv"))
+    output = os.path.join(target_dir, "semmeddb_test_parquet_projection")
+    ParquetTransformer(t.graph).save(output)
+
+    pt = ParquetTransformer()
+    pt.parse("{}_nodes.parquet".format(output), columns=['name'])
+    for n, data in pt.graph.nodes(data=True):
+        assert set(data.keys()) <= {'id', 'name', 'category'}
@@ -17,3 +17,29 @@ def test_prefixmanager():
     #assert M.contract(PUB) == 'PMID:18375391'
     #assert M.expand(M.contract(PUB)) == PUB
 
+
+
+def test_prefix_trie():
+    """
+    Test that PrefixTrie contracts URIs to the same CURIE as prefixcommons
+    """
+    from prefixcommons import contract_uri
+    from kgx.utils.kgx_utils import PrefixTrie, cmaps, make_curie
+
+    trie = PrefixTrie(cmaps, maxsize=10)
+    uri_prefixes = [v for m in cmaps for v in m.values() if isinstance(v, str)]
+    for uri_prefix in uri_prefixes:
+        for uri in [uri_prefix, uri_prefix + '0008150', uri_prefix[:-1], 'x' + uri_prefix, uri_prefix + uri_prefix]:
+            curies = sorted(contract_uri(uri, cmaps=cmaps))
+            assert trie.contract(uri) == (curies[0] if curies else None)
+
+    assert make_curie(HAS_EVIDENCE_IRI) == HAS_EVIDENCE_CURIE
+    assert make_curie('https://purl.obolibrary.org/obo/RO_0002558') == HAS_EVIDENCE_CURIE
+    assert make_curie('foo:bar/baz') == 'foo:bar/baz'
+
+    trie = PrefixTrie([{'A': 'http://x.org/a/', 'B': 'http://x.org/'}])
+    assert trie.contract('http://x.org/a/1') == 'A:1'
+    assert trie.contract('http://x.org/b/1') == 'B:b/1'
+    assert trie.contract('http://y.org/b/1') is None
+    trie.add('C', 'http://x.org/b/')
+    assert trie.contract('http://x.org/b/1') == 'C:1'
@@ -1,6 +1,8 @@
-import os
+import os, gzip
 
-from kgx import ObanRdfTransformer, RdfOwlTransformer, PandasTransformer, JsonTransformer
+import pytest
+
+from kgx import RdfTransformer, ObanRdfTransformer, RdfOwlTransformer, PandasTransformer, JsonTransformer
 from rdflib import Namespace
 from rdflib.namespace import RDF
 import rdflib
@@ -67,6 +69,155 @@ def test_owl_load():
     jt = JsonTransformer(t.graph)
     jt.save(output_json_file)
 
+def test_stream_load():
+    """
+    Stream N-Triples and gzip'd N-Quads, and compare with loading via rdflib.Graph
+    """
+    triples = [
+        '<http://purl.obolibrary.org/obo/GO_0000001> <http://www.w3.org/2000/01/rdf-schema#subClassOf> <http://purl.obolibrary.org/obo/GO_0008150>',
+        '<http://purl.obolibrary.org/obo/GO_0000002> <http://www.w3.org/2000/01/rdf-schema#subClassOf> <http://purl.obolibrary.org/obo/GO_0000001>',
+        '<http://purl.obolibrary.org/obo/GO_0000002> <http://www.w3.org/2000/01/rdf-schema#label> "child process"',
+        '<http://purl.obolibrary.org/obo/GO_0000001> <http://www.w3.org/2000/01/rdf-schema#label> "parent process"@en',
+        '<http://purl.obolibrary.org/obo/GO_0000003> <http://www.w3.org/2000/01/rdf-schema#label> "not a node"',
+    ]
+    os.makedirs(target_dir, exist_ok=True)
+    nt_file = os.path.join(target_dir, 'stream_test.nt')
+    with open(nt_file, 'w') as f:
+        f.write('# comment\n')
+        f.write(''.join('{} .\n'.format(x) for x in triples))
+    nq_file = os.path.join(target_dir, 'stream_test.nq.gz')
+    with gzip.open(nq_file, 'wt') as f:
+        f.write(''.join('{} <http://example.org/graph> .\n'.format(x) for x in triples))
+
+    t1 = RdfTransformer()
+    t1.parse(nt_file, stream=False)
+    t2 = RdfTransformer()
+    t2.parse(nt_file)
+    t3 = RdfTransformer()
+    t3.parse(nq_file, provided_by='stream_test.nt')
+
+    for t in [t2, t3]:
+        assert sorted(t.graph.nodes(data=True)) == sorted(t1.graph.nodes(data=True))
+        assert sorted(t.graph.edges(data=True)) == sorted(t1.graph.edges(data=True))
+    assert t2.graph.number_of_nodes() == 3
+    assert t2.graph.number_of_edges() == 2
+    assert t2.graph.nodes['GO:0000002']['name'] == 'child process'
+    assert t2.graph.nodes['GO:0000002']['category'] == ['biological_process']
+
+@pytest.mark.parametrize('stream', [True, False])
+def test_load_predicates(stream):
+    """
+    Load only the edges of an explicit set of predicates, along with the attributes of their nodes
+    """
+    triples = [
+        '<http://purl.obolibrary.org/obo/GO_0000001> <http://www.w3.org/2000/01/rdf-schema#subClassOf> <http://purl.obolibrary.org/obo/GO_0008150>',
+        '<http://purl.obolibrary.org/obo/GO_0000002> <http://www.w3.org/2000/01/rdf-schema#subClassOf> <http://purl.obolibrary.org/obo/GO_0000001>',
+        '<http://purl.obolibrary.org/obo/GO_0000002> <http://w3id.org/biolink/vocab/interacts_with> <http://purl.obolibrary.org/obo/GO_0000004>',
+        '<http://purl.obolibrary.org/obo/GO_0000001> <http://w3id.org/biolink/vocab/interacts_with> <http://purl.obolibrary.org/obo/GO_0008150>',
+        '<http://purl.obolibrary.org/obo/GO_0000002> <http://www.w3.org/2000/01/rdf-schema#label> "child process"',
+        '<http://purl.obolibrary.org/obo/GO_0000001> <http://purl.obolibrary.org/obo/IAO_0000115> "a parent process"',
+        '<http://purl.obolibrary.org/obo/GO_0000004> <http://www.w3.org/2000/01/rdf-schema#label> "not a node"',
+    ]
+    os.makedirs(target_dir, exist_ok=True)
+    nt_file = os.path.join(target_dir, 'predicates_test.nt')
+    with open(nt_file, 'w') as f:
+        f.write(''.join('{} .\n'.format(x) for x in triples))
+
+    t = RdfTransformer()
+    t.parse(nt_file, predicates={rdflib.URIRef('http://www.w3.org/2000/01/rdf-schema#subClassOf')}, stream=stream)
+
+    assert sorted(t.graph.edges()) == [('GO:0000001', 'GO:0008150'), ('GO:0000002', 'GO:0000001')]
+    assert {x for s, o, x in t.graph.edges(data='edge_label')} == {'subclass_of'}
+    assert 'GO:0000004' not in t.graph
+    assert t.graph.nodes['GO:0000002']['name'] == 'child process'
+    assert t.graph.nodes['GO:0000001']['description'] == 'a parent process'
+
+def test_subclass_closure():
+    """
+    Test that memoized subClassOf closures match rdflib.Graph.transitive_objects
+    """
+    from rdflib.namespace import RDFS
+    from kgx.utils.rdf_utils import get_subclass_closure
+
+    OBO = Namespace('http://purl.obolibrary.org/obo/')
+    g = rdflib.Graph()
+    # a diamond, a chain over the diamond, and a cycle
+    for child, parent in [(1, 2), (1, 3), (2, 4), (3, 4), (4, 5), (6, 1), (6, 5), (7, 8), (8, 7), (9, 7)]:
+        g.add((OBO.term('X_{}'.format(child)), RDFS.subClassOf, OBO.term('X_{}'.format(parent))))
+
+    closure_cache = {}
+    for i in [6, 1, 2, 3, 4, 5, 9, 8, 7, 10]:
+        iri = OBO.term('X_{}'.format(i))
+        expected = list(g.transitive_objects(iri, RDFS.subClassOf))
+        assert get_subclass_closure(iri, g, closure_cache) == expected
+        assert get_subclass_closure(iri, g, {}) == expected
+    assert OBO.term('X_4') in closure_cache
+    assert OBO.term('X_7') not in closure_cache
+
+def test_stream_save():
+    """
+    Save as Turtle and N-Triples, one node and edge at a time, and compare with saving via rdflib.Graph
+    """
+    from rdflib.compare import isomorphic
+
+    t = ObanRdfTransformer()
+    t.graph.add_node('HGNC:11603', id='HGNC:11603', name='TBX4', category=['gene'], description='T-box 4\n"two"')
+    t.graph.add_node('MONDO:0005002', id='MONDO:0005002', name='COPD', category=['disease'])
+    t.graph.add_edge('HGNC:11603', 'MONDO:0005002', key='k1', subject='HGNC:11603', object='MONDO:0005002', edge_label='contributes_to', relation='RO:0002326', publications=['PMID:1', 'PMID:2'])
+    t.graph.add_edge('HGNC:11603', 'MONDO:0005002', key='k2', id='http://example.org/a1', subject='HGNC:11603', object='MONDO:0005002', edge_label='related_to', relation='RO:0002200')
+
+    os.makedirs(target_dir, exist_ok=True)
+    outputs = [
+        ('stream_save_rdflib.ttl', 'turtle', False),
+        ('stream_save.ttl', 'turtle', True),
+        ('stream_save.nt', 'nt', True),
+    ]
+    graphs = []
+    for filename, output_format, stream in outputs:
+        t.save(os.path.join(target_dir, filename), output_format=output_format, stream=stream)
+        g = rdflib.Graph()
+        g.parse(os.path.join(target_dir, filename), format=output_format)
+        graphs.append(g)
+    assert len(graphs[0]) == 16
+    assert isomorphic(graphs[0], graphs[1])
+    assert isomorphic(graphs[0], graphs[2])
+
+    # association IDs are deterministic
+    with open(os.path.join(target_dir, 'stream_save.nt')) as f:
+        first = f.read()
+    t.save(os.path.join(target_dir, 'stream_save.nt'), output_format='nt')
+    with open(os.path.join(target_dir, 'stream_save.nt')) as f:
+        assert f.read() == first
+
+def test_attribute_plans():
+    """
+    Test that attribute serialization plans are shared by transformers with the same toolkit,
+    and invalidated when the toolkit or its Biolink Model version changes
+    """
+    from bmt import Toolkit
+
+    t1 = ObanRdfTransformer()
+    t2 = ObanRdfTransformer()
+    plan = t1.get_attribute_plan('publications')
+    assert plan is not None
+    assert t2.get_attribute_plan('publications') is plan
+    assert t1.get_attribute_plan('not a biolink property') is None
+    triples = t1.attribute_triples(rdflib.URIRef('http://example.org/a'), 'publications', ['PMID:1', 'PMID:2'])
+    assert [str(o) for s, p, o in triples] == ['PMID:1', 'PMID:2']
+
+    schema = t1.toolkit.generator.schema
+    version = schema.version
+    try:
+        schema.version = 'test'
+        assert t1.get_attribute_plan('publications') is not plan
+    finally:
+        schema.version = version
+
+    t3 = ObanRdfTransformer()
+    t3.toolkit = Toolkit()
+    assert t3.get_attribute_plans() is not t1.get_attribute_plans()
+    assert t3.get_attribute_plan('publications') is not t1.get_attribute_plan('publications')
+
 def test_ontology_load():
     """
     Load an ontology OWL and export as JSON
@@ -1,4 +1,4 @@
-import os
+import os, json, logging
 from kgx import RsaTransformer
 
 cwd = os.path.abspath(os.path.dirname(__file__))
@@ -15,3 +15,56 @@ def test_load():
     edge_list = list(rt.graph.edges(data=True))
     assert edge_list[0][-1]['subject'] == 'HGNC:30922'
     assert edge_list[0][-1]['object'] == 'MONDO:0000429'
+
+
+def test_load_stream():
+    """
+    Test for loading a stream of concatenated messages, and a directory of messages, into RsaTransformer
+    """
+    json_file = os.path.join(resource_dir, 'robokop.json')
+    rt = RsaTransformer()
+    rt.parse(json_file)
+
+    with open(json_file, 'r') as f:
+        message = json.load(f)
+    message['knowledge_graph']['nodes'].append({'id': 'HGNC:0', 'type': ['gene']})
+    message['knowledge_graph']['edges'].append({'id': 'x', 'source_id': 'HGNC:0', 'target_id': 'MONDO:0000429', 'relation_label': ['causes']})
+
+    stream_file = os.path.join(target_dir, 'robokop_stream.json')
+    os.makedirs(target_dir, exist_ok=True)
+    with open(stream_file, 'w') as f:
+        f.write(json.dumps(message))
+        f.write('\n')
+        f.write(json.dumps(message, indent=4))
+
+    t = RsaTransformer()
+    t.parse(stream_file)
+    assert t.graph.number_of_nodes() == rt.graph.number_of_nodes() + 1
+    assert t.graph.number_of_edges() == rt.graph.number_of_edges() + 1
+    assert t.graph.nodes['HGNC:0']['category'] == ['gene']
+    assert 'type' not in t.graph.nodes['HGNC:0']
+    assert t.graph.has_edge('HGNC:0', 'MONDO:0000429')
+
+    messages_dir = os.path.join(target_dir, 'robokop_messages')
+    os.makedirs(messages_dir, exist_ok=True)
+    for i, m in enumerate([message, {'knowledge_graph': {'nodes': [{'id': 'HGNC:1'}], 'edges': []}}]):
+        with open(os.path.join(messages_dir, 'message{}.json'.format(i)), 'w') as f:
+            json.dump(m, f)
+
+    t = RsaTransformer()
+    t.parse(messages_dir)
+    assert t.graph.number_of_nodes() == rt.graph.number_of_nodes() + 2
+    assert t.graph.number_of_edges() == rt.graph.number_of_edges() + 1
+
+def test_load_node_edge(caplog):
+    """
+    Test for loading single Reasoner Std API nodes and edges, without logging each of them
+    """
+    t = RsaTransformer()
+    with caplog.at_level(logging.INFO):
+        t.load_node({'id': 'HGNC:1', 'type': ['gene']})
+        t.load_node({'id': 'MONDO:1', 'type': ['disease']})
+        t.load_edge({'id': 'x', 'source_id': 'HGNC:1', 'target_id': 'MONDO:1', 'relation_label': ['causes']})
+    assert t.graph.nodes['HGNC:1']['category'] == ['gene']
+    assert t.graph.has_edge('HGNC:1', 'MONDO:1')
+    assert not [x for x in caplog.records if x.message.startswith('Loading')]
@@ -1,8 +1,298 @@
+import os
+import io
+import re
+import json
+import shutil
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import pytest
+
 from kgx import SparqlTransformer, GraphMLTransformer
+from kgx.transformers.sparql_transformer import RedSparqlTransformer
+from kgx.utils.sparql_utils import SparqlResultCache
+
+cwd = os.path.abspath(os.path.dirname(__file__))
+target_dir = os.path.join(cwd, 'target')
+
+GO = 'http://purl.obolibrary.org/obo/GO_'
+SUBCLASS_OF = 'http://www.w3.org/2000/01/rdf-schema#subClassOf'
+LABEL = 'http://www.w3.org/2000/01/rdf-schema#label'
+
+
+class StandInSparqlEndpoint(object):
+    """
+    A local SPARQL endpoint that serves canned results for the queries of RedSparqlTransformer,
+    with a chain of ``triples`` subClassOf triples, and a label for each node.
+    """
+
+    def __init__(self, triples: int):
+        self.triples = triples
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.queries = []
+        self.clients = set()
+        endpoint = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                length = int(self.headers['Content-Length'])
+                query = parse_qs(self.rfile.read(length).decode('utf-8'))['query'][0]
+                bindings = endpoint.respond(query, self.client_address)
+                content_type = self.headers['Accept']
+                if content_type == 'text/tab-separated-values':
+                    body = to_tsv(bindings).encode('utf-8')
+                else:
+                    content_type = 'application/sparql-results+json'
+                    body = json.dumps({'head': {'vars': []}, 'results': {'bindings': bindings}}).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = 'http://127.0.0.1:{}/sparql'.format(self.server.server_port)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def respond(self, query: str, client_address) -> list:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.queries.append(query)
+            self.clients.add(client_address)
+        try:
+            # hold each query for a while, such that concurrent queries overlap
+            threading.Event().wait(0.05)
+            if 'COUNT(*)' in query:
+                bindings = [{'triples': {'type': 'literal', 'value': str(self.triples)}}]
+            elif 'VALUES' in query:
+                bindings = [
+                    {
+                        'subject': {'type': 'uri', 'value': x},
+                        'predicate': {'type': 'uri', 'value': LABEL},
+                        'object': {'type': 'literal', 'value': 'process {}'.format(x[len(GO):])},
+                    }
+                    for x in re.findall(r'<([^>]+)>', query.split('VALUES')[1])
+                ]
+            else:
+                offset = int(re.search(r'OFFSET (\d+)', query).group(1))
+                limit = int(re.search(r'LIMIT (\d+)', query).group(1))
+                bindings = [
+                    {
+                        'subject': {'type': 'uri', 'value': '{}{:07d}'.format(GO, i + 1)},
+                        'predicate': {'type': 'uri', 'value': SUBCLASS_OF},
+                        'object': {'type': 'uri', 'value': '{}{:07d}'.format(GO, i)},
+                    }
+                    for i in range(offset, min(offset + limit, self.triples))
+                ]
+            return bindings
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def to_tsv(bindings: list) -> str:
+    """
+    Serialize bindings of IRIs and plain literals as SPARQL TSV results.
+    """
+    variables = sorted({k for b in bindings for k in b})
+    lines = ['\t'.join('?' + x for x in variables)]
+    for b in bindings:
+        terms = []
+        for x in variables:
+            if x not in b:
+                terms.append('')
+            elif b[x]['type'] == 'uri':
+                terms.append('<{}>'.format(b[x]['value']))
+            else:
+                terms.append(json.dumps(b[x]['value']))
+        lines.append('\t'.join(terms))
+    return '\n'.join(lines) + '\n'
+
 
 def test_dummy():
     pass
 
+
+@pytest.mark.parametrize('workers,result_format', [(1, 'json'), (4, 'json'), (1, 'tsv'), (4, 'tsv')])
+def test_red_sparql_load(workers, result_format):
+    """
+    load pages of triples, and the properties of their nodes, from a local SPARQL endpoint
+    """
+    with StandInSparqlEndpoint(triples=5500) as endpoint:
+        t = RedSparqlTransformer(url=endpoint.url, workers=workers, result_format=result_format)
+        t.load_networkx_graph(predicates={'http://w3id.org/biolink/vocab/GeneToDiseaseAssociation'})
+
+    assert t.graph.number_of_edges() == 5500
+    assert t.graph.number_of_nodes() == 5501
+    assert t.graph.nodes['GO:0000000']['name'] == 'process 0000000'
+    assert t.graph.nodes['GO:0005500']['name'] == 'process 0005500'
+    assert all(t.graph.has_edge('GO:{:07d}'.format(i + 1), 'GO:{:07d}'.format(i)) for i in range(5500))
+    # one count query, six pages of triples, and the properties of the nodes of each page
+    assert len(endpoint.queries) == 13
+    assert endpoint.max_active <= workers
+    if workers > 1:
+        assert endpoint.max_active > 1
+    # connections are kept alive and reused between queries
+    assert len(endpoint.clients) <= workers
+
+
+def test_red_sparql_load_limit():
+    """
+    load only the pages of triples up to a limit
+    """
+    with StandInSparqlEndpoint(triples=5500) as endpoint:
+        t = RedSparqlTransformer(url=endpoint.url, workers=2)
+        t.load_networkx_graph(predicates={'http://w3id.org/biolink/vocab/GeneToDiseaseAssociation'}, limit=2000)
+
+    assert t.graph.number_of_edges() == 2000
+    assert len([x for x in endpoint.queries if 'OFFSET' in x]) == 2
+
+
+def test_red_sparql_load_cache():
+    """
+    replay cached results of queries, online and offline
+    """
+    cache_dir = os.path.join(target_dir, 'sparql-cache')
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    predicates = {'http://w3id.org/biolink/vocab/GeneToDiseaseAssociation'}
+    with StandInSparqlEndpoint(triples=1500) as endpoint:
+        t1 = RedSparqlTransformer(url=endpoint.url, cache=SparqlResultCache(cache_dir))
+        t1.load_networkx_graph(predicates=predicates)
+        assert len(endpoint.queries) == 5
+        t2 = RedSparqlTransformer(url=endpoint.url, cache=SparqlResultCache(cache_dir))
+        t2.load_networkx_graph(predicates=predicates)
+        assert len(endpoint.queries) == 5
+        # expired results are fetched again
+        t3 = RedSparqlTransformer(url=endpoint.url, cache=SparqlResultCache(cache_dir, ttl=0))
+        t3.load_networkx_graph(predicates=predicates)
+        assert len(endpoint.queries) == 10
+        # results are cached for each result format
+        t5 = RedSparqlTransformer(url=endpoint.url, cache=SparqlResultCache(cache_dir), result_format='tsv')
+        t5.load_networkx_graph(predicates=predicates)
+        assert len(endpoint.queries) == 15
+        RedSparqlTransformer(url=endpoint.url, cache=SparqlResultCache(cache_dir), result_format='tsv').load_networkx_graph(predicates=predicates)
+        assert len(endpoint.queries) == 15
+        # the endpoint answers CSV queries with JSON results, which are not cached as CSV results
+        for i in range(2):
+            RedSparqlTransformer(url=endpoint.url, cache=SparqlResultCache(cache_dir), result_format='csv').load_networkx_graph(predicates=predicates)
+        assert len(endpoint.queries) == 25
+        url = endpoint.url
+
+    # the endpoint is gone, but cached results are replayed
+    t4 = RedSparqlTransformer(url=url, cache=SparqlResultCache(cache_dir, ttl=0, offline=True))
+    t4.load_networkx_graph(predicates=predicates)
+    for t in [t2, t3, t4, t5]:
+        assert sorted(t.graph.edges()) == sorted(t1.graph.edges())
+        assert dict(t.graph.nodes(data='name')) == dict(t1.graph.nodes(data='name'))
+
+    with pytest.raises(KeyError):
+        t4.load_networkx_graph(predicates={'http://w3id.org/biolink/vocab/ChemicalToGeneAssociation'})
+
+
+def test_sparql_result_cache_eviction():
+    """
+    evict the least recently used results when the cache grows beyond its maximum size
+    """
+    cache_dir = os.path.join(target_dir, 'sparql-cache-eviction')
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    cache = SparqlResultCache(cache_dir)
+    bindings = [{'x': {'type': 'literal', 'value': str(i)}} for i in range(100)]
+    cache.put('http://example.org/sparql', 'q1', bindings)
+    size = cache.size
+    cache = SparqlResultCache(cache_dir, max_size=int(size * 2.5))
+    assert cache.size == size
+    cache.put('http://example.org/sparql', 'q2', bindings)
+    # q2 becomes the least recently used
+    os.utime(cache.get_filename(cache.get_key('http://example.org/sparql', 'q2')), (0, 0))
+    assert cache.get('http://example.org/sparql', 'q1') == bindings
+    cache.put('http://example.org/sparql', 'q3', bindings)
+    assert cache.get('http://example.org/sparql', 'q1') == bindings
+    assert cache.get('http://example.org/sparql', 'q2') is None
+    assert cache.get('http://example.org/sparql', 'q3') == bindings
+    assert cache.get('http://example.org/other', 'q3') is None
+    assert cache.size <= size * 2.5
+    cache.clear()
+    assert cache.size == 0
+    assert cache.get_filenames() == []
+
+
+@pytest.mark.parametrize('chunk_size', [7, 1 << 16])
+def test_read_json(chunk_size):
+    """
+    read bindings from SPARQL JSON results, one at a time
+    """
+    results = {
+        'head': {'vars': ['s', 'o']},
+        'results': {
+            'bindings': [
+                {'s': {'type': 'uri', 'value': GO + '0008150'}, 'o': {'type': 'literal', 'value': 'biological_process', 'xml:lang': 'en'}},
+                {'s': {'type': 'bnode', 'value': 'b0'}},
+            ]
+        }
+    }
+    bindings = SparqlTransformer.read_json(io.StringIO(json.dumps(results)), chunk_size)
+    assert list(bindings) == results['results']['bindings']
+    assert list(SparqlTransformer.read_json(io.StringIO(''))) == []
+
+
+def test_read_tsv():
+    """
+    read bindings from SPARQL TSV results
+    """
+    tsv = '\n'.join([
+        '?s\t?o\t?n',
+        '<{}0008150>\t"biological \\"process\\"\\t\\u00e9"@en\t1'.format(GO),
+        '_:b0\t"2"^^<http://www.w3.org/2001/XMLSchema#int>\t',
+        '<{}0008152>\ttrue\t-1.5'.format(GO),
+    ]) + '\n'
+    bindings = list(SparqlTransformer.read_tsv(io.StringIO(tsv)))
+    assert bindings == [
+        {
+            's': {'type': 'uri', 'value': GO + '0008150'},
+            'o': {'type': 'literal', 'value': 'biological "process"\t\u00e9', 'xml:lang': 'en'},
+            'n': {'type': 'literal', 'value': '1', 'datatype': 'http://www.w3.org/2001/XMLSchema#integer'},
+        },
+        {
+            's': {'type': 'bnode', 'value': 'b0'},
+            'o': {'type': 'literal', 'value': '2', 'datatype': 'http://www.w3.org/2001/XMLSchema#int'},
+        },
+        {
+            's': {'type': 'uri', 'value': GO + '0008152'},
+            'o': {'type': 'literal', 'value': 'true', 'datatype': 'http://www.w3.org/2001/XMLSchema#boolean'},
+            'n': {'type': 'literal', 'value': '-1.5', 'datatype': 'http://www.w3.org/2001/XMLSchema#decimal'},
+        },
+    ]
+
+
+def test_read_csv():
+    """
+    read bindings from SPARQL CSV results
+    """
+    csv = 's,o\r\n{}0008150,"biological, process"\r\n_:b0,\r\n'.format(GO)
+    bindings = list(SparqlTransformer.read_csv(io.StringIO(csv, newline='')))
+    assert bindings == [
+        {'s': {'type': 'uri', 'value': GO + '0008150'}, 'o': {'type': 'literal', 'value': 'biological, process'}},
+        {'s': {'type': 'bnode', 'value': 'b0'}},
+    ]
+
+
 def TODO_test_load():
     """
     load tests